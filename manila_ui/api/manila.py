@@ -18,13 +18,26 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import functools
+import hashlib
+import logging
+import threading
+import uuid
+
 from django.conf import settings
+from django.core.cache import cache
 from horizon import exceptions
-import logging
+from keystoneauth1 import session as ks_session
+from keystoneauth1 import token_endpoint
 from openstack_dashboard.api import base
+from oslo_utils import timeutils
 
 from manilaclient import client as manila_client
 
+from manila_ui.api import metrics
+from manila_ui.api import parallel
+
 LOG = logging.getLogger(__name__)
 
 MANILA_UI_USER_AGENT_REPR = "manila_ui_plugin_for_horizon"
@@ -34,6 +47,12 @@ MANILA_SERVICE_TYPES = ("share", "shared-file-system", "sharev2")
 MANILA_SERVICE_PERMISSIONS = (
     tuple("openstack.services.%s" % t for t in MANILA_SERVICE_TYPES),
 )
+DEFAULT_CLIENT_CACHE_SIZE = 64
+REQUEST_CACHE_ATTR = '_manila_ui_cache'
+REQUEST_CACHE_SAVED_CALLS_ATTR = '_manila_ui_cache_saved_calls'
+METRICS_SERVICE_NAME = 'manila'
+DEFAULT_REFERENCE_DATA_CACHE_TTL = 60
+REFERENCE_DATA_CACHE_PREFIX = 'manila_ui:reference_data'
 
 
 def is_share_service_enabled(request):
@@ -70,6 +89,197 @@ MANILA_QUOTA_FIELDS_DATA_MAP = {
 }
 
 
+class _ClientPool(object):
+    """Bounded LRU pool of manila clients.
+
+    Clients are keyed by token, endpoint, API microversion and TLS settings,
+    so that every API call made with the same token reuses one client and
+    the connection pool of its keystoneauth session instead of building a
+    new client and opening a new connection.
+    """
+
+    def __init__(self):
+        self._clients = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purge_expired(self):
+        now = timeutils.utcnow()
+        expired = [key for key, (expires, c) in self._clients.items()
+                   if expires is not None and expires <= now]
+        for key in expired:
+            del self._clients[key]
+
+    def get(self, key, expires, factory, max_size):
+        if max_size <= 0:
+            return factory()
+        with self._lock:
+            self._purge_expired()
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                return self._clients[key][1]
+        # NOTE: build the client outside of the lock, it may be slow.
+        c = factory()
+        with self._lock:
+            self._clients[key] = (expires, c)
+            self._clients.move_to_end(key)
+            while len(self._clients) > max_size:
+                self._clients.popitem(last=False)
+        return c
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+_CLIENT_POOL = _ClientPool()
+
+
+def _get_client_cache_size():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return manila_config.get('client_cache_size', DEFAULT_CLIENT_CACHE_SIZE)
+
+
+def _token_expires(token):
+    expires = getattr(token, 'expires', None)
+    if expires is None:
+        return None
+    return timeutils.normalize_time(expires)
+
+
+def request_memoized(func):
+    """Memoizes results of a read-only API wrapper for one HTTP request.
+
+    Results are kept on the request object, so data like limits or share
+    types is fetched at most once while a page is rendered, even when
+    several tables, actions and forms ask for it. Calls that could not be
+    memoized, e.g. with unhashable arguments, reach the API as usual.
+    """
+    @functools.wraps(func)
+    def wrapped(request, *args, **kwargs):
+        try:
+            request_cache = request.__dict__.setdefault(REQUEST_CACHE_ATTR, {})
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except (AttributeError, TypeError):
+            return func(request, *args, **kwargs)
+        if key in request_cache:
+            request.__dict__[REQUEST_CACHE_SAVED_CALLS_ATTR] = (
+                get_saved_calls(request) + 1)
+            LOG.debug("Reusing result of '%s' for this request.",
+                      func.__name__)
+            return request_cache[key]
+        result = func(request, *args, **kwargs)
+        request_cache[key] = result
+        return result
+    return wrapped
+
+
+def get_saved_calls(request):
+    """Returns the number of API calls saved by request memoization."""
+    return getattr(request, '__dict__', {}).get(
+        REQUEST_CACHE_SAVED_CALLS_ATTR, 0)
+
+
+def _get_reference_data_cache_ttl():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return manila_config.get(
+        'reference_data_cache_ttl', DEFAULT_REFERENCE_DATA_CACHE_TTL)
+
+
+def _get_reference_data_cache_scope(request):
+    # NOTE: the share types a user can see depend on their project and on
+    # their roles, so cached lists are kept apart per project, roles,
+    # identity endpoint and region.
+    user = getattr(request, 'user', None)
+    roles = sorted(role['name'] for role in getattr(user, 'roles', None) or [])
+    scope = '%s|%s|%s|%s' % (getattr(user, 'endpoint', None),
+                             getattr(user, 'services_region', None),
+                             getattr(user, 'project_id', None),
+                             ','.join(roles))
+    return hashlib.sha256(scope.encode('utf-8')).hexdigest()
+
+
+def _get_reference_data_generation(kind):
+    # NOTE: a random generation, rather than a counter, never matches the
+    # one of entries cached before its own key was evicted from the cache.
+    key = '%s:%s:generation' % (REFERENCE_DATA_CACHE_PREFIX, kind)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_reference_data(*kinds):
+    """Drops the cached lists of the given kinds of reference data.
+
+    Lists are dropped for every project and region at once, by changing the
+    generation their cache keys are made of.
+
+    :param kinds: names of the client managers of the data, e.g.
+        'share_types'.
+    """
+    cache.set_many(
+        {'%s:%s:generation' % (REFERENCE_DATA_CACHE_PREFIX, kind):
+         uuid.uuid4().hex for kind in kinds}, None)
+
+
+def reference_cached(kind):
+    """Caches results of a list API wrapper of rarely changing data.
+
+    Lists of reference data, like share types or availability zones, are
+    fetched by most forms. They are kept in the Django cache, for the number
+    of seconds set by the 'reference_data_cache_ttl' key of the
+    OPENSTACK_MANILA_FEATURES setting, as the data of their resources, and
+    are rebuilt as resources of the '<kind>' manager of the client.
+    Wrappers changing that data invalidate it with
+    :func:`invalidates_reference_data`.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(request, *args, **kwargs):
+            ttl = _get_reference_data_cache_ttl()
+            if ttl <= 0:
+                return func(request, *args, **kwargs)
+            call = repr((func.__name__, args, sorted(kwargs.items())))
+            key = '%s:%s:%s:%s:%s' % (
+                REFERENCE_DATA_CACHE_PREFIX, kind,
+                _get_reference_data_generation(kind),
+                _get_reference_data_cache_scope(request),
+                hashlib.sha256(call.encode('utf-8')).hexdigest())
+            infos = cache.get(key)
+            if infos is not None:
+                manager = getattr(manilaclient(request), kind)
+                return [manager.resource_class(manager, info, loaded=True)
+                        for info in infos]
+            result = func(request, *args, **kwargs)
+            if isinstance(result, list):
+                infos = [getattr(resource, '_info', None)
+                         for resource in result]
+                if all(isinstance(info, dict) for info in infos):
+                    cache.set(key, infos, ttl)
+            return result
+        return wrapped
+    return decorator
+
+
+def invalidates_reference_data(*kinds):
+    """Invalidates cached reference data once the wrapper was called.
+
+    Data is invalidated even if the call failed, as the API may have
+    changed some of it anyway.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                invalidate_reference_data(*kinds)
+        return wrapped
+    return decorator
+
+
 def manilaclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
@@ -79,28 +289,132 @@ def manilaclient(request):
     except exceptions.ServiceCatalogException:
         LOG.debug('no share service configured.')
         return None
-    LOG.debug('manilaclient connection created using token "%s" and url "%s"' %
-              (request.user.token.id, manila_url))
-    c = manila_client.Client(
-        MANILA_VERSION,
-        username=request.user.username,
-        input_auth_token=request.user.token.id,
-        project_id=request.user.tenant_id,
-        service_catalog_url=manila_url,
-        insecure=insecure,
-        cacert=cacert,
-        http_log_debug=settings.DEBUG,
-        user_agent=MANILA_UI_USER_AGENT_REPR,
-    )
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = manila_url
+    token_id = request.user.token.id
+
+    def _create_client():
+        LOG.debug('manilaclient connection created using token "%s" and '
+                  'url "%s"' % (token_id, manila_url))
+        # NOTE: given a session, and no raw token, manilaclient sends calls
+        # through the session instead of the module-level requests.request,
+        # so the keep-alive connections of the session are reused by all
+        # calls made with this client.
+        session = ks_session.Session(
+            auth=token_endpoint.Token(manila_url, token_id),
+            verify=False if insecure else (cacert or True),
+            user_agent=MANILA_UI_USER_AGENT_REPR,
+        )
+        return manila_client.Client(
+            MANILA_VERSION,
+            username=request.user.username,
+            project_id=request.user.tenant_id,
+            session=session,
+            service_catalog_url=manila_url,
+            insecure=insecure,
+            cacert=cacert,
+            http_log_debug=settings.DEBUG,
+            user_agent=MANILA_UI_USER_AGENT_REPR,
+        )
+
+    key = (token_id, manila_url, MANILA_VERSION, insecure, cacert)
+    return _CLIENT_POOL.get(
+        key, _token_expires(request.user.token), _create_client,
+        _get_client_cache_size())
+
+
+def _add_paging_opts(search_opts, limit=None, offset=None):
+    """Adds 'limit' and 'offset' to search opts of paginated list APIs."""
+    if limit is None and not offset:
+        return search_opts
+    search_opts = dict(search_opts or {})
+    if limit is not None:
+        search_opts['limit'] = limit
+    if offset:
+        search_opts['offset'] = offset
+    return search_opts
+
+
+def _slice(items, limit=None, offset=None):
+    """Paginates results of list APIs that do not support 'limit'/'offset'.
+
+    Such APIs always return the whole collection, so the page is cut out
+    of it here to let views handle all lists in the same way.
+    """
+    if limit is None and not offset:
+        return items
+    offset = offset or 0
+    end = None if limit is None else offset + limit
+    return list(items)[offset:end]
 
-    return c
 
+def list_paged(list_func, request, page_size, offset=0, **kwargs):
+    """Returns one page of results of a paginated list wrapper.
 
-def share_list(request, search_opts=None):
+    :param list_func: list API wrapper accepting 'limit' and 'offset'.
+    :param page_size: maximum number of items to return.
+    :param offset: number of items to skip.
+    :returns: tuple of the items, a flag telling whether there is more data
+        after this page and a flag telling whether there is data before it.
+    """
+    offset = offset or 0
+    # NOTE: ask for one more item to know whether there is a next page.
+    items = list(list_func(
+        request, limit=page_size + 1, offset=offset, **kwargs))
+    has_more_data = len(items) > page_size
+    return items[:page_size], has_more_data, offset > 0
+
+
+def iter_pages(list_func, request, page_size, **kwargs):
+    """Yields the pages of results of a paginated list wrapper.
+
+    :param list_func: list API wrapper accepting 'limit' and 'offset'.
+    :param page_size: number of items to ask for per page.
+    :param kwargs: other keyword arguments of the wrapper, which should
+        include a stable sort, e.g. sort_key='id', so that resources created
+        or deleted meanwhile do not shift the pages.
+    """
+    offset = 0
+    while True:
+        # NOTE: the API may return fewer items than the limit, e.g. when it
+        # exceeds its 'osapi_max_limit', so pages are fetched until one is
+        # empty.
+        items = list(list_func(request, limit=page_size, offset=offset,
+                               **kwargs))
+        if not items:
+            return
+        yield items
+        offset += len(items)
+
+
+def _index_references(list_func, request, field, ids, search_opts=None,
+                      **kwargs):
+    """Returns the subset of IDs referenced by at least one listed resource.
+
+    Each ID is looked up with a listing filtered by 'field' and limited to
+    one item, concurrently on the bounded pool of call_parallel(). The IDs
+    are those of one page of a table, so that the number of lookups is
+    bounded by the page size rather than by the number of resources.
+
+    :param list_func: list API wrapper accepting 'search_opts' and 'limit'.
+    :param field: name of the search option and attribute holding the ID.
+    :param kwargs: extra arguments of the filtered lookups.
+    """
+    ids = sorted(set(ids))
+    if not ids:
+        return set()
+    lookups = parallel.call_parallel(*[
+        (list_func, [request],
+         dict(kwargs, limit=1,
+              search_opts=dict(search_opts or {}, **{field: id_})))
+        for id_ in ids])
+    return {id_ for id_, lookup in zip(ids, lookups) if lookup.result()}
+
+
+def share_list(request, search_opts=None, sort_key=None, sort_dir=None,
+               limit=None, offset=None):
     search_opts = search_opts or {}
-    return manilaclient(request).shares.list(search_opts=search_opts)
+    search_opts = _add_paging_opts(search_opts, limit, offset)
+    return manilaclient(request).shares.list(
+        search_opts=search_opts, sort_key=sort_key, sort_dir=sort_dir)
 
 
 def share_get(request, share_id):
@@ -262,17 +576,33 @@ def share_snapshot_update(request, snapshot_id, name, description):
 
 
 def share_snapshot_list(request, detailed=True, search_opts=None,
-                        sort_key=None, sort_dir=None):
+                        sort_key=None, sort_dir=None, limit=None, offset=None):
     # Example of 'search_opts' value:
     # {'share_id': 'id_of_existing_share'}
     return manilaclient(request).share_snapshots.list(
         detailed=detailed,
-        search_opts=search_opts,
+        search_opts=_add_paging_opts(search_opts, limit, offset),
         sort_key=sort_key,
         sort_dir=sort_dir,
     )
 
 
+def share_snapshot_index(request, share_ids, search_opts=None):
+    """Returns the set of IDs of the given shares that have snapshots.
+
+    Instead of listing every snapshot in detail, the snapshots of each share
+    are looked up concurrently with a non-detailed listing limited to one
+    item, so that the cost depends on the number of shown shares only.
+
+    :param share_ids: IDs of the shares to look up.
+    :param search_opts: extra search options, e.g. {'all_tenants': True}.
+    :returns: set of share IDs supporting fast membership tests.
+    """
+    return _index_references(
+        share_snapshot_list, request, 'share_id', share_ids,
+        search_opts=search_opts, detailed=False)
+
+
 def share_snapshot_create(request, share_id, name=None,
                           description=None, force=False, metadata=None):
     return manilaclient(request).share_snapshots.create(
@@ -310,8 +640,17 @@ def share_snap_instance_export_location_list(request, snapshot_instance):
         snapshot_instance=snapshot_instance)
 
 
-def share_server_list(request, search_opts=None):
-    return manilaclient(request).share_servers.list(search_opts=search_opts)
+def share_server_list(request, search_opts=None, limit=None, offset=None):
+    return _slice(
+        manilaclient(request).share_servers.list(search_opts=search_opts),
+        limit, offset)
+
+
+def share_server_index(request, share_server_ids):
+    """Returns the set of IDs of the given share servers that have shares."""
+    return _index_references(
+        share_list, request, 'share_server_id', share_server_ids,
+        search_opts={'all_tenants': True})
 
 
 def share_server_get(request, share_serv_id):
@@ -322,9 +661,11 @@ def share_server_delete(request, share_serv_id):
     return manilaclient(request).share_servers.delete(share_serv_id)
 
 
-def share_network_list(request, detailed=False, search_opts=None):
-    return manilaclient(request).share_networks.list(detailed=detailed,
-                                                     search_opts=search_opts)
+def share_network_list(request, detailed=False, search_opts=None,
+                       limit=None, offset=None):
+    return manilaclient(request).share_networks.list(
+        detailed=detailed,
+        search_opts=_add_paging_opts(search_opts, limit, offset))
 
 
 def share_network_create(request, **kwargs):
@@ -370,10 +711,11 @@ def share_network_subnet_create(request, share_network_id=None,
         availability_zone=availability_zone, metadata=metadata)
 
 
-def security_service_list(request, search_opts=None):
+def security_service_list(request, search_opts=None, limit=None,
+                          offset=None):
     return manilaclient(request).security_services.list(
         detailed=True,
-        search_opts=search_opts)
+        search_opts=_add_paging_opts(search_opts, limit, offset))
 
 
 def security_service_get(request, sec_service_id, search_opts=None):
@@ -460,14 +802,20 @@ def default_quota_update(request, **kwargs):
     manilaclient(request).quota_classes.update(DEFAULT_QUOTA_NAME, **kwargs)
 
 
-def share_type_list(request):
-    return manilaclient(request).share_types.list()
+@request_memoized
+@reference_cached('share_types')
+@metrics.timed(METRICS_SERVICE_NAME)
+def share_type_list(request, search_opts=None, limit=None, offset=None):
+    return _slice(
+        manilaclient(request).share_types.list(search_opts=search_opts),
+        limit, offset)
 
 
 def share_type_get(request, share_type_id):
     return manilaclient(request).share_types.get(share_type_id)
 
 
+@invalidates_reference_data('share_types')
 def share_type_create(request, name, spec_driver_handles_share_servers,
                       description=None, is_public=True):
     return manilaclient(request).share_types.create(
@@ -477,6 +825,7 @@ def share_type_create(request, name, spec_driver_handles_share_servers,
         is_public=is_public)
 
 
+@invalidates_reference_data('share_types')
 def share_type_update(request, share_type_id, name=None, description=None,
                       is_public=None):
     share_type_data = {
@@ -488,6 +837,7 @@ def share_type_update(request, share_type_id, name=None, description=None,
         share_type_id).update(**share_type_data)
 
 
+@invalidates_reference_data('share_types')
 def share_type_delete(request, share_type_id):
     return manilaclient(request).share_types.delete(share_type_id)
 
@@ -496,11 +846,13 @@ def share_type_get_extra_specs(request, share_type_id):
     return manilaclient(request).share_types.get(share_type_id).get_keys()
 
 
+@invalidates_reference_data('share_types')
 def share_type_set_extra_specs(request, share_type_id, extra_specs):
     return manilaclient(request).share_types.get(
         share_type_id).set_keys(extra_specs)
 
 
+@invalidates_reference_data('share_types')
 def share_type_unset_extra_specs(request, share_type_id, keys):
     return manilaclient(request).share_types.get(
         share_type_id).unset_keys(keys)
@@ -510,11 +862,13 @@ def share_type_access_list(request, share_type_id):
     return manilaclient(request).share_type_access.list(share_type_id)
 
 
+@invalidates_reference_data('share_types')
 def share_type_access_add(request, share_type_id, project_id):
     return manilaclient(request).share_type_access.add_project_access(
         share_type_id, project_id)
 
 
+@invalidates_reference_data('share_types')
 def share_type_access_remove(request, share_type_id, project_id):
     return manilaclient(request).share_type_access.remove_project_access(
         share_type_id, project_id)
@@ -556,6 +910,8 @@ def share_replica_resync(request, replica):
     return manilaclient(request).share_replicas.resync(replica)
 
 
+@request_memoized
+@metrics.timed(METRICS_SERVICE_NAME)
 def tenant_absolute_limits(request):
     limits = manilaclient(request).limits.get().absolute
     limits_dict = {}
@@ -568,18 +924,24 @@ def tenant_absolute_limits(request):
     return limits_dict
 
 
-def share_instance_list(request):
-    return manilaclient(request).share_instances.list()
+def share_instance_list(request, limit=None, offset=None):
+    return _slice(manilaclient(request).share_instances.list(), limit, offset)
 
 
 def share_instance_get(request, share_instance_id):
     return manilaclient(request).share_instances.get(share_instance_id)
 
 
+@request_memoized
+@reference_cached('availability_zones')
+@metrics.timed(METRICS_SERVICE_NAME)
 def availability_zone_list(request):
     return manilaclient(request).availability_zones.list()
 
 
+@request_memoized
+@reference_cached('pools')
+@metrics.timed(METRICS_SERVICE_NAME)
 def pool_list(request, detailed=False):
     return manilaclient(request).pools.list(detailed=detailed)
 
@@ -624,10 +986,10 @@ def share_group_reset_state(request, share_group, state):
 
 
 def share_group_list(request, detailed=True, search_opts=None, sort_key=None,
-                     sort_dir=None):
+                     sort_dir=None, limit=None, offset=None):
     return manilaclient(request).share_groups.list(
         detailed=detailed,
-        search_opts=search_opts,
+        search_opts=_add_paging_opts(search_opts, limit, offset),
         sort_key=sort_key,
         sort_dir=sort_dir,
     )
@@ -668,10 +1030,11 @@ def share_group_snapshot_reset_state(request, share_group_snapshot, state):
 
 
 def share_group_snapshot_list(request, detailed=True, search_opts=None,
-                              sort_key=None, sort_dir=None):
+                              sort_key=None, sort_dir=None, limit=None,
+                              offset=None):
     return manilaclient(request).share_group_snapshots.list(
         detailed=detailed,
-        search_opts=search_opts,
+        search_opts=_add_paging_opts(search_opts, limit, offset),
         sort_key=sort_key,
         sort_dir=sort_dir,
     )
@@ -679,6 +1042,7 @@ def share_group_snapshot_list(request, detailed=True, search_opts=None,
 
 # ####### Share Group Types # ########
 
+@invalidates_reference_data('share_group_types')
 def share_group_type_create(request, name, share_types, is_public=False,
                             group_specs=None):
     return manilaclient(request).share_group_types.create(
@@ -690,10 +1054,16 @@ def share_group_type_get(request, share_group_type):
     return manilaclient(request).share_group_types.get(share_group_type)
 
 
-def share_group_type_list(request, show_all=True):
-    return manilaclient(request).share_group_types.list(show_all=show_all)
+@request_memoized
+@reference_cached('share_group_types')
+@metrics.timed(METRICS_SERVICE_NAME)
+def share_group_type_list(request, show_all=True, limit=None, offset=None):
+    return _slice(
+        manilaclient(request).share_group_types.list(show_all=show_all),
+        limit, offset)
 
 
+@invalidates_reference_data('share_group_types')
 def share_group_type_delete(request, share_group_type):
     return manilaclient(request).share_group_types.delete(share_group_type)
 
@@ -702,21 +1072,25 @@ def share_group_type_access_list(request, share_group_type):
     return manilaclient(request).share_group_type_access.list(share_group_type)
 
 
+@invalidates_reference_data('share_group_types')
 def share_group_type_access_add(request, share_group_type, project):
     return manilaclient(request).share_group_type_access.add_project_access(
         share_group_type, project)
 
 
+@invalidates_reference_data('share_group_types')
 def share_group_type_access_remove(request, share_group_type, project):
     return manilaclient(request).share_group_type_access.remove_project_access(
         share_group_type, project)
 
 
+@invalidates_reference_data('share_group_types')
 def share_group_type_set_specs(request, share_group_type, group_specs):
     return manilaclient(request).share_group_types.get(
         share_group_type).set_keys(group_specs)
 
 
+@invalidates_reference_data('share_group_types')
 def share_group_type_unset_specs(request, share_group_type, keys):
     return manilaclient(request).share_group_types.get(
         share_group_type).unset_keys(keys)
@@ -732,7 +1106,9 @@ def messages_get(request, message_id):
     return manilaclient(request).messages.get(message_id)
 
 
-def messages_list(request, search_opts=None, sort_key=None, sort_dir=None):
+def messages_list(request, search_opts=None, sort_key=None, sort_dir=None,
+                  limit=None, offset=None):
+    search_opts = _add_paging_opts(search_opts, limit, offset)
     return manilaclient(request).messages.list(search_opts=search_opts,
                                                sort_key=sort_key,
                                                sort_dir=sort_dir)
@@ -786,9 +1162,9 @@ def export_location_delete_metadata(request, share, el_id, keys):
     )
 
 
-def resource_lock_list(request, search_opts=None):
+def resource_lock_list(request, search_opts=None, limit=None, offset=None):
     return manilaclient(request).resource_locks.list(
-        search_opts=search_opts)
+        search_opts=_add_paging_opts(search_opts, limit, offset))
 
 
 def resource_lock_get(request, lock_id):
@@ -804,3 +1180,8 @@ def resource_lock_update(request, lock_id, lock_reason):
 
 def resource_lock_delete(request, lock_id):
     return manilaclient(request).resource_locks.delete(lock_id)
+
+
+# NOTE: time every API wrapper of this module, the memoized ones are timed
+# where they are defined to not count the calls the memoization saves.
+metrics.instrument(globals(), METRICS_SERVICE_NAME, 'manilaclient')
@@ -0,0 +1,211 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Metrics of the API calls made by manila UI.
+
+Every API wrapper of :mod:`manila_ui.api.manila`, as well as the Neutron and
+Keystone calls made by manila UI, is timed. Calls are recorded on the request
+they are made for, to be reported by
+:class:`manila_ui.middleware.APIMetricsMiddleware`, and in histograms per
+function that every process keeps for its whole life.
+"""
+
+import bisect
+import collections
+import functools
+import inspect
+import threading
+import time
+
+REQUEST_CALLS_ATTR = '_manila_ui_api_calls'
+# Upper bounds of the histogram buckets, in seconds.
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                     5.0, 10.0)
+
+APICall = collections.namedtuple(
+    'APICall', ['service', 'function', 'duration'])
+
+
+class _Histograms(object):
+    """Durations of API calls per function and their totals per view."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # (service, function) -> [bucket counts..., +Inf count, sum]
+            self._functions = {}
+            # (view, service) -> [count, sum]
+            self._views = {}
+
+    def observe(self, view, service, function, duration):
+        bucket = bisect.bisect_left(HISTOGRAM_BUCKETS, duration)
+        with self._lock:
+            histogram = self._functions.setdefault(
+                (service, function), [0] * (len(HISTOGRAM_BUCKETS) + 2))
+            histogram[bucket] += 1
+            histogram[-1] += duration
+            totals = self._views.setdefault((view, service), [0, 0])
+            totals[0] += 1
+            totals[1] += duration
+
+    def render(self):
+        """Returns the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            functions = sorted(
+                (key, list(value)) for key, value in self._functions.items())
+            views = sorted(
+                (key, list(value)) for key, value in self._views.items())
+        lines = [
+            '# HELP manila_ui_api_call_duration_seconds Duration of API '
+            'calls made by manila UI.',
+            '# TYPE manila_ui_api_call_duration_seconds histogram',
+        ]
+        for (service, function), histogram in functions:
+            labels = 'service="%s",function="%s"' % (
+                _escape(service), _escape(function))
+            count = 0
+            bounds = [repr(b) for b in HISTOGRAM_BUCKETS] + ['+Inf']
+            for bound, bucket_count in zip(bounds, histogram):
+                count += bucket_count
+                lines.append(
+                    'manila_ui_api_call_duration_seconds_bucket{%s,le="%s"} '
+                    '%d' % (labels, bound, count))
+            lines.append('manila_ui_api_call_duration_seconds_sum{%s} %r' % (
+                labels, histogram[-1]))
+            lines.append(
+                'manila_ui_api_call_duration_seconds_count{%s} %d' % (
+                    labels, count))
+        lines.extend([
+            '# HELP manila_ui_view_api_calls_total API calls made by manila '
+            'UI per view.',
+            '# TYPE manila_ui_view_api_calls_total counter',
+        ])
+        for (view, service), (count, duration) in views:
+            lines.append(
+                'manila_ui_view_api_calls_total{view="%s",service="%s"} %d' % (
+                    _escape(view), _escape(service), count))
+        lines.extend([
+            '# HELP manila_ui_view_api_call_seconds_total Time spent in API '
+            'calls made by manila UI per view.',
+            '# TYPE manila_ui_view_api_call_seconds_total counter',
+        ])
+        for (view, service), (count, duration) in views:
+            lines.append(
+                'manila_ui_view_api_call_seconds_total{view="%s",'
+                'service="%s"} %r' % (_escape(view), _escape(service),
+                                      duration))
+        return '\n'.join(lines) + '\n'
+
+
+HISTOGRAMS = _Histograms()
+
+
+def _escape(label_value):
+    return label_value.replace('\\', '\\\\').replace(
+        '"', '\\"').replace('\n', '\\n')
+
+
+def get_view_name(request):
+    """Returns the name of the Django view serving the request, if any."""
+    view_name = getattr(
+        getattr(request, 'resolver_match', None), 'view_name', None)
+    return view_name if isinstance(view_name, str) else ''
+
+
+def record(request, service, function, duration):
+    HISTOGRAMS.observe(get_view_name(request), service, function, duration)
+    try:
+        calls = request.__dict__.setdefault(REQUEST_CALLS_ATTR, [])
+    except AttributeError:
+        return
+    calls.append(APICall(service, function, duration))
+
+
+def get_calls(request):
+    """Returns the API calls made so far for the given request."""
+    return list(getattr(request, '__dict__', {}).get(REQUEST_CALLS_ATTR, []))
+
+
+def timed(service, name=None):
+    """Records the duration of every call of an API wrapper.
+
+    The wrapper must take the request as its first argument, the call is
+    attributed to the view serving it.
+    """
+    def decorator(func):
+        function = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapped(request, *args, **kwargs):
+            start = time.monotonic()
+            try:
+                return func(request, *args, **kwargs)
+            finally:
+                record(request, service, function, time.monotonic() - start)
+        wrapped.metrics_service = service
+        return wrapped
+    return decorator
+
+
+def calls_client(func, client_factory):
+    """Tells whether a function calls the API client factory itself.
+
+    Decorators are looked through, while functions only calling the factory
+    from nested functions, e.g. decorators, or through other wrappers, e.g.
+    helpers combining several calls, do not call it themselves.
+    """
+    code = inspect.unwrap(func).__code__
+    return client_factory in code.co_names
+
+
+def instrument(namespace, service, client_factory):
+    """Times the API wrappers defined in a module.
+
+    API wrappers are the public functions of the module calling its API
+    client factory themselves, so that helpers, e.g. decorators or cache
+    invalidation functions, are never recorded as API calls. Wrappers
+    already timed, e.g. because they are memoized and must only be timed
+    when they really call the API, are left as they are.
+
+    :param namespace: the ``globals()`` of the module.
+    :param client_factory: name of the function of the module returning
+        the API client, e.g. 'manilaclient'.
+    """
+    module_name = namespace['__name__']
+    for name, obj in list(namespace.items()):
+        if (inspect.isfunction(obj) and obj.__module__ == module_name and
+                not name.startswith('_') and
+                not hasattr(obj, 'metrics_service') and
+                calls_client(obj, client_factory)):
+            namespace[name] = timed(service)(obj)
+
+
+class InstrumentedAPI(object):
+    """Proxy of an API module of Horizon timing calls of its functions.
+
+    Functions are looked up on every access, so that they can be mocked on
+    the proxied module.
+    """
+
+    def __init__(self, module, service):
+        self._module = module
+        self._service = service
+
+    def __getattr__(self, name):
+        attr = getattr(self._module, name)
+        if not callable(attr) or inspect.isclass(attr):
+            return attr
+        return timed(self._service, name)(attr)
@@ -0,0 +1,67 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Helpers for calling independent API wrappers concurrently.
+
+Views often join several lists that do not depend on each other, e.g. shares,
+snapshots and share networks. Calling them one after another makes page
+latency the sum of all calls, while calling them in parallel makes it the
+latency of the slowest one.
+"""
+
+from concurrent import futures
+import contextvars
+
+from django.conf import settings
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def _get_max_workers():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return manila_config.get('api_max_workers', DEFAULT_MAX_WORKERS)
+
+
+def call_parallel(*worker_defs):
+    """Call specified functions concurrently on a bounded thread pool.
+
+    :param worker_defs: each positional argument is either a callable or
+        a tuple of a callable, a list of positional arguments and,
+        optionally, a dict of keyword arguments. For example::
+
+            shares, snapshots = call_parallel(
+                (manila.share_list, [request]),
+                (manila.share_snapshot_list, [request], {'detailed': True}))
+
+    :returns: a list of :class:`concurrent.futures.Future` objects in the
+        same order as ``worker_defs``. All of them are already done, calling
+        ``result()`` returns the value of the call or re-raises its
+        exception, so that every call keeps its own error handling.
+    """
+    results = [None] * len(worker_defs)
+    if not worker_defs:
+        return results
+    max_workers = max(1, min(len(worker_defs), _get_max_workers()))
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for index, func_def in enumerate(worker_defs):
+            if callable(func_def):
+                func_def = (func_def,)
+            func = func_def[0]
+            args = func_def[1] if len(func_def) > 1 else ()
+            kwargs = func_def[2] if len(func_def) > 2 else {}
+            # NOTE: run every call in a copy of the caller's context, so that
+            # context variables (e.g. request-scoped data) stay visible.
+            context = contextvars.copy_context()
+            results[index] = executor.submit(
+                context.run, func, *args, **kwargs)
+    return results
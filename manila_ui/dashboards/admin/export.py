@@ -0,0 +1,220 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Streaming exports of the inventories of admin panels.
+
+Exports walk the list API of a panel page by page and write every page as
+soon as it was fetched, so that their memory use does not depend on the
+number of exported resources. Project names are looked up once per page.
+Exports failing once they were started end with an error marker and are
+aborted, so that they are never taken for complete ones.
+"""
+
+import csv
+import itertools
+import json
+import logging
+
+from django.conf import settings
+from django import http
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+from django.views import generic
+from horizon import exceptions
+from horizon import tables
+from oslo_utils import timeutils
+
+from manila_ui.api import manila
+from manila_ui.dashboards.admin import utils
+
+LOG = logging.getLogger(__name__)
+
+EXPORT_PAGE_SIZE = 1000
+# Stable order of paged exports, so that resources created or deleted
+# meanwhile do not shift the pages.
+EXPORT_SORT = {'sort_key': 'id', 'sort_dir': 'asc'}
+EXPORT_ERROR_MARKER = "ERROR: the export failed; the data is incomplete."
+# Default of the 'osapi_max_limit' option of manila, capping its listings.
+DEFAULT_API_MAX_LIMIT = 1000
+# Leading characters making spreadsheets evaluate a CSV cell as a formula.
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class TruncatedListError(Exception):
+    """A listing of the API may have been truncated."""
+
+
+def _get_api_max_limit():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return manila_config.get('api_max_limit', DEFAULT_API_MAX_LIMIT)
+
+
+def _escape_csv_cell(value):
+    """Returns a CSV cell that spreadsheets do not evaluate as a formula.
+
+    Names and descriptions are set by the users of every project, so text
+    starting like a formula is prefixed with a quote to be kept as text.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _Echo(object):
+    """File-like object returning what is written to it, for csv writers."""
+
+    def write(self, value):
+        return value
+
+
+def iter_pages(list_func, request, page_size, paged=True, **kwargs):
+    """Yields the pages of results of a list API wrapper.
+
+    :param list_func: list API wrapper accepting 'limit', 'offset',
+        'sort_key' and 'sort_dir'.
+    :param paged: False if the API returns the whole collection anyway, in
+        which case it is listed once. TruncatedListError is raised once the
+        listing was yielded if it holds as many items as the API returns at
+        most.
+    :param kwargs: other keyword arguments of the wrapper.
+    """
+    if not paged:
+        items = list(list_func(request, **kwargs))
+        yield items
+        # NOTE: listings the API does not paginate may still be capped at
+        # its 'osapi_max_limit', in which case exactly that many items are
+        # returned, and the export cannot be told apart from a complete one.
+        max_limit = _get_api_max_limit()
+        if max_limit and len(items) == max_limit:
+            raise TruncatedListError(
+                "The listing returned %s items and may have been truncated."
+                % max_limit)
+        return
+    for items in manila.iter_pages(list_func, request, page_size,
+                                   **dict(EXPORT_SORT, **kwargs)):
+        yield items
+
+
+class ExportAction(tables.LinkAction):
+    """Table action downloading the CSV export of the panel."""
+    name = "export"
+    verbose_name = _("Export CSV")
+    icon = "download"
+
+    def get_link_url(self, datum=None):
+        return "%s?format=csv" % reverse(self.url)
+
+
+class ExportView(generic.View):
+    """Streams the resources of a list API as CSV or NDJSON.
+
+    The format is chosen with the 'format' query parameter, CSV by default.
+    The 'project_name' field is looked up from the 'project_id' of the
+    resources.
+    """
+    # Name of the list API wrapper of manila_ui.api.manila.
+    list_func_name = None
+    list_kwargs = {}
+    # False if the list API does not support 'limit' and 'offset'.
+    paged = True
+    # Exported attributes, in the order of the CSV columns.
+    fields = ()
+    filename = None
+    redirect_url = None
+    page_size = EXPORT_PAGE_SIZE
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get('format', 'csv')
+        if export_format not in CONTENT_TYPES:
+            return http.HttpResponseBadRequest()
+        pages = iter_pages(getattr(manila, self.list_func_name), request,
+                           self.page_size, paged=self.paged,
+                           **self.list_kwargs)
+        # NOTE: the first page is fetched before the response is started,
+        # so that failing to list anything is reported as usual.
+        try:
+            first_page = next(pages, [])
+        except Exception:
+            exceptions.handle(request, _("Unable to export the list."),
+                              redirect=reverse(self.redirect_url))
+        rows = self.iter_rows(request, itertools.chain([first_page], pages))
+        if export_format == 'csv':
+            content = self.render_csv(rows)
+        else:
+            content = self.render_ndjson(rows)
+        response = http.StreamingHttpResponse(
+            self.abort_on_error(content, export_format),
+            content_type=CONTENT_TYPES[export_format])
+        response['Content-Disposition'] = (
+            'attachment; filename="%s-%s.%s"' % (
+                self.filename, timeutils.utcnow().strftime('%Y%m%d%H%M%S'),
+                export_format))
+        return response
+
+    def get_project_names(self, request, resources):
+        if 'project_name' not in self.fields:
+            return {}
+        try:
+            return utils.get_project_names(
+                request, [getattr(r, 'project_id', None) for r in resources])
+        except Exception:
+            LOG.debug("Unable to retrieve project names.", exc_info=True)
+            return {}
+
+    def iter_rows(self, request, pages):
+        """Yields the exported fields of every resource as a dict."""
+        for page in pages:
+            project_names = self.get_project_names(request, page)
+            for resource in page:
+                row = dict((field, getattr(resource, field, None))
+                           for field in self.fields)
+                if 'project_name' in row:
+                    row['project_name'] = project_names.get(
+                        getattr(resource, 'project_id', None))
+                yield row
+
+    def abort_on_error(self, content, export_format):
+        """Ends the content with an error marker if it fails, and aborts it.
+
+        The response was started already, so the error cannot be reported
+        otherwise. The marker tells an incomplete export apart in case the
+        client keeps it, and raising the error again aborts the response so
+        that the download fails.
+        """
+        try:
+            for chunk in content:
+                yield chunk
+        except Exception:
+            LOG.exception("Export of '%s' failed.", self.filename)
+            if export_format == 'csv':
+                yield csv.writer(_Echo()).writerow([EXPORT_ERROR_MARKER])
+            else:
+                yield json.dumps({'error': EXPORT_ERROR_MARKER}) + '\n'
+            raise
+
+    def render_csv(self, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(self.fields)
+        for row in rows:
+            yield writer.writerow(
+                [_escape_csv_cell(row[field]) for field in self.fields])
+
+    def render_ndjson(self, rows):
+        for row in rows:
+            yield json.dumps(row, default=str) + '\n'
@@ -15,6 +15,7 @@ from django.utils.translation import ngettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 
 
 class DeleteSecurityService(tables.DeleteAction):
@@ -40,7 +41,7 @@ class DeleteSecurityService(tables.DeleteAction):
         manila.security_service_delete(request, obj_id)
 
 
-class SecurityServicesTable(tables.DataTable):
+class SecurityServicesTable(pagination.PagedTableMixin, tables.DataTable):
     name = tables.WrappingColumn(
         "name", verbose_name=_("Name"),
         link="horizon:admin:security_services:security_service_detail")
@@ -26,10 +26,12 @@ from manila_ui.api import manila
 import manila_ui.dashboards.admin.security_services.tables as ss_tables
 import manila_ui.dashboards.admin.security_services.tabs as ss_tabs
 from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards import pagination
 import manila_ui.dashboards.project.security_services.views as ss_views
 
 
-class SecurityServicesView(tables.MultiTableView):
+class SecurityServicesView(pagination.PagedViewMixin,
+                           tables.MultiTableView):
     table_classes = (
         ss_tables.SecurityServicesTable,
     )
@@ -39,9 +41,11 @@ class SecurityServicesView(tables.MultiTableView):
     @memoized.memoized_method
     def get_security_services_data(self):
         try:
-            security_services = manila.security_service_list(
-                self.request, search_opts={'all_tenants': True})
-            utils.set_project_name_to_objects(self.request, security_services)
+            security_services = self.paginate(
+                manila.security_service_list,
+                search_opts={'all_tenants': True})
+            utils.set_project_name_to_objects(
+                self.request, security_services)
         except Exception:
             security_services = []
             exceptions.handle(
@@ -18,6 +18,8 @@ from django.utils.translation import ngettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
+from manila_ui.dashboards import utils
 
 
 class CreateShareGroupType(tables.LinkAction):
@@ -80,9 +82,10 @@ class UpdateShareGroupType(tables.LinkAction):
         return {"project_id": project_id}
 
 
-class ShareGroupTypesTable(tables.DataTable):
+class ShareGroupTypesTable(pagination.PagedTableMixin, tables.DataTable):
     name = tables.WrappingColumn("name", verbose_name=_("Name"))
-    group_specs = tables.Column("group_specs", verbose_name=_("Group specs"))
+    group_specs = tables.Column("group_specs", verbose_name=_("Group specs"),
+                                filters=(utils.specs_to_str,))
     share_types = tables.Column("share_types", verbose_name=_("Share types"))
     visibility = tables.Column(
         "is_public", verbose_name=_("Visibility"),
@@ -27,13 +27,14 @@ from horizon.utils import memoized
 from horizon import workflows
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
 from manila_ui.dashboards.admin.share_group_types import forms as sgt_forms
 from manila_ui.dashboards.admin.share_group_types import tables as sgt_tables
 import manila_ui.dashboards.admin.share_group_types.workflows as sgt_workflows
-from manila_ui.dashboards import utils as common_utils
+from manila_ui.dashboards import pagination
 
 
-class ShareGroupTypesView(tables.MultiTableView):
+class ShareGroupTypesView(pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         sgt_tables.ShareGroupTypesTable,
     )
@@ -42,20 +43,21 @@ class ShareGroupTypesView(tables.MultiTableView):
 
     @memoized.memoized_method
     def get_share_group_types_data(self):
+        share_group_types, share_types = parallel.call_parallel(
+            (self.paginate, [manila.share_group_type_list]),
+            (manila.share_type_list, [self.request]),
+        )
         try:
-            share_group_types = manila.share_group_type_list(self.request)
+            share_group_types = share_group_types.result()
         except Exception:
             exceptions.handle(
                 self.request, _('Unable to retrieve share group types.'))
             return []
 
-        share_types = manila.share_type_list(self.request)
         st_mapping = {}
-        for st in share_types:
+        for st in share_types.result():
             st_mapping[st.id] = st.name
         for sgt in share_group_types:
-            sgt.group_specs = common_utils.metadata_to_str(
-                sgt.group_specs, 8, 45)
             sgt.share_types = ", ".join(
                 [st_mapping[st] for st in sgt.share_types])
         return share_group_types
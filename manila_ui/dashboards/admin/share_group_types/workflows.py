@@ -17,8 +17,8 @@ from django.utils.translation import gettext_lazy as _
 from horizon import exceptions
 from horizon import forms
 from horizon import workflows
-from openstack_dashboard.api import keystone
 
+from manila_ui.api import keystone
 from manila_ui.api import manila
 
 
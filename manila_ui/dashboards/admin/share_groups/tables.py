@@ -19,6 +19,7 @@ from django.utils.translation import ngettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 
 
 class DeleteShareGroup(tables.DeleteAction):
@@ -53,7 +54,7 @@ class ResetShareGroupStatus(tables.LinkAction):
         return True
 
 
-class ShareGroupsTable(tables.DataTable):
+class ShareGroupsTable(pagination.PagedTableMixin, tables.DataTable):
     def get_share_network_link(share_group):
         if getattr(share_group, 'share_network_id', None):
             return reverse("horizon:admin:share_networks:share_network_detail",
@@ -105,6 +106,8 @@ class ShareGroupsTable(tables.DataTable):
         "share_server_id",
         verbose_name=_("Share Server"),
         link=get_share_server_link)
+    sort_keys = {'name': 'name', 'host': 'host', 'status': 'status',
+                 'availability_zone': 'availability_zone'}
 
     def get_object_display(self, share_group):
         return str(share_group.id)
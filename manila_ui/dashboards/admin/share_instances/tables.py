@@ -14,8 +14,15 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from horizon import tables
 
+from manila_ui.dashboards.admin import export
+from manila_ui.dashboards import pagination
 
-class ShareInstancesTable(tables.DataTable):
+
+class ExportShareInstances(export.ExportAction):
+    url = "horizon:admin:share_instances:export"
+
+
+class ShareInstancesTable(pagination.PagedTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("available", True),
         ("creating", None),
@@ -48,7 +55,9 @@ class ShareInstancesTable(tables.DataTable):
         verbose_name = _("Share Instances")
         status_columns = ("status", )
         table_actions = (
-            tables.NameFilterAction,)
+            tables.NameFilterAction,
+            ExportShareInstances,
+        )
         multi_select = False
 
     def get_share_network_link(share_instance):
@@ -20,6 +20,10 @@ urlpatterns = [
         r'^$',
         views.ShareInstancesView.as_view(),
         name='index'),
+    re_path(
+        r'^export/$',
+        views.ExportShareInstancesView.as_view(),
+        name='export'),
     re_path(
         r'^(?P<share_instance_id>[^/]+)$',
         views.ShareInstanceDetailView.as_view(),
@@ -24,12 +24,14 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards.admin import export
 from manila_ui.dashboards.admin.share_instances import tables as si_tables
 from manila_ui.dashboards.admin.share_instances import tabs as si_tabs
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards import utils as ui_utils
 
 
-class ShareInstancesView(tables.MultiTableView):
+class ShareInstancesView(pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         si_tables.ShareInstancesTable,
     )
@@ -39,7 +41,7 @@ class ShareInstancesView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_instances_data(self):
         try:
-            share_instances = manila.share_instance_list(self.request)
+            share_instances = self.paginate(manila.share_instance_list)
         except Exception:
             share_instances = []
             exceptions.handle(
@@ -85,3 +87,15 @@ class ShareInstanceDetailView(tabs.TabView):
         share_instance = self.get_data()
         return self.tab_group_class(
             request, share_instance=share_instance, **kwargs)
+
+
+class ExportShareInstancesView(export.ExportView):
+    list_func_name = 'share_instance_list'
+    paged = False
+    fields = (
+        'id', 'share_id', 'status', 'host', 'availability_zone',
+        'share_network_id', 'share_server_id', 'replica_state',
+        'created_at',
+    )
+    filename = 'share-instances'
+    redirect_url = 'horizon:admin:share_instances:index'
@@ -13,18 +13,21 @@
 from django.utils.translation import gettext_lazy as _
 from horizon import tables
 
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 import manila_ui.dashboards.project.share_networks.tables as sn_tables
 
 
-class ShareNetworksFilterAction(tables.FilterAction):
-    filter_type = "server"
+class ShareNetworksFilterAction(filtering.ServerFilterAction):
+    api_params = {'description': 'description~'}
     filter_choices = (
         ('name', _("Name") + " ", True),
-        ('description', _("Description") + " ", True),
+        ('name~', _("Name contains") + " ", True),
+        ('description', _("Description contains") + " ", True),
     )
 
 
-class ShareNetworksTable(tables.DataTable):
+class ShareNetworksTable(pagination.PagedTableMixin, tables.DataTable):
     name = tables.WrappingColumn(
         "name", verbose_name=_("Name"),
         link="horizon:admin:share_networks:share_network_detail")
@@ -15,6 +15,8 @@
 from django.utils.translation import gettext_lazy as _
 from horizon import tabs
 
+from manila_ui.dashboards import data_context
+
 
 class ShareNetworkOverviewTab(tabs.Tab):
     name = _("Share Network Overview")
@@ -22,10 +24,10 @@ class ShareNetworkOverviewTab(tabs.Tab):
     template_name = "admin/share_networks/_detail.html"
 
     def get_context_data(self, request):
-        return {"share_network": self.tab_group.kwargs["share_network"]}
+        return {"share_network": self.tab_group.data_context["share_network"]}
 
 
-class ShareNetworkDetailTabs(tabs.TabGroup):
+class ShareNetworkDetailTabs(data_context.DataContextMixin, tabs.TabGroup):
     slug = "share_network_details"
     tabs = (
         ShareNetworkOverviewTab,
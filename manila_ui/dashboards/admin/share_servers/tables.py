@@ -18,9 +18,15 @@ from django.utils.translation import pgettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards.admin import export
+from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards import batch
+from manila_ui.dashboards import pagination
+from manila_ui.dashboards import polling
 
 
-class DeleteShareServer(tables.DeleteAction):
+class DeleteShareServer(batch.ParallelBatchActionMixin,
+                        tables.DeleteAction):
     policy_rules = (("share", "share_server:delete"),)
 
     @staticmethod
@@ -44,24 +50,41 @@ class DeleteShareServer(tables.DeleteAction):
 
     def allowed(self, request, share_serv):
         if share_serv:
-            share_search_opts = {'share_server_id': share_serv.id}
-            shares_list = manila.share_list(
-                request, search_opts=share_search_opts)
-            if shares_list:
+            # NOTE: 'has_shares' is set for the whole table at once by the
+            # view, so that there is no API call per row here.
+            if getattr(share_serv, 'has_shares', True):
                 return False
             return share_serv.status not in ("deleting", "creating")
         return True
 
 
-class UpdateShareServerRow(tables.Row):
+class UpdateShareServerRow(polling.BulkUpdateRowMixin, tables.Row):
     ajax = True
 
     def get_data(self, request, share_serv_id):
         share_serv = manila.share_server_get(request, share_serv_id)
+        share_serv.has_shares = bool(
+            manila.share_server_index(request, [share_serv_id]))
         return share_serv
 
+    def get_bulk_data(self, request, share_serv_ids):
+        share_servs, deleted_ids = polling.get_by_ids(
+            manila.share_server_get, request, share_serv_ids)
+        share_serv_ids_with_shares = manila.share_server_index(
+            request, [share_serv.id for share_serv in share_servs])
+        for share_serv in share_servs:
+            share_serv.has_shares = (
+                share_serv.id in share_serv_ids_with_shares)
+        utils.set_project_name_to_objects(request, share_servs)
+        return share_servs, deleted_ids
 
-class ShareServersTable(tables.DataTable):
+
+class ExportShareServers(export.ExportAction):
+    url = "horizon:admin:share_servers:export"
+
+
+class ShareServersTable(pagination.PagedTableMixin,
+                        polling.BulkUpdateTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("active", True),
         ("deleting", None),
@@ -109,6 +132,7 @@ class ShareServersTable(tables.DataTable):
         verbose_name = _("Share Server")
         table_actions = (
             tables.NameFilterAction,
+            ExportShareServers,
             DeleteShareServer,
         )
         row_class = UpdateShareServerRow
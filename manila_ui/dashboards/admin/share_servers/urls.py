@@ -20,6 +20,10 @@ urlpatterns = [
         r'^$',
         views.ShareServersView.as_view(),
         name='index'),
+    re_path(
+        r'^export/$',
+        views.ExportShareServersView.as_view(),
+        name='export'),
     re_path(
         r'^(?P<share_server_id>[^/]+)$',
         views.ShareServerDetailView.as_view(),
@@ -25,12 +25,14 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards.admin import export
 from manila_ui.dashboards.admin.share_servers import tables as ss_tables
 from manila_ui.dashboards.admin.share_servers import tabs as ss_tabs
 from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards import pagination
 
 
-class ShareServersView(tables.MultiTableView):
+class ShareServersView(pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         ss_tables.ShareServersTable,
     )
@@ -40,11 +42,23 @@ class ShareServersView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_servers_data(self):
         try:
-            share_servers = manila.share_server_list(self.request)
+            share_servers = self.paginate(manila.share_server_list)
         except Exception:
             share_servers = []
             exceptions.handle(
                 self.request, _("Unable to retrieve share servers"))
+        try:
+            share_server_ids_with_shares = manila.share_server_index(
+                self.request, [server.id for server in share_servers])
+            for share_server in share_servers:
+                share_server.has_shares = (
+                    share_server.id in share_server_ids_with_shares)
+        except Exception:
+            # NOTE: 'has_shares' is left unset, share servers are then not
+            # offered for deletion, but still listed.
+            exceptions.handle(
+                self.request,
+                _("Unable to retrieve the shares of share servers"))
         utils.set_project_name_to_objects(self.request, share_servers)
         return share_servers
 
@@ -89,3 +103,15 @@ class ShareServerDetailView(tabs.TabView):
         share_server = self.get_data()
         return self.tab_group_class(
             request, share_server=share_server, **kwargs)
+
+
+class ExportShareServersView(export.ExportView):
+    list_func_name = 'share_server_list'
+    paged = False
+    fields = (
+        'id', 'host', 'project_id', 'project_name', 'status',
+        'share_network_id', 'share_network_subnet_id', 'created_at',
+        'updated_at',
+    )
+    filename = 'share-servers'
+    redirect_url = 'horizon:admin:share_servers:index'
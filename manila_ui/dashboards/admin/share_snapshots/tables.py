@@ -16,10 +16,14 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 from django.utils.translation import pgettext_lazy
-from horizon import exceptions
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards.admin import export
+from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards import batch
+from manila_ui.dashboards import pagination
+from manila_ui.dashboards import polling
 import manila_ui.dashboards.project.share_snapshots.tables as ss_tables
 from manila_ui.dashboards.project.shares import tables as shares_tables
 
@@ -33,7 +37,10 @@ class ShareSnapshotShareNameColumn(tables.Column):
         return reverse(self.link, args=(snapshot.share_id,))
 
 
-class DeleteShareSnapshot(tables.DeleteAction):
+class DeleteShareSnapshot(batch.ParallelBatchActionMixin,
+                          tables.DeleteAction):
+    failure_message = _('Unable to delete snapshot "%s". One or more shares '
+                        'depend on it.')
 
     @staticmethod
     def action_present(count):
@@ -58,15 +65,7 @@ class DeleteShareSnapshot(tables.DeleteAction):
         return {"project_id": project_id}
 
     def delete(self, request, obj_id):
-        obj = self.table.get_object_by_id(obj_id)
-        name = self.table.get_object_display(obj)
-        try:
-            manila.share_snapshot_delete(request, obj_id)
-        except Exception:
-            msg = _('Unable to delete snapshot "%s". One or more shares '
-                    'depend on it.')
-            exceptions.handle(self.request, msg % name)
-            raise
+        manila.share_snapshot_delete(request, obj_id)
 
     def allowed(self, request, snapshot=None):
         if snapshot:
@@ -74,7 +73,21 @@ class DeleteShareSnapshot(tables.DeleteAction):
         return True
 
 
-class ShareSnapshotsTable(tables.DataTable):
+class UpdateShareSnapshotRow(ss_tables.UpdateShareSnapshotRow):
+
+    def get_bulk_data(self, request, snapshot_ids):
+        snapshots, deleted_ids = super(
+            UpdateShareSnapshotRow, self).get_bulk_data(request, snapshot_ids)
+        utils.set_project_name_to_objects(request, snapshots)
+        return snapshots, deleted_ids
+
+
+class ExportShareSnapshots(export.ExportAction):
+    url = "horizon:admin:share_snapshots:export"
+
+
+class ShareSnapshotsTable(pagination.PagedTableMixin,
+                          polling.BulkUpdateTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("in-use", True),
         ("available", True),
@@ -110,6 +123,7 @@ class ShareSnapshotsTable(tables.DataTable):
         "share",
         verbose_name=_("Source"),
         link="horizon:admin:shares:detail")
+    sort_keys = {'name': 'name', 'size': 'size', 'status': 'status'}
 
     def get_object_display(self, obj):
         return obj.name
@@ -118,9 +132,10 @@ class ShareSnapshotsTable(tables.DataTable):
         name = "share_snapshots"
         verbose_name = _("Share Snapshots")
         status_columns = ["status"]
-        row_class = ss_tables.UpdateShareSnapshotRow
+        row_class = UpdateShareSnapshotRow
         table_actions = (
-            tables.NameFilterAction,
+            ss_tables.ShareSnapshotsFilterAction,
+            ExportShareSnapshots,
             DeleteShareSnapshot,
         )
         row_actions = (
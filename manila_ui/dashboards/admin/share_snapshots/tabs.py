@@ -15,6 +15,8 @@
 from django.utils.translation import gettext_lazy as _
 from horizon import tabs
 
+from manila_ui.dashboards import data_context
+
 
 class ShareSnapshotOverviewTab(tabs.Tab):
     name = _("Share Snapshot Overview")
@@ -22,10 +24,10 @@ class ShareSnapshotOverviewTab(tabs.Tab):
     template_name = "admin/share_snapshots/_detail.html"
 
     def get_context_data(self, request):
-        return {"snapshot": self.tab_group.kwargs["snapshot"]}
+        return {"snapshot": self.tab_group.data_context["snapshot"]}
 
 
-class SnapshotDetailTabs(tabs.TabGroup):
+class SnapshotDetailTabs(data_context.DataContextMixin, tabs.TabGroup):
     slug = "share_snapshot_details"
     tabs = (
         ShareSnapshotOverviewTab,
@@ -20,6 +20,10 @@ urlpatterns = [
         r'^$',
         views.ShareSnapshotsView.as_view(),
         name='index'),
+    re_path(
+        r'^export/$',
+        views.ExportShareSnapshotsView.as_view(),
+        name='export'),
     re_path(
         r'^(?P<snapshot_id>[^/]+)$',
         views.ShareSnapshotDetailView.as_view(),
@@ -23,13 +23,18 @@ from horizon import tables
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards.admin import export
 from manila_ui.dashboards.admin.share_snapshots import tables as ss_tables
 from manila_ui.dashboards.admin.share_snapshots import tabs as ss_tabs
 from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 import manila_ui.dashboards.project.share_snapshots.views as snapshot_views
+from manila_ui.dashboards import utils as ui_utils
 
 
-class ShareSnapshotsView(tables.MultiTableView):
+class ShareSnapshotsView(filtering.ServerFilterViewMixin,
+                         pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         ss_tables.ShareSnapshotsTable,
     )
@@ -40,13 +45,14 @@ class ShareSnapshotsView(tables.MultiTableView):
     def get_share_snapshots_data(self):
         snapshots = []
         try:
-            snapshots = manila.share_snapshot_list(
-                self.request, search_opts={'all_tenants': True})
-            shares = manila.share_list(self.request)
-            share_names = dict([(share.id, share.name or share.id)
-                                for share in shares])
+            snapshots = self.paginate(
+                manila.share_snapshot_list, filter_table='share_snapshots',
+                search_opts={'all_tenants': True})
+            shares = ui_utils.get_shares(
+                self.request, [snapshot.share_id for snapshot in snapshots])
             for snapshot in snapshots:
-                snapshot.share = share_names.get(snapshot.share_id)
+                share = shares.get(snapshot.share_id)
+                snapshot.share = share and (share.name or share.id)
         except Exception:
             msg = _("Unable to retrieve share snapshots list.")
             exceptions.handle(self.request, msg)
@@ -61,3 +67,14 @@ class ShareSnapshotDetailView(snapshot_views.ShareSnapshotDetailView):
     tab_group_class = ss_tabs.SnapshotDetailTabs
     template_name = "admin/share_snapshots/detail.html"
     redirect_url = reverse_lazy("horizon:admin:share_snapshots:index")
+
+
+class ExportShareSnapshotsView(export.ExportView):
+    list_func_name = 'share_snapshot_list'
+    list_kwargs = {'search_opts': {'all_tenants': True}}
+    fields = (
+        'id', 'name', 'project_id', 'project_name', 'status', 'size',
+        'share_id', 'share_proto', 'created_at',
+    )
+    filename = 'share-snapshots'
+    redirect_url = 'horizon:admin:share_snapshots:index'
@@ -15,6 +15,9 @@ from django.utils.translation import ngettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
+from manila_ui.dashboards import utils
 
 
 def get_size(share):
@@ -81,19 +84,36 @@ class UpdateShareType(tables.LinkAction):
         return {"project_id": project_id}
 
 
-class ShareTypesFilterAction(tables.FilterAction):
-    filter_type = "server"
+class ShareTypesFilterAction(filtering.ServerFilterAction):
     filter_choices = (
-        ('name', _("Name") + " ", True),
+        ('name', _("Name") + " ", False),
         ('extra_specs', _("Extra Spec") + " ", True),
     )
 
-
-class ShareTypesTable(tables.DataTable):
+    def get_search_opts(self, field, value):
+        # NOTE: the API filters extra specs by exact "key=value" pairs only,
+        # other filter strings are matched against keys and values.
+        if field == 'extra_specs' and '=' in value:
+            key, spec_value = (part.strip() for part in value.split('=', 1))
+            if key:
+                return {'extra_specs': {key: spec_value}}
+        return None
+
+    def matches(self, datum, field, value):
+        if field == 'extra_specs':
+            value = value.lower()
+            return any(value in ("%s=%s" % (k, v)).lower()
+                       for k, v in (datum.extra_specs or {}).items())
+        return super(ShareTypesFilterAction, self).matches(
+            datum, field, value)
+
+
+class ShareTypesTable(pagination.PagedTableMixin, tables.DataTable):
     name = tables.WrappingColumn("name", verbose_name=_("Name"))
     description = tables.WrappingColumn(
         "description", verbose_name=_("Description"))
-    extra_specs = tables.Column("extra_specs", verbose_name=_("Extra specs"), )
+    extra_specs = tables.Column("extra_specs", verbose_name=_("Extra specs"),
+                                filters=(utils.specs_to_str,))
     is_default = tables.Column(
         "is_default", verbose_name=_("Is default"),
         filters=(lambda d: 'Yes' if d is True else '-', ),
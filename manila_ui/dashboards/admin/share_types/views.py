@@ -27,10 +27,12 @@ from manila_ui.api import manila
 from manila_ui.dashboards.admin.share_types import forms as project_forms
 from manila_ui.dashboards.admin.share_types import tables as st_tables
 import manila_ui.dashboards.admin.share_types.workflows as st_workflows
-from manila_ui.dashboards import utils as common_utils
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 
 
-class ShareTypesView(tables.MultiTableView):
+class ShareTypesView(filtering.ServerFilterViewMixin,
+                     pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         st_tables.ShareTypesTable,
     )
@@ -40,39 +42,14 @@ class ShareTypesView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_types_data(self):
         try:
-            share_types = manila.share_type_list(self.request)
+            share_types = self.paginate(
+                manila.share_type_list, filter_table='share_types')
         except Exception:
             exceptions.handle(
                 self.request, _('Unable to retrieve share types.'))
             return []
-
-        # Convert dict with extra specs to friendly view
-        for st in share_types:
-            st.extra_specs = common_utils.metadata_to_str(
-                st.extra_specs, 8, 45)
-        share_types = self.get_filters(share_types)
         return share_types
 
-    def get_filters(self, share_types):
-        table = self._tables['share_types']
-        filters = self.get_server_filter_info(table.request, table)
-        filter_string = filters['value']
-        filter_field = filters['field']
-        if filter_string and filter_field:
-            filtered_data = []
-            for st in share_types:
-
-                if filter_field == 'name':
-                    if st.name == filter_string:
-                        filtered_data.append(st)
-
-                if filter_field == 'extra_specs':
-                    if filter_string in st.extra_specs:
-                        filtered_data.append(st)
-            return filtered_data
-        else:
-            return share_types
-
 
 class CreateShareTypeView(forms.ModalFormView):
     form_class = project_forms.CreateShareType
@@ -16,8 +16,8 @@ from horizon import exceptions
 from horizon import forms
 from horizon import workflows
 
-from openstack_dashboard.api import keystone
 
+from manila_ui.api import keystone
 from manila_ui.api import manila
 
 
@@ -14,6 +14,8 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from horizon import tables
 
+from manila_ui.dashboards.admin import export
+from manila_ui.dashboards.admin import utils
 from manila_ui.dashboards.project.shares import tables as shares_tables
 from manila_ui import features
 
@@ -118,6 +120,25 @@ class ManageReplicas(tables.LinkAction):
         return features.is_replication_enabled() and share_replication_enabled
 
 
+class UpdateRow(shares_tables.UpdateRow):
+
+    def get_bulk_data(self, request, share_ids):
+        shares, deleted_ids = super(UpdateRow, self).get_bulk_data(
+            request, share_ids)
+        utils.set_project_name_to_objects(request, shares)
+        return shares, deleted_ids
+
+
+class SharesFilterAction(shares_tables.SharesFilterAction):
+    filter_choices = shares_tables.SharesFilterAction.filter_choices + (
+        ('project_id', _("Project ID"), True),
+    )
+
+
+class ExportShares(export.ExportAction):
+    url = "horizon:admin:shares:export"
+
+
 class SharesTable(shares_tables.SharesTable):
     name = tables.WrappingColumn(
         "name", verbose_name=_("Name"),
@@ -136,15 +157,17 @@ class SharesTable(shares_tables.SharesTable):
         "share_server_id",
         verbose_name=_("Share Server"),
         link=get_share_server_link)
+    sort_keys = dict(shares_tables.SharesTable.sort_keys, host='host')
 
     class Meta(object):
         name = "shares"
         verbose_name = _("Shares")
         status_columns = ["status"]
-        row_class = shares_tables.UpdateRow
+        row_class = UpdateRow
         table_actions = (
-            tables.NameFilterAction,
+            SharesFilterAction,
             ManageShareAction,
+            ExportShares,
             shares_tables.DeleteShare,
         )
         row_actions = (
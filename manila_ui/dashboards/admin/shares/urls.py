@@ -22,6 +22,10 @@ urlpatterns = [
         r'^$',
         views.SharesView.as_view(),
         name='index'),
+    re_path(
+        r'^export/$',
+        views.ExportSharesView.as_view(),
+        name='export'),
     re_path(
         r'^(?P<share_id>[^/]+)/$',
         views.DetailView.as_view(),
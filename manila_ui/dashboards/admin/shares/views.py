@@ -25,14 +25,18 @@ from horizon import tables
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards.admin import export
 from manila_ui.dashboards.admin.shares import forms as project_forms
 from manila_ui.dashboards.admin.shares import tables as s_tables
 from manila_ui.dashboards.admin.shares import tabs as s_tabs
 from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.shares import views as share_views
 
 
-class SharesView(tables.MultiTableView, share_views.ShareTableMixIn):
+class SharesView(filtering.ServerFilterViewMixin, pagination.PagedViewMixin,
+                 tables.MultiTableView, share_views.ShareTableMixIn):
     table_classes = (
         s_tables.SharesTable,
     )
@@ -43,18 +47,14 @@ class SharesView(tables.MultiTableView, share_views.ShareTableMixIn):
     def get_shares_data(self):
         shares = []
         try:
-            shares = manila.share_list(
-                self.request, search_opts={'all_tenants': True})
-            snapshots = manila.share_snapshot_list(
-                self.request, detailed=True, search_opts={'all_tenants': True})
-            share_ids_with_snapshots = []
-            for snapshot in snapshots:
-                share_ids_with_snapshots.append(snapshot.to_dict()['share_id'])
+            shares = self.paginate(
+                manila.share_list, filter_table='shares',
+                search_opts={'all_tenants': True})
+            share_ids_with_snapshots = manila.share_snapshot_index(
+                self.request, [share.id for share in shares],
+                search_opts={'all_tenants': True})
             for share in shares:
-                if share.to_dict()['id'] in share_ids_with_snapshots:
-                    setattr(share, 'has_snapshot', True)
-                else:
-                    setattr(share, 'has_snapshot', False)
+                share.has_snapshot = share.id in share_ids_with_snapshots
         except Exception:
             exceptions.handle(
                 self.request, _('Unable to retrieve share list.'))
@@ -276,3 +276,16 @@ class UnmanageShareView(forms.ModalFormView):
             'name': share.name,
             'host': getattr(share, "host"),
         }
+
+
+class ExportSharesView(export.ExportView):
+    list_func_name = 'share_list'
+    list_kwargs = {'search_opts': {'all_tenants': True}}
+    fields = (
+        'id', 'name', 'project_id', 'project_name', 'status', 'size',
+        'share_proto', 'share_type_name', 'host', 'availability_zone',
+        'share_network_id', 'share_server_id', 'share_group_id',
+        'is_public', 'created_at',
+    )
+    filename = 'shares'
+    redirect_url = 'horizon:admin:shares:index'
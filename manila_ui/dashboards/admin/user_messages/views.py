@@ -33,7 +33,7 @@ class UserMessagesAdminView(project_views.UserMessagesView):
     @memoized.memoized_method
     def get_user_messages_data(self):
         try:
-            messages = manila.messages_list(self.request)
+            messages = self.paginate(manila.messages_list)
             utils.set_project_name_to_objects(self.request, messages)
         except Exception:
             msg = _("Unable to retrieve messages list.")
@@ -12,33 +12,250 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_utils import timeutils
+import hashlib
+import logging
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from horizon import exceptions
-from openstack_dashboard.api import keystone
+from keystoneclient import exceptions as keystone_exceptions
+from oslo_utils import timeutils
 
-PROJECTS = {}
-TIME = None
+from manila_ui.api import keystone
+from manila_ui.api import parallel
 
+LOG = logging.getLogger(__name__)
 
-def set_project_name_to_objects(request, objects):
-    global PROJECTS, TIME
+DEFAULT_PROJECT_NAME_CACHE_TTL = 300
+DEFAULT_PROJECT_NAME_CACHE_STALE_TTL = 3600
+PROJECT_NAME_CACHE_PREFIX = 'manila_ui:project_name'
+# Time after which the refresh lock is released even if its owner died.
+PROJECT_NAME_REFRESH_LOCK_TTL = 60
+# Above this number of unknown projects one listing of all projects is
+# cheaper than a lookup per project.
+PROJECT_NAME_MAX_LOOKUPS = 10
+DEFAULT_USER_NAME_CACHE_TTL = 300
+# Users that could not be looked up for lack of permission are cached for a
+# shorter time, so that a policy change shows their names soon.
+USER_NAME_DENIED_CACHE_TTL = 60
+USER_NAME_CACHE_PREFIX = 'manila_ui:user_name'
+
+
+def _get_project_name_cache_ttls():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    ttl = manila_config.get(
+        'project_name_cache_ttl', DEFAULT_PROJECT_NAME_CACHE_TTL)
+    stale_ttl = manila_config.get(
+        'project_name_cache_stale_ttl', DEFAULT_PROJECT_NAME_CACHE_STALE_TTL)
+    return ttl, max(stale_ttl, ttl)
+
+
+def _get_project_name_cache_scope(request):
+    # NOTE: project IDs are unique per Keystone deployment only, so cached
+    # names are kept apart per identity endpoint and region.
+    scope = '%s|%s' % (getattr(request.user, 'endpoint', None),
+                       getattr(request.user, 'services_region', None))
+    return hashlib.sha256(scope.encode('utf-8')).hexdigest()
+
+
+def _project_name_cache_key(scope, project_id):
+    return '%s:%s:%s' % (PROJECT_NAME_CACHE_PREFIX, scope, project_id)
+
+
+def _fetch_project_names(request, project_ids):
+    """Returns a map of project IDs to names taken from Keystone.
+
+    Projects that do not exist anymore are mapped to None, so that they are
+    cached and not looked up again on every request.
+    """
+    names = dict.fromkeys(project_ids)
+    if len(project_ids) > PROJECT_NAME_MAX_LOOKUPS:
+        projects, has_more = keystone.tenant_list(request)
+        names.update((project.id, project.name) for project in projects)
+        return names
+    lookups = parallel.call_parallel(*[
+        (keystone.tenant_get, [request, project_id], {'admin': True})
+        for project_id in project_ids])
+    for project_id, lookup in zip(project_ids, lookups):
+        try:
+            names[project_id] = lookup.result().name
+        except keystone_exceptions.NotFound:
+            pass
+    return names
+
+
+def _cache_project_names(request, scope, project_ids):
+    ttl, stale_ttl = _get_project_name_cache_ttls()
+    names = _fetch_project_names(request, project_ids)
+    now = timeutils.utcnow_ts(microsecond=True)
+    cache.set_many(
+        {_project_name_cache_key(scope, project_id): (name, now)
+         for project_id, name in names.items()},
+        timeout=stale_ttl)
+    return names
+
+
+def refresh_project_names(request, scope, project_ids):
+    """Refreshes cached project names.
+
+    Only one refresh per scope runs at a time across all processes sharing
+    the cache, other requests keep using the stale names meanwhile.
+
+    :returns: a map of the project IDs to their refreshed names or None if
+        a refresh is already running or failed.
+    """
+    lock_key = '%s:%s:refresh' % (PROJECT_NAME_CACHE_PREFIX, scope)
+    if not cache.add(lock_key, True, timeout=PROJECT_NAME_REFRESH_LOCK_TTL):
+        return None
     try:
-        # NOTE(vponomaryov): we will use saved values making lots of requests
-        # in short period of time. 'memoized' is not suitable here
-        now = timeutils.now()
-        if TIME is None:
-            TIME = now
-        if not PROJECTS or now > TIME + 20:
-            projects, has_more = keystone.tenant_list(request)
-            PROJECTS = {t.id: t for t in projects}
-            TIME = now
+        return _cache_project_names(request, scope, project_ids)
     except Exception:
-        msg = _('Unable to retrieve list of projects.')
-        exceptions.handle(request, msg)
+        LOG.warning("Unable to refresh names of projects %s.", project_ids,
+                    exc_info=True)
+        return None
+    finally:
+        cache.delete(lock_key)
 
+
+def get_project_names(request, project_ids):
+    """Returns a map of the given project IDs to project names.
+
+    Names are kept in the Django cache, so that they are shared by all
+    processes. Names older than the 'project_name_cache_ttl' key of the
+    OPENSTACK_MANILA_FEATURES setting are refreshed by one request at a
+    time, and still returned to the other requests until they are older
+    than 'project_name_cache_stale_ttl'. Only unknown projects are looked up
+    in Keystone.
+    """
+    project_ids = sorted({p_id for p_id in project_ids if p_id})
+    if not project_ids:
+        return {}
+    ttl, stale_ttl = _get_project_name_cache_ttls()
+    scope = _get_project_name_cache_scope(request)
+    keys = {_project_name_cache_key(scope, project_id): project_id
+            for project_id in project_ids}
+    now = timeutils.utcnow_ts(microsecond=True)
+    names = {}
+    stale_ids = []
+    for key, (name, cached_at) in cache.get_many(keys).items():
+        names[keys[key]] = name
+        if now - cached_at > ttl:
+            stale_ids.append(keys[key])
+    missing_ids = [p_id for p_id in project_ids if p_id not in names]
+    if missing_ids:
+        try:
+            fetched = _cache_project_names(request, scope, missing_ids)
+            names.update((p_id, fetched[p_id]) for p_id in missing_ids)
+        except Exception:
+            msg = _('Unable to retrieve list of projects.')
+            exceptions.handle(request, msg)
+    if stale_ids:
+        names.update(refresh_project_names(request, scope, stale_ids) or {})
+    return names
+
+
+def set_project_name_to_objects(request, objects):
+    objects = list(objects)
+    names = get_project_names(
+        request, [getattr(obj, "project_id", None) for obj in objects])
     for obj in objects:
-        project_id = getattr(obj, "project_id", None)
-        project = PROJECTS.get(project_id, None)
-        obj.project_name = getattr(project, "name", None)
+        obj.project_name = names.get(getattr(obj, "project_id", None))
+
+
+def _get_user_name_cache_ttl():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return manila_config.get(
+        'user_name_cache_ttl', DEFAULT_USER_NAME_CACHE_TTL)
+
+
+def _get_user_name_cache_scope(request, per_user=False):
+    # NOTE: the users whose names Keystone discloses depend on the project
+    # and roles of the requester, so cached names are kept apart per
+    # project, roles, identity endpoint and region. Denied lookups may also
+    # depend on the requester, e.g. for their own user, so they are kept
+    # apart per user too.
+    user = request.user
+    roles = sorted(role['name'] for role in getattr(user, 'roles', None) or [])
+    scope = '%s|%s|%s|%s' % (getattr(user, 'endpoint', None),
+                             getattr(user, 'services_region', None),
+                             getattr(user, 'project_id', None),
+                             ','.join(roles))
+    if per_user:
+        scope = '%s|%s' % (scope, getattr(user, 'id', None))
+    return hashlib.sha256(scope.encode('utf-8')).hexdigest()
+
+
+def _user_name_cache_key(scope, user_id):
+    return '%s:%s:%s' % (USER_NAME_CACHE_PREFIX, scope, user_id)
+
+
+def _fetch_user_names(request, user_ids):
+    """Returns maps of user IDs to names taken from Keystone.
+
+    Users are looked up one by one, concurrently, since listing all users of
+    a big cloud is much slower. Users that do not exist anymore, or that
+    cannot be looked up for lack of permission, are mapped to None, so that
+    they are cached too. The latter are returned in a map of their own, as
+    they are cached for a shorter time. Users that could not be looked up
+    for other reasons are left out.
+    """
+    names = {}
+    denied_names = {}
+    lookups = parallel.call_parallel(*[
+        (keystone.user_get, [request, user_id], {'admin': True})
+        for user_id in user_ids])
+    for user_id, lookup in zip(user_ids, lookups):
+        try:
+            names[user_id] = lookup.result().name
+        except keystone_exceptions.NotFound:
+            names[user_id] = None
+        except (keystone_exceptions.Forbidden,
+                keystone_exceptions.Unauthorized):
+            LOG.debug("Not allowed to retrieve user %s.", user_id)
+            denied_names[user_id] = None
+        except Exception:
+            LOG.debug("Unable to retrieve user %s.", user_id, exc_info=True)
+    return names, denied_names
+
+
+def get_user_names(request, user_ids):
+    """Returns a map of the given user IDs to user names.
+
+    Only the given users are looked up in Keystone, and only when they are
+    not in the Django cache yet, where names are kept for the number of
+    seconds set by the 'user_name_cache_ttl' key of the
+    OPENSTACK_MANILA_FEATURES setting. Names are shared by the requesters of
+    the same project and roles only. Users that were not found are cached as
+    such for as long, and users that may not be looked up, for the
+    requester only, for up to USER_NAME_DENIED_CACHE_TTL seconds. Users
+    whose name is unknown are left out of the map.
+    """
+    user_ids = sorted({u_id for u_id in user_ids if u_id})
+    if not user_ids:
+        return {}
+    scope = _get_user_name_cache_scope(request)
+    denied_scope = _get_user_name_cache_scope(request, per_user=True)
+    keys = {}
+    for user_id in user_ids:
+        keys[_user_name_cache_key(scope, user_id)] = user_id
+        keys[_user_name_cache_key(denied_scope, user_id)] = user_id
+    # NOTE: names are cached in tuples, to tell users that were not found
+    # from users that are not cached.
+    names = {keys[key]: name
+             for key, (name,) in cache.get_many(keys).items()}
+    missing_ids = [u_id for u_id in user_ids if u_id not in names]
+    if missing_ids:
+        fetched, denied = _fetch_user_names(request, missing_ids)
+        ttl = _get_user_name_cache_ttl()
+        cache.set_many(
+            {_user_name_cache_key(scope, user_id): (name,)
+             for user_id, name in fetched.items()},
+            timeout=ttl)
+        if denied:
+            cache.set_many(
+                {_user_name_cache_key(denied_scope, user_id): (None,)
+                 for user_id in denied},
+                timeout=min(ttl, USER_NAME_DENIED_CACHE_TTL))
+        names.update(fetched)
+    return {user_id: name for user_id, name in names.items() if name}
@@ -0,0 +1,165 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Concurrent batch actions for manila UI tables.
+
+Horizon batch actions, e.g. deletions, act on the selected rows one after
+another within the request that submitted the table, so that deleting many
+resources can outlast the request timeout. Actions of this module act on
+them concurrently, on the bounded thread pool of
+:mod:`manila_ui.api.parallel`, and still report all results with one
+message per outcome.
+"""
+
+import logging
+
+from django import shortcuts
+from django.utils.translation import gettext_lazy as _
+from horizon import exceptions
+from horizon import messages
+from horizon.utils import functions
+
+from manila_ui.api import parallel
+from manila_ui.dashboards import polling
+
+LOG = logging.getLogger(__name__)
+
+
+class ParallelBatchActionMixin(object):
+    """BatchAction mixin running the action on the selected rows concurrently.
+
+    It must come before the Horizon action class in the bases of the action.
+    Actions run in worker threads, so they must not add messages themselves:
+    they raise on failure and the row is reported in the summary message.
+    Data needed by an action, e.g. the share group of a share, should be
+    taken from the row with :meth:`get_datum` rather than fetched again,
+    and only fetched when the row is not in the table.
+
+    Selected rows which are not in the table are fetched with
+    :meth:`get_missing_data`, so that the action is only run on the rows it
+    is allowed for. Rows which cannot be fetched are reported as not
+    allowed.
+    """
+
+    #: Message reported, formatted with the display name of the row, for
+    #: each row the action failed on, in addition to the summary message.
+    failure_message = None
+
+    _missing_data = {}
+
+    def get_datum(self, obj_id):
+        """Returns the row of the table with the given ID, or None.
+
+        Selected rows are missing from the table when it has been built with
+        another page of the data than the one they were selected on, the
+        rows fetched for the action are returned for them.
+        """
+        try:
+            return self.table.get_object_by_id(obj_id)
+        except exceptions.Http302:
+            return self._missing_data.get(obj_id)
+
+    def get_missing_data(self, request, obj_ids):
+        """Fetches the rows of the given IDs, which are not in the table.
+
+        Rows of tables polled in bulk are fetched the way they are polled,
+        rows of other tables are not fetched.
+
+        :returns: dict mapping the IDs to the fetched rows.
+        """
+        row = self.table._meta.row_class(self.table)
+        if not isinstance(row, polling.BulkUpdateRowMixin):
+            return {}
+        try:
+            data, __ = row.get_bulk_data(request, obj_ids)
+        except Exception:
+            LOG.warning("Unable to fetch the selected rows %s.", obj_ids,
+                        exc_info=True)
+            return {}
+        return dict((self.table.get_object_id(datum), datum)
+                    for datum in data)
+
+    def handle(self, table, request, obj_ids):
+        action_success = []
+        action_failure = []
+        action_not_allowed = []
+        allowed = []
+        data = dict((obj_id, self.get_datum(obj_id)) for obj_id in obj_ids)
+        missing_ids = [
+            obj_id for obj_id, datum in data.items() if datum is None]
+        if missing_ids:
+            self._missing_data = self.get_missing_data(request, missing_ids)
+            data.update(self._missing_data)
+        for datum_id in obj_ids:
+            datum = data.get(datum_id)
+            datum_display = datum_id
+            if datum is not None:
+                datum_display = table.get_object_display(datum) or datum_id
+            if (datum is None or
+                    not table._filter_action(self, request, datum)):
+                action_not_allowed.append(datum_display)
+                LOG.warning('Permission denied to %(name)s: "%(dis)s"', {
+                    'name': self._get_action_name(past=True).lower(),
+                    'dis': datum_display
+                })
+                continue
+            allowed.append((datum_id, datum, datum_display))
+
+        results = parallel.call_parallel(*[
+            (self.action, [request, datum_id])
+            for datum_id, datum, datum_display in allowed])
+
+        for (datum_id, datum, datum_display), result in zip(allowed, results):
+            try:
+                result.result()
+                self.update(request, datum)
+                action_success.append(datum_display)
+                self.success_ids.append(datum_id)
+                LOG.info('%(action)s: "%(datum_display)s"',
+                         {'action': self._get_action_name(past=True),
+                          'datum_display': datum_display})
+            except Exception as ex:
+                if isinstance(ex, exceptions.HandledException):
+                    ex = ex.wrapped[1]
+                else:
+                    action_failure.append(datum_display)
+                    if self.failure_message:
+                        exceptions.handle(
+                            request, self.failure_message % datum_display)
+                LOG.warning('Action %(action)s Failed for %(reason)s', {
+                    'action': (self._get_action_name(past=True).lower(),
+                               datum_display),
+                    'reason': ex})
+
+        success_message_level = getattr(messages, self.default_message_level)
+        if action_not_allowed:
+            msg = _('You are not allowed to %(action)s: %(objs)s')
+            params = {"action":
+                      self._get_action_name(action_not_allowed).lower(),
+                      "objs": functions.lazy_join(", ", action_not_allowed)}
+            messages.error(request, msg % params)
+            success_message_level = messages.info
+        if action_failure:
+            msg = _('Unable to %(action)s: %(objs)s')
+            params = {"action": self._get_action_name(action_failure).lower(),
+                      "objs": functions.lazy_join(", ", action_failure)}
+            messages.error(request, msg % params)
+            success_message_level = messages.info
+        if action_success:
+            msg = _('%(action)s: %(objs)s')
+            params = {"action":
+                      self._get_action_name(action_success, past=True),
+                      "objs": functions.lazy_join(", ", action_success)}
+            success_message_level(request, msg % params)
+
+        return shortcuts.redirect(self.get_success_url(request))
@@ -0,0 +1,69 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Data shared by the tabs of a tab group.
+
+Tabs of a group are rendered independently of each other, so data needed by
+several of them, e.g. lookup tables of names, used to be fetched once per
+tab. Tab groups using :class:`DataContextMixin` load such data once, on first
+use, and share it between their tabs for the rest of the request.
+"""
+
+LOADER_PREFIX = "load_"
+
+
+class DataContext(object):
+    """Lazily loaded items of data shared by the tabs of a tab group.
+
+    An item is either one of the keyword arguments the tab group was created
+    with, e.g. the object shown by a detail view, or the result of the
+    ``load_<name>`` method of the tab group, called on first access only.
+    Items failing to load are not kept, the error is raised to the tab
+    accessing them.
+    """
+
+    def __init__(self, tab_group):
+        self._tab_group = tab_group
+        self._items = {}
+
+    def __contains__(self, name):
+        return (name in self._items or name in self._tab_group.kwargs or
+                hasattr(self._tab_group, LOADER_PREFIX + name))
+
+    def __getitem__(self, name):
+        if name not in self._items:
+            if name in self._tab_group.kwargs:
+                self._items[name] = self._tab_group.kwargs[name]
+            else:
+                loader = getattr(self._tab_group, LOADER_PREFIX + name, None)
+                if loader is None:
+                    raise KeyError(name)
+                self._items[name] = loader()
+        return self._items[name]
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+
+class DataContextMixin(object):
+    """TabGroup mixin sharing lazily loaded data between its tabs.
+
+    Tab groups declare items by defining ``load_<name>`` methods, and tabs
+    get them with ``self.tab_group.data_context[name]``.
+    """
+
+    @property
+    def data_context(self):
+        if "_data_context" not in self.__dict__:
+            self._data_context = DataContext(self)
+        return self._data_context
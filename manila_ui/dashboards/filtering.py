@@ -0,0 +1,118 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Server-side filtering for manila UI tables.
+
+Paginated tables only hold one page of data, so filtering them in the
+browser, or in the view after the page was fetched, only filters that page.
+Filter actions of this module translate their choices into search options
+of the manila list APIs, so that pages are cut out of the matching resources
+only. Choices the API cannot filter are filtered in Python, over the whole
+collection, before the page is cut out of it.
+"""
+
+import functools
+
+from django import shortcuts
+from horizon import tables
+
+
+class ServerFilterAction(tables.FilterAction):
+    """Filter action translated into search options of manila list APIs.
+
+    Choices flagged as API filters in ``filter_choices`` are passed to the
+    API as the search option ``api_params`` maps them to, the choice itself
+    by default, e.g. ``{'description': 'description~'}`` for an inexact
+    match. Other choices are matched by :meth:`matches`, which tests whether
+    the value of the attribute named after the choice contains the filter
+    string.
+    """
+    filter_type = "server"
+    api_params = {}
+
+    def get_search_opts(self, field, value):
+        """Returns the search options filtering ``field`` by ``value``.
+
+        :returns: a dict of search options or None if the API cannot filter
+            that field, or that value, in which case it is filtered in
+            Python.
+        """
+        if not self.is_api_filter(field):
+            return None
+        return {self.api_params.get(field, field): value}
+
+    def matches(self, datum, field, value):
+        datum_value = getattr(datum, field, None)
+        if datum_value is None:
+            return False
+        return value.lower() in str(datum_value).lower()
+
+    def filter(self, table, data, filter_string):
+        field = table.get_filter_field()
+        if not filter_string or not field:
+            return data
+        return [datum for datum in data
+                if self.matches(datum, field, filter_string)]
+
+
+class ServerFilterViewMixin(object):
+    """Paged MultiTableView mixin applying the server filters of its tables.
+
+    It must come before :class:`manila_ui.dashboards.pagination.
+    PagedViewMixin` in the bases of the view.
+    """
+
+    def get_server_filters(self, table_name, search_opts=None):
+        """Returns how to apply the filter of a table to a list API call.
+
+        :param search_opts: search options the API is called with anyway,
+            e.g. {'all_tenants': True}, which are merged with the ones of
+            the filter.
+        :returns: a tuple of the search options and a function filtering a
+            list of resources in Python, None if the API does all the work.
+        """
+        search_opts = dict(search_opts or {})
+        table = self._tables[table_name]
+        filter_info = self.get_server_filter_info(table.request, table)
+        if not filter_info or not filter_info['value']:
+            return search_opts, None
+        action = filter_info['action']
+        filter_opts = action.get_search_opts(
+            filter_info['field'], filter_info['value'])
+        if filter_opts is None:
+            return search_opts, functools.partial(
+                action.filter, table, filter_string=filter_info['value'])
+        search_opts.update(filter_opts)
+        return search_opts, None
+
+    def post(self, request, *args, **kwargs):
+        # NOTE: filters are kept in the session, so that they also apply to
+        # the other pages of the table, which go back to their first page
+        # when their filter changes.
+        for table in self.get_tables().values():
+            if self.handle_server_filter(request, table):
+                return shortcuts.redirect(table.get_absolute_url())
+        return super(ServerFilterViewMixin, self).post(
+            request, *args, **kwargs)
+
+    def paginate(self, list_func, filter_table=None, **kwargs):
+        """Calls a list API wrapper for the current page of a filtered table.
+
+        :param filter_table: name of the table whose filter applies.
+        """
+        if filter_table is not None:
+            search_opts, kwargs['filter_func'] = self.get_server_filters(
+                filter_table, kwargs.pop('search_opts', None))
+            if search_opts:
+                kwargs['search_opts'] = search_opts
+        return super(ServerFilterViewMixin, self).paginate(list_func, **kwargs)
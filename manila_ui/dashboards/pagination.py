@@ -0,0 +1,197 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Server-side "prev/next" pagination for manila UI tables.
+
+Manila list APIs paginate with 'limit' and 'offset' instead of markers, so
+the values passed in the table pagination links are offsets rather than the
+IDs of the first or last object of the page, as Horizon tables expect.
+
+Sorting a page in the browser only sorts the rows of that page, so columns
+of paginated tables can be sorted by manila instead, with the 'sort_key' and
+'sort_dir' parameters of the list APIs, which the pagination links keep.
+"""
+
+from django.conf import settings
+from django.utils import html
+from django.utils import http
+from horizon.utils import functions as utils
+
+from manila_ui.api import manila
+
+
+SORT_KEY_PARAM = "sort_key"
+SORT_DIR_PARAM = "sort_dir"
+SORT_DIRS = ("asc", "desc")
+
+
+def get_page_size(request):
+    """Returns the number of items per page, 0 if pagination is disabled.
+
+    The page size is taken from the 'page_size' key of the
+    OPENSTACK_MANILA_FEATURES setting and defaults to the page size the user
+    set in Horizon.
+    """
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    page_size = manila_config.get('page_size')
+    if page_size is None:
+        page_size = utils.get_page_size(request)
+    return max(int(page_size), 0)
+
+
+def get_sort(request, sort_keys):
+    """Returns the column and direction a table is sorted by.
+
+    :param sort_keys: dict mapping the names of the columns sorted by the
+        API to the sort keys of the list API.
+    :returns: tuple of the column name and the sort direction, (None, None)
+        if the table is not sorted, or by a column the API cannot sort.
+    """
+    column = request.GET.get(SORT_KEY_PARAM)
+    if column not in sort_keys:
+        return None, None
+    sort_dir = request.GET.get(SORT_DIR_PARAM)
+    if sort_dir not in SORT_DIRS:
+        sort_dir = SORT_DIRS[0]
+    return column, sort_dir
+
+
+class PagedTableMixin(object):
+    """Table mixin rendering offsets in the pagination links.
+
+    Columns listed in ``sort_keys`` are sorted by the API, their headers
+    link to the first page of the table sorted by them, instead of sorting
+    the rows of the current page in the browser.
+    """
+
+    page_offset = 0
+    page_size = 0
+    # Maps the names of the columns sorted by the API to the sort keys of the
+    # list API, e.g. {'size': 'size'}.
+    sort_keys = {}
+
+    def __init__(self, request, *args, **kwargs):
+        super(PagedTableMixin, self).__init__(request, *args, **kwargs)
+        self.sort_column, self.sort_dir = get_sort(request, self.sort_keys)
+        for name in self.sort_keys:
+            if name in self.columns:
+                self._set_sort_link(self.columns[name])
+
+    def _set_sort_link(self, column):
+        # NOTE: columns are copied for each table, so changing them does not
+        # change the columns of the table class.
+        column.sortable = False
+        column.classes = [cls for cls in column.classes if cls != "sortable"]
+        sort_dir = SORT_DIRS[0]
+        icon = ""
+        if column.name == self.sort_column:
+            if self.sort_dir == SORT_DIRS[0]:
+                sort_dir = SORT_DIRS[1]
+            icon = html.format_html(
+                ' <span class="fa fa-caret-{}"></span>',
+                "up" if self.sort_dir == SORT_DIRS[0] else "down")
+        query = http.urlencode({SORT_KEY_PARAM: column.name,
+                                SORT_DIR_PARAM: sort_dir})
+        column.verbose_name = html.format_html(
+            '<a href="?{}">{}{}</a>', query, column.verbose_name, icon)
+
+    def _add_sort_params(self, pagination_string):
+        if self.sort_column is None:
+            return pagination_string
+        return "&".join([pagination_string, http.urlencode({
+            SORT_KEY_PARAM: self.sort_column,
+            SORT_DIR_PARAM: self.sort_dir})])
+
+    def get_marker(self):
+        return str(self.page_offset + self.page_size)
+
+    def get_prev_marker(self):
+        return str(max(self.page_offset - self.page_size, 0))
+
+    def get_pagination_string(self):
+        return self._add_sort_params(
+            super(PagedTableMixin, self).get_pagination_string())
+
+    def get_prev_pagination_string(self):
+        # NOTE: both links carry an offset, so there is no need for a
+        # separate parameter for the previous page.
+        return self._add_sort_params("=".join(
+            [self._meta.pagination_param, self.get_prev_marker()]))
+
+
+class PagedViewMixin(object):
+    """MultiTableView mixin fetching only the requested page of data."""
+
+    def __init__(self, *args, **kwargs):
+        super(PagedViewMixin, self).__init__(*args, **kwargs)
+        self._has_prev_data = False
+        self._has_more_data = False
+
+    def has_prev_data(self, table):
+        return self._has_prev_data
+
+    def has_more_data(self, table):
+        return self._has_more_data
+
+    def get_page_size(self):
+        return get_page_size(self.request)
+
+    def get_page_offset(self):
+        meta = self.table_classes[0]._meta
+        try:
+            offset = int(self.request.GET.get(meta.pagination_param, 0))
+        except ValueError:
+            offset = 0
+        return max(offset, 0)
+
+    def get_sort_opts(self):
+        """Returns the sort options of the list API for the sorted table."""
+        sort_keys = self.table_classes[0].sort_keys
+        column, sort_dir = get_sort(self.request, sort_keys)
+        if column is None:
+            return {}
+        return {'sort_key': sort_keys[column], 'sort_dir': sort_dir}
+
+    def handle_table(self, table):
+        self._tables[table.name].page_offset = self.get_page_offset()
+        self._tables[table.name].page_size = self.get_page_size()
+        return super(PagedViewMixin, self).handle_table(table)
+
+    def paginate(self, list_func, filter_func=None, **kwargs):
+        """Calls a list API wrapper for the current page only.
+
+        :param list_func: list API wrapper accepting 'limit' and 'offset',
+            as well as 'sort_key' and 'sort_dir' if the table has columns
+            sorted by the API.
+        :param filter_func: function filtering the listed items in Python,
+            in which case the whole collection is listed and the page is cut
+            out of the matching items.
+        :param kwargs: other keyword arguments of the wrapper.
+        """
+        for key, value in self.get_sort_opts().items():
+            kwargs.setdefault(key, value)
+        page_size = self.get_page_size()
+        if filter_func is not None:
+            items = list(filter_func(list_func(self.request, **kwargs)))
+            if not page_size:
+                return items
+            offset = self.get_page_offset()
+            self._has_more_data = len(items) > offset + page_size
+            self._has_prev_data = offset > 0
+            return items[offset:offset + page_size]
+        if not page_size:
+            return list_func(self.request, **kwargs)
+        items, self._has_more_data, self._has_prev_data = manila.list_paged(
+            list_func, self.request, page_size,
+            offset=self.get_page_offset(), **kwargs)
+        return items
@@ -0,0 +1,139 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Batched AJAX updates of manila table rows.
+
+Horizon polls every row in a transitional state with a request of its own,
+each of them fetching its object from manila. The rows of tables using these
+mixins are polled together instead, with one request per table for all of
+its rows, whose objects are fetched concurrently.
+"""
+
+import collections
+import logging
+from urllib import parse
+
+from django import http
+from horizon import exceptions
+
+from manila_ui.api import parallel
+from manila_ui import exceptions as manila_exceptions
+
+LOG = logging.getLogger(__name__)
+
+BULK_ROW_UPDATE_ACTION = "bulk_row_update"
+NOT_FOUND = manila_exceptions.NOT_FOUND + (exceptions.NotFound,)
+
+
+def filter_by_ids(objects, obj_ids):
+    """Splits the objects of the given IDs out of a complete listing.
+
+    Only meant for listings which are never paginated nor capped, e.g. the
+    access rules of a share, since IDs missing from them are deleted.
+
+    :returns: tuple of the objects of the given IDs, in the order they are
+        listed, and of the IDs of the missing objects.
+    """
+    objects = [obj for obj in objects if obj.id in set(obj_ids)]
+    found_ids = set(obj.id for obj in objects)
+    return objects, [obj_id for obj_id in obj_ids if obj_id not in found_ids]
+
+
+def get_by_ids(get_func, request, obj_ids):
+    """Fetches the objects of the given IDs concurrently.
+
+    :param get_func: API wrapper fetching one object by ID.
+    :returns: tuple of the fetched objects, in the order of the IDs, and of
+        the IDs of the objects which were not found. Objects which could not
+        be fetched for other reasons are left out of both.
+    """
+    obj_ids = list(collections.OrderedDict.fromkeys(obj_ids))
+    results = parallel.call_parallel(*[
+        (get_func, [request, obj_id]) for obj_id in obj_ids])
+    objects = []
+    deleted_ids = []
+    for obj_id, result in zip(obj_ids, results):
+        try:
+            objects.append(result.result())
+        except NOT_FOUND:
+            deleted_ids.append(obj_id)
+        except Exception:
+            LOG.warning("Unable to update the row of '%s'.", obj_id,
+                        exc_info=True)
+    return objects, deleted_ids
+
+
+class BulkUpdateRowMixin(object):
+    """Row mixin polled together with the other rows of its table.
+
+    Subclasses implement ``get_bulk_data`` besides ``get_data``, which is
+    still used to update single rows.
+    """
+
+    ajax_bulk_action_name = BULK_ROW_UPDATE_ACTION
+
+    def load_cells(self, datum=None):
+        super(BulkUpdateRowMixin, self).load_cells(datum)
+        if "ajax-update" in self.classes:
+            # NOTE: the row is polled by the manila poller, keep the one of
+            # Horizon from requesting it on its own.
+            self.classes.remove("ajax-update")
+            self.classes.append("bulk-ajax-update")
+            self.attrs['data-bulk-update-url'] = (
+                self.get_ajax_bulk_update_url())
+
+    def get_ajax_bulk_update_url(self):
+        params = parse.urlencode(collections.OrderedDict([
+            ("action", self.ajax_bulk_action_name),
+            ("table", self.table.name),
+        ]))
+        return "%s?%s" % (self.table.get_absolute_url(), params)
+
+    def get_bulk_data(self, request, obj_ids):
+        """Fetches the updated data of the rows of the given object IDs.
+
+        :returns: tuple of the updated objects and of the IDs of the objects
+            which do not exist anymore. Objects which could not be fetched
+            for other reasons are left out of both, their rows are kept as
+            they are and polled again.
+        """
+        raise NotImplementedError()
+
+
+class BulkUpdateTableMixin(object):
+    """Table mixin answering the batched row updates of its rows.
+
+    The response maps the IDs of the requested objects to their rendered
+    rows, and lists the IDs of the deleted ones.
+    """
+
+    def maybe_preempt(self):
+        table_name, action_name, obj_id = self.check_handler(self.request)
+        if table_name == self.name and action_name == BULK_ROW_UPDATE_ACTION:
+            return self.handle_bulk_row_update()
+        return super(BulkUpdateTableMixin, self).maybe_preempt()
+
+    def handle_bulk_row_update(self):
+        obj_ids = self.request.GET.getlist("obj_id")
+        row_class = self._meta.row_class
+        try:
+            data, deleted_ids = row_class(self).get_bulk_data(
+                self.request, obj_ids)
+        except Exception as e:
+            exceptions.handle(self.request, ignore=True)
+            return http.HttpResponse(
+                status=manila_exceptions.get_http_status(e))
+        rows = dict(
+            (self.get_object_id(datum), row_class(self, datum).render())
+            for datum in data)
+        return http.JsonResponse({"rows": rows, "deleted": deleted_ids})
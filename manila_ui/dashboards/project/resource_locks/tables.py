@@ -18,9 +18,10 @@ from django.utils.translation import ngettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import batch
 
 
-class DeleteLock(tables.DeleteAction):
+class DeleteLock(batch.ParallelBatchActionMixin, tables.DeleteAction):
     policy_rules = (("share", "resource_lock:delete"),)
 
     @staticmethod
@@ -13,87 +13,135 @@
 from django.utils.translation import gettext_lazy as _
 from horizon import exceptions
 from horizon import tabs
-from openstack_dashboard.api import keystone
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
+from manila_ui.dashboards.admin import utils as admin_utils
+from manila_ui.dashboards import data_context
 from manila_ui.dashboards.project.resource_locks import tables as lock_tables
 
 
+def _is_lock_of(lock, resource_type):
+    return resource_type in (
+        getattr(lock, 'resource_level', '').lower(),
+        getattr(lock, 'resource_type', '').lower())
+
+
+class LockResolver(object):
+    """Resolves the names of the resources and users of resource locks.
+
+    The IDs referenced by all locks are gathered first, so that they are
+    looked up with as few calls as possible: the access rules of the parent
+    shares are listed concurrently, only the rules missing from them are
+    fetched one by one, still concurrently, and locks already carrying the
+    name of their resource are not looked up at all.
+    """
+
+    def __init__(self, request):
+        self.request = request
+
+    def resolve(self, locks):
+        share_locks = [lock for lock in locks
+                       if _is_lock_of(lock, 'share')]
+        rule_locks = [lock for lock in locks
+                      if _is_lock_of(lock, 'access_rule')]
+        rules = self._get_rules(rule_locks)
+        for lock in rule_locks:
+            access_to, share_id = rules.get(lock.resource_id, (None, None))
+            lock.access_to = (access_to or
+                              getattr(lock, 'resource_name', None) or
+                              lock.resource_id)
+            lock.parent_resource_id = (
+                getattr(lock, 'parent_resource_id', None) or share_id)
+            lock.resource_action = getattr(lock, 'resource_action', '')
+
+        share_ids = {lock.resource_id for lock in share_locks
+                     if not getattr(lock, 'resource_name', None)}
+        share_ids.update(lock.parent_resource_id for lock in rule_locks
+                         if lock.parent_resource_id)
+        share_names = self._get_share_names(share_ids)
+        for lock in share_locks:
+            if not getattr(lock, 'resource_name', None):
+                lock.resource_name = share_names.get(
+                    lock.resource_id, lock.resource_id)
+        for lock in rule_locks:
+            p_id = lock.parent_resource_id
+            lock.parent_resource_name = (
+                share_names.get(p_id, p_id) if p_id else _("Unknown Share"))
+
+        user_names = self._get_user_names(
+            {lock.user_id for lock in share_locks + rule_locks})
+        for lock in share_locks + rule_locks:
+            lock.user_name = user_names.get(lock.user_id, lock.user_id)
+        return share_locks + rule_locks
+
+    def _get_rules(self, rule_locks):
+        """Returns the access to and share ID of the rules of the locks."""
+        rule_ids = {lock.resource_id for lock in rule_locks
+                    if not getattr(lock, 'resource_name', None)}
+        parent_ids = sorted({
+            getattr(lock, 'parent_resource_id', None) for lock in rule_locks
+            if lock.resource_id in rule_ids} - {None})
+        rules = {}
+        lists = parallel.call_parallel(*[
+            (manila.share_rules_list, [self.request, share_id])
+            for share_id in parent_ids])
+        for share_id, rule_list in zip(parent_ids, lists):
+            try:
+                for rule in rule_list.result():
+                    rules[rule.id] = (
+                        getattr(rule, 'access_to', None), share_id)
+            except Exception:
+                pass
+        missing_ids = sorted(rule_ids - set(rules))
+        gets = parallel.call_parallel(*[
+            (manila.share_rule_get, [self.request, rule_id])
+            for rule_id in missing_ids])
+        for rule_id, rule in zip(missing_ids, gets):
+            try:
+                rule = rule.result()
+                rules[rule_id] = (getattr(rule, 'access_to', None),
+                                  getattr(rule, 'share_id', None))
+            except Exception:
+                pass
+        return rules
+
+    def _get_share_names(self, share_ids):
+        """Returns the names of the given shares, by ID.
+
+        Shares are fetched concurrently, on the bounded pool of
+        :func:`manila_ui.api.parallel.call_parallel`, rather than found in a
+        listing of all shares, whose cost grows with the number of shares.
+        """
+        shares = []
+        for share in parallel.call_parallel(*[
+                (manila.share_get, [self.request, share_id])
+                for share_id in sorted(share_ids)]):
+            try:
+                shares.append(share.result())
+            except Exception:
+                pass
+        return {share.id: share.name or share.id for share in shares
+                if share.id in share_ids}
+
+    def _get_user_names(self, user_ids):
+        user_names = {self.request.user.id: self.request.user.username}
+        user_names.update(admin_utils.get_user_names(
+            self.request, user_ids - set(user_names)))
+        return user_names
+
+
 class LockDataMixin(object):
     is_admin = False
 
     def _get_common_data(self, resource_type):
-        request = self.request
         try:
-            all_locks = self.tab_group.get_all_locks()
-            filtered_locks = [
-                lock for lock in all_locks
-                if resource_type in (
-                    getattr(lock, 'resource_level', '').lower(),
-                    getattr(lock, 'resource_type', '').lower())
-            ]
-            if not filtered_locks:
-                return []
-            share_opts = {'all_tenants': True} if self.is_admin else {}
-            shares = manila.share_list(request, search_opts=share_opts)
-            share_map = {s.id: s.name or s.id for s in shares}
-            user_map = {request.user.id: request.user.username}
-            try:
-                users = keystone.user_list(request)
-                user_map.update({u.id: u.name for u in users})
-            except Exception:
-                pass
-            if resource_type == 'share':
-                for lock in filtered_locks:
-                    if not getattr(lock, 'resource_name', None):
-                        lock.resource_name = share_map.get(
-                            lock.resource_id, lock.resource_id)
-                    lock.user_name = user_map.get(lock.user_id, lock.user_id)
-                return filtered_locks
-            if resource_type == 'access_rule':
-                parent_ids = {
-                    getattr(lock, 'parent_resource_id', None)
-                    for lock in filtered_locks
-                } - {None}
-                access_val_map = {}
-                parent_map = {}
-                for share_id in parent_ids:
-                    try:
-                        rules = manila.share_rules_list(request, share_id)
-                        for rule in rules:
-                            access_val_map[rule.id] = getattr(
-                                rule, 'access_to', rule.id)
-                            parent_map[rule.id] = share_id
-                    except Exception:
-                        pass
-                for lock in filtered_locks:
-                    r_id = lock.resource_id
-                    if r_id not in access_val_map:
-                        try:
-                            rule = manila.share_rule_get(request, r_id)
-                            access_val_map[r_id] = getattr(
-                                rule, 'access_to', r_id)
-                            parent_map[r_id] = getattr(
-                                rule, 'share_id', None)
-                        except Exception:
-                            access_val_map[r_id] = getattr(
-                                lock, 'resource_name', r_id)
-                for lock in filtered_locks:
-                    r_id = lock.resource_id
-                    lock.access_to = access_val_map.get(r_id, r_id)
-                    p_id = (getattr(lock, 'parent_resource_id', None) or
-                            parent_map.get(r_id))
-                    lock.parent_resource_id = p_id
-                    lock.parent_resource_name = (
-                        share_map.get(p_id, p_id) if p_id
-                        else _("Unknown Share"))
-                    lock.user_name = user_map.get(lock.user_id, lock.user_id)
-                    lock.resource_action = getattr(
-                        lock, 'resource_action', '')
-                return filtered_locks
+            locks = self.tab_group.data_context['resolved_locks']
+            return [lock for lock in locks
+                    if _is_lock_of(lock, resource_type)]
         except Exception:
             msg = _("Unable to retrieve %s locks.") % resource_type
-            exceptions.handle(request, msg)
+            exceptions.handle(self.request, msg)
             return []
 
 
@@ -117,17 +165,22 @@ class AccessRulesTab(tabs.TableTab, LockDataMixin):
         return self._get_common_data('access_rule')
 
 
-class ResourceLockTabs(tabs.TabGroup):
+class ResourceLockTabs(data_context.DataContextMixin, tabs.TabGroup):
     slug = "resource_lock_tabs"
     tabs = (SharesTab, AccessRulesTab)
     sticky = False
 
-    def get_all_locks(self):
-        if not hasattr(self, "_all_locks"):
-            is_admin_context = self.kwargs.get('is_admin') or any(
-                getattr(t, 'is_admin', False) for t in self.get_tabs()
-            )
-            search_opts = {'all_projects': True} if is_admin_context else {}
-            self._all_locks = manila.resource_lock_list(
-                self.request, search_opts=search_opts)
-        return self._all_locks
+    def is_admin_context(self):
+        return self.kwargs.get('is_admin') or any(
+            getattr(t, 'is_admin', False) for t in self.get_tabs())
+
+    def load_locks(self):
+        search_opts = (
+            {'all_projects': True} if self.is_admin_context() else {})
+        return manila.resource_lock_list(
+            self.request, search_opts=search_opts)
+
+    def load_resolved_locks(self):
+        """Returns the locks with the names of their resources and users."""
+        resolver = LockResolver(self.request)
+        return resolver.resolve(self.data_context['locks'])
@@ -17,6 +17,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 from horizon import tables
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 
 
 class Create(tables.LinkAction):
@@ -59,7 +60,7 @@ class Edit(tables.LinkAction):
     policy_rules = (("share", "security_service:update"),)
 
 
-class SecurityServicesTable(tables.DataTable):
+class SecurityServicesTable(pagination.PagedTableMixin, tables.DataTable):
     name = tables.WrappingColumn(
         "name", verbose_name=_("Name"),
         link="horizon:project:security_services:security_service_detail")
@@ -22,6 +22,7 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.security_services import forms as ss_forms
 from manila_ui.dashboards.project.security_services import tables as ss_tables
 from manila_ui.dashboards.project.security_services import tabs as ss_tabs
@@ -29,7 +30,8 @@ from manila_ui.dashboards.project.share_networks import forms as sn_forms
 from manila_ui.dashboards import utils
 
 
-class SecurityServicesView(tables.MultiTableView):
+class SecurityServicesView(pagination.PagedViewMixin,
+                           tables.MultiTableView):
     table_classes = (
         ss_tables.SecurityServicesTable,
     )
@@ -39,7 +41,7 @@ class SecurityServicesView(tables.MultiTableView):
     @memoized.memoized_method
     def get_security_services_data(self):
         try:
-            security_services = manila.security_service_list(self.request)
+            security_services = self.paginate(manila.security_service_list)
         except Exception:
             security_services = []
             exceptions.handle(
@@ -24,6 +24,7 @@ from horizon import tables
 from horizon.utils import filters
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 
 
 class UpdateShareGroupSnapshot(tables.LinkAction):
@@ -116,7 +117,7 @@ class UpdateShareGroupSnapshotRow(tables.Row):
         return snapshot
 
 
-class ShareGroupSnapshotsTable(tables.DataTable):
+class ShareGroupSnapshotsTable(pagination.PagedTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("available", True),
         ("creating", None),
@@ -152,6 +153,8 @@ class ShareGroupSnapshotsTable(tables.DataTable):
         "share_group",
         verbose_name=_("Source"),
         link="horizon:project:share_groups:detail")
+    sort_keys = {'name': 'name', 'created_at': 'created_at',
+                 'status': 'status'}
 
     def get_object_display(self, obj):
         return obj.name
@@ -27,12 +27,15 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
+from manila_ui.dashboards import pagination
 import manila_ui.dashboards.project.share_group_snapshots.forms as sgs_forms
 import manila_ui.dashboards.project.share_group_snapshots.tables as sgs_tables
 import manila_ui.dashboards.project.share_group_snapshots.tabs as sgs_tabs
 
 
-class ShareGroupSnapshotsView(tables.MultiTableView):
+class ShareGroupSnapshotsView(pagination.PagedViewMixin,
+                              tables.MultiTableView):
     table_classes = (
         sgs_tables.ShareGroupSnapshotsTable,
     )
@@ -42,11 +45,15 @@ class ShareGroupSnapshotsView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_group_snapshots_data(self):
         share_group_snapshots = []
+        sg_snapshots_call, share_groups_call = parallel.call_parallel(
+            (self.paginate, [manila.share_group_snapshot_list],
+             {'search_opts': {'all_tenants': True}}),
+            (manila.share_group_list, [self.request]),
+        )
         try:
-            share_group_snapshots = manila.share_group_snapshot_list(
-                self.request, search_opts={'all_tenants': True})
-            share_groups = manila.share_group_list(self.request)
-            sg_names = dict([(sg.id, sg.name or sg.id) for sg in share_groups])
+            share_group_snapshots = sg_snapshots_call.result()
+            sg_names = dict([(sg.id, sg.name or sg.id)
+                             for sg in share_groups_call.result()])
             for snapshot in share_group_snapshots:
                 snapshot.share_group = sg_names.get(snapshot.share_group_id)
         except Exception:
@@ -19,6 +19,7 @@ from django.utils.translation import ngettext_lazy
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 import manila_ui.dashboards.project.share_group_snapshots.tables as sgs_tables
 
 
@@ -84,7 +85,7 @@ class UpdateShareGroupRow(tables.Row):
         return sg
 
 
-class ShareGroupsTable(tables.DataTable):
+class ShareGroupsTable(pagination.PagedTableMixin, tables.DataTable):
     def get_share_network_link(share_group):
         if getattr(share_group, 'share_network_id', None):
             return reverse(
@@ -137,6 +138,8 @@ class ShareGroupsTable(tables.DataTable):
         "source_share_group_snapshot_id",
         verbose_name=_("Source Share Group Snapshot"),
         link=get_source_share_group_snapshot_link)
+    sort_keys = {'name': 'name', 'status': 'status',
+                 'availability_zone': 'availability_zone'}
 
     def get_object_display(self, share_group):
         return str(share_group.id)
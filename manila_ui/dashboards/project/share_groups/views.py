@@ -27,12 +27,13 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.share_groups import forms as sg_forms
 from manila_ui.dashboards.project.share_groups import tables as sg_tables
 from manila_ui.dashboards.project.share_groups import tabs as sg_tabs
 
 
-class ShareGroupsView(tables.MultiTableView):
+class ShareGroupsView(pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         sg_tables.ShareGroupsTable,
     )
@@ -42,8 +43,8 @@ class ShareGroupsView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_groups_data(self):
         try:
-            share_groups = manila.share_group_list(
-                self.request, detailed=True)
+            share_groups = self.paginate(
+                manila.share_group_list, detailed=True)
         except Exception:
             share_groups = []
             exceptions.handle(
@@ -19,9 +19,9 @@ from horizon import exceptions
 from horizon import forms
 from horizon import messages
 from openstack_dashboard.api import base
-from openstack_dashboard.api import neutron
 
 from manila_ui.api import manila
+from manila_ui.api import neutron
 from manila_ui.dashboards import utils
 
 
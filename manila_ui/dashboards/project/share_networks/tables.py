@@ -18,9 +18,11 @@ from django.utils.translation import ngettext_lazy
 from django.utils.translation import pgettext_lazy
 from horizon import tables
 from openstack_dashboard.api import base
-from openstack_dashboard.api import neutron
 
 from manila_ui.api import manila
+from manila_ui.dashboards import batch
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.share_networks.share_network_subnets \
     import tables as subnet_tables
 from manila_ui.dashboards import utils
@@ -38,7 +40,7 @@ class Create(tables.LinkAction):
     policy_rules = (("share", "share_network:create"),)
 
 
-class Delete(tables.DeleteAction):
+class Delete(batch.ParallelBatchActionMixin, tables.DeleteAction):
     policy_rules = (("share", "share_network:delete"),)
 
     @staticmethod
@@ -89,22 +91,25 @@ class UpdateRow(tables.Row):
         share_net = manila.share_network_get(request, share_net_id)
         neutron_enabled = base.is_service_enabled(request, 'network')
         if neutron_enabled:
-            share_net.neutron_net = neutron.network_get(
-                request, share_net.neutron_net_id).name_or_id
-            share_net.neutron_subnet = neutron.subnet_get(
-                request, share_net.neutron_subnet_id).name_or_id
+            net_id = getattr(share_net, 'neutron_net_id', None)
+            subnet_id = getattr(share_net, 'neutron_subnet_id', None)
+            network_names, subnet_names = utils.get_neutron_names(
+                request, [net_id], [subnet_id])
+            share_net.neutron_net = network_names.get(net_id, net_id)
+            share_net.neutron_subnet = subnet_names.get(subnet_id, subnet_id)
         return share_net
 
 
-class ShareNetworksFilterAction(tables.FilterAction):
-    filter_type = "server"
+class ShareNetworksFilterAction(filtering.ServerFilterAction):
+    api_params = {'description': 'description~'}
     filter_choices = (
         ('name', _("Name") + " ", True),
-        ('description', _("Description") + " ", True),
+        ('name~', _("Name contains") + " ", True),
+        ('description', _("Description contains") + " ", True),
     )
 
 
-class ShareNetworksTable(tables.DataTable):
+class ShareNetworksTable(pagination.PagedTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("ACTIVE", True),
         ("INACTIVE", True),
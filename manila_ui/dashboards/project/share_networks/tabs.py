@@ -15,6 +15,7 @@ from django.utils.translation import gettext_lazy as _
 from horizon import exceptions
 from horizon import tabs
 
+from manila_ui.dashboards import data_context
 from manila_ui.dashboards.project.share_networks import tables as sn_tables
 
 
@@ -25,7 +26,7 @@ class OverviewTab(tabs.Tab):
 
     def get_context_data(self, request):
         return {
-            "share_network": self.tab_group.kwargs['share_network'],
+            "share_network": self.tab_group.data_context['share_network'],
         }
 
 
@@ -38,8 +39,8 @@ class SubnetsTab(tabs.TableTab):
 
     def get_subnets_data(self):
         try:
-            share_network = self.tab_group.kwargs['share_network']
-            all_subnets = getattr(share_network, 'share_network_subnets', [])
+            share_network = self.tab_group.data_context['share_network']
+            all_subnets = self.tab_group.data_context['subnets']
             self._tables[
                 self.table_classes[0].Meta.name].kwargs[
                     'share_network_id'] = share_network.id
@@ -60,10 +61,14 @@ class SubnetsTab(tabs.TableTab):
             return []
 
 
-class ShareNetworkDetailTabs(tabs.TabGroup):
+class ShareNetworkDetailTabs(data_context.DataContextMixin, tabs.TabGroup):
     slug = "share_network_details"
     tabs = (
         OverviewTab,
         SubnetsTab,
     )
     sticky = False
+
+    def load_subnets(self):
+        share_network = self.data_context['share_network']
+        return getattr(share_network, 'share_network_subnets', [])
@@ -12,8 +12,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import re
-
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from horizon import exceptions
@@ -22,16 +20,18 @@ from horizon import tabs
 from horizon.utils import memoized
 from horizon import workflows
 from openstack_dashboard.api import base
-from openstack_dashboard.api import neutron
 
 from manila_ui.api import manila
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.share_networks import tables as sn_tables
 from manila_ui.dashboards.project.share_networks import tabs as sn_tabs
 import manila_ui.dashboards.project.share_networks.workflows as sn_workflows
 from manila_ui.dashboards import utils
 
 
-class ShareNetworksView(tables.MultiTableView):
+class ShareNetworksView(filtering.ServerFilterViewMixin,
+                        pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         sn_tables.ShareNetworksTable,
     )
@@ -41,37 +41,15 @@ class ShareNetworksView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_networks_data(self):
         try:
-            share_networks = manila.share_network_list(
-                self.request, detailed=True)
+            share_networks = self.paginate(
+                manila.share_network_list, filter_table='share_networks',
+                detailed=True)
         except Exception:
             share_networks = []
             exceptions.handle(
                 self.request, _("Unable to retrieve share networks"))
-        share_networks = self.get_filters(share_networks)
         return share_networks
 
-    def get_filters(self, share_networks):
-        table = self._tables['share_networks']
-        filters = self.get_server_filter_info(table.request, table)
-        filter_string = filters['value']
-        filter_field = filters['field']
-        if filter_string and filter_field:
-            filtered_data = []
-            for share_network in share_networks:
-                if filter_field == 'name':
-                    if share_network.name == filter_string:
-                        filtered_data.append(share_network)
-
-                if filter_field == 'description':
-                    re_string = re.compile(filter_string)
-                    if (share_network.description and
-                            re.search(re_string,
-                                      share_network.description)):
-                        filtered_data.append(share_network)
-            return filtered_data
-        else:
-            return share_networks
-
 
 class Update(workflows.WorkflowView):
     workflow_class = sn_workflows.UpdateShareNetworkWorkflow
@@ -118,31 +96,21 @@ class Detail(tabs.TabView):
         try:
             share_net_id = self.kwargs['share_network_id']
             share_net = manila.share_network_get(self.request, share_net_id)
+            subnets = share_net.share_network_subnets
             if base.is_service_enabled(self.request, 'network'):
-                for subnet in share_net.share_network_subnets:
-                    # Neutron Net ID
-                    try:
-                        subnet["neutron_net"] = neutron.network_get(
-                            self.request, subnet["neutron_net_id"]).name_or_id
-                    except (
-                        neutron.neutron_client.exceptions
-                        .NeutronClientException
-                        ):
-                        subnet["neutron_net"] = _("Unknown")
-                    # Neutron Subnet ID
-                    try:
-                        subnet["neutron_subnet"] = neutron.subnet_get(
-                            self.request,
-                            subnet["neutron_subnet_id"]).name_or_id
-                    except (
-                        neutron.neutron_client.exceptions
-                        .NeutronClientException
-                        ):
-                        subnet["neutron_subnet"] = _("Unknown")
+                network_names, subnet_names = utils.get_neutron_names(
+                    self.request,
+                    [subnet["neutron_net_id"] for subnet in subnets],
+                    [subnet["neutron_subnet_id"] for subnet in subnets])
+                for subnet in subnets:
+                    subnet["neutron_net"] = network_names.get(
+                        subnet["neutron_net_id"], _("Unknown"))
+                    subnet["neutron_subnet"] = subnet_names.get(
+                        subnet["neutron_subnet_id"], _("Unknown"))
             # List all azs if availability_zone is None
             availability_zones = manila.availability_zone_list(self.request)
             az_list = ", ".join([az.name for az in availability_zones])
-            for subnet in share_net.share_network_subnets:
+            for subnet in subnets:
                 if subnet["availability_zone"] is None:
                     subnet["availability_zone"] = az_list
             share_net.sec_services = (
@@ -16,10 +16,10 @@ from horizon import exceptions
 from horizon import forms
 from horizon import messages
 from horizon import workflows
-from openstack_dashboard import api
 from openstack_dashboard.api import base
 
 from manila_ui.api import manila
+from manila_ui.api import neutron
 from manila_ui.dashboards import utils
 
 
@@ -103,7 +103,7 @@ class AddShareNetworkSubnetAction(workflows.MembershipAction):
     def get_neutron_net_id_choices(self, request):
         net_choices = [('', _('None'))]
 
-        networks = api.neutron.network_list(request)
+        networks = neutron.network_list(request)
         for network in networks:
             net_choices.append((utils.transform_dashed_name(network.id),
                                 network.name_or_id))
@@ -124,8 +124,8 @@ class AddShareNetworkSubnetAction(workflows.MembershipAction):
                     'data-switch-on': 'neutron_net_id',
                     data_net_id: _('Neutron Subnet')}))
             self.fields[subnet_field_name] = subnet_field
-            subnet_choices = api.neutron.subnet_list(request,
-                                                     network_id=net.id)
+            subnet_choices = neutron.subnet_list(request,
+                                                 network_id=net.id)
             self.fields[subnet_field_name].choices = [
                 (choice.id, choice.name_or_id)
                 for choice in subnet_choices]
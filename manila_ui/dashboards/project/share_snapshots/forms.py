@@ -17,15 +17,28 @@
 Views for managing share snapshots.
 """
 
+import logging
+import re
+
 from django.forms import ValidationError
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from horizon import exceptions
 from horizon import forms
 from horizon import messages
+from oslo_utils import timeutils
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
 from manila_ui.dashboards import utils
+from manila_ui import exceptions as manila_exceptions
+
+LOG = logging.getLogger(__name__)
+
+SNAPSHOT_NAME_MAX_LENGTH = 255
+SNAPSHOT_NAME_DATE_FORMAT = '%Y%m%d%H%M%S'
+SNAPSHOT_NAME_TOKEN_RE = re.compile(r'\{([^{}]*)\}')
+SNAPSHOT_NAME_TOKENS = ('name', 'id', 'date')
 
 
 class CreateShareSnapshotForm(forms.SelfHandlingForm):
@@ -72,6 +85,173 @@ class CreateShareSnapshotForm(forms.SelfHandlingForm):
                               redirect=redirect)
 
 
+def is_snapshot_allowed(share):
+    # NOTE: shares without the 'snapshot_support' attribute predate it and
+    # support snapshots.
+    return (share.status in ("available", "in-use") and
+            getattr(share, 'snapshot_support', True) is not False)
+
+
+def format_snapshot_name(name_template, share, date):
+    # NOTE: tokens are replaced as plain strings rather than with
+    # str.format(), which would let the template pad the name to any width
+    # or read attributes of the values.
+    values = {'name': share.name or share.id, 'id': share.id, 'date': date}
+    return SNAPSHOT_NAME_TOKEN_RE.sub(
+        lambda match: values.get(match.group(1), match.group(0)),
+        name_template)
+
+
+class CreateShareSnapshotsForm(forms.SelfHandlingForm):
+    name_template = forms.CharField(
+        max_length="255", label=_("Share Snapshot Name"),
+        initial="{name}-{date}",
+        help_text=_("Name of the snapshot of every share, where {name} is "
+                    "replaced by the name of the share, {id} by its ID and "
+                    "{date} by the current UTC date and time."))
+    description = forms.CharField(
+        widget=forms.Textarea,
+        label=_("Description"), required=False)
+    metadata = forms.CharField(
+        label=_("Metadata"), required=False,
+        widget=forms.Textarea(attrs={'rows': 4}))
+    share_ids = forms.MultipleChoiceField(widget=forms.MultipleHiddenInput)
+
+    def __init__(self, request, *args, **kwargs):
+        super(CreateShareSnapshotsForm, self).__init__(
+            request, *args, **kwargs)
+        if self.is_bound:
+            share_ids = self.data.getlist('share_ids')
+        else:
+            share_ids = self.initial.get('share_ids', [])
+        results = parallel.call_parallel(*[
+            (utils.get_share, [request, share_id]) for share_id in share_ids])
+        self.shares = []
+        # Selected shares that cannot be snapshotted, shown to the user.
+        self.skipped = []
+        # IDs of the selected shares that do not exist, reported as errors.
+        self.not_found = []
+        for share_id, result in zip(share_ids, results):
+            try:
+                share = result.result()
+            except manila_exceptions.NOT_FOUND:
+                self.not_found.append(share_id)
+                continue
+            except Exception:
+                exceptions.handle(
+                    request, _('Unable to retrieve share "%s".') % share_id,
+                    redirect=reverse("horizon:project:shares:index"))
+            if is_snapshot_allowed(share):
+                self.shares.append(share)
+            else:
+                self.skipped.append(share.name or share.id)
+        self.fields['share_ids'].choices = [
+            (share_id, share_id) for share_id in
+            [share.id for share in self.shares] + self.not_found]
+        self.initial['share_ids'] = [share.id for share in self.shares]
+
+    def clean_name_template(self):
+        name_template = self.cleaned_data['name_template']
+        if any(token not in SNAPSHOT_NAME_TOKENS for token in
+               SNAPSHOT_NAME_TOKEN_RE.findall(name_template)):
+            raise ValidationError(
+                _("Only {name}, {id} and {date} can be used in the name."))
+        return name_template
+
+    def clean(self):
+        cleaned_data = super(CreateShareSnapshotsForm, self).clean()
+        # NOTE: the date is set once, so that the names checked here are the
+        # names the snapshots are created with.
+        cleaned_data['date'] = timeutils.utcnow().strftime(
+            SNAPSHOT_NAME_DATE_FORMAT)
+        shares = [share for share in self.shares
+                  if share.id in cleaned_data.get('share_ids', [])]
+        if not shares:
+            return cleaned_data
+        name_template = cleaned_data.get('name_template')
+        if name_template:
+            too_long = [
+                share.name or share.id for share in shares
+                if len(format_snapshot_name(
+                    name_template, share, cleaned_data['date'])) >
+                SNAPSHOT_NAME_MAX_LENGTH]
+            if too_long:
+                raise ValidationError(
+                    _("The snapshot names of these shares would be longer "
+                      "than %(max)s characters: %(shares)s") % {
+                        'max': SNAPSHOT_NAME_MAX_LENGTH,
+                        'shares': ', '.join(too_long)})
+        try:
+            usages = manila.tenant_absolute_limits(self.request)
+        except Exception:
+            raise ValidationError(_("Unable to retrieve quotas."))
+        # NOTE: negative limits are unlimited.
+        available = usages['maxTotalShareSnapshots']
+        if 0 <= available and (
+                available - usages['totalShareSnapshotsUsed'] < len(shares)):
+            raise ValidationError(
+                _("The snapshot quota allows %(available)s more snapshots, "
+                  "%(required)s requested.") % {
+                    'available': max(
+                        0, available - usages['totalShareSnapshotsUsed']),
+                    'required': len(shares)})
+        available = usages['maxTotalSnapshotGigabytes']
+        required = sum(share.size for share in shares)
+        if 0 <= available and (
+                available - usages['totalSnapshotGigabytesUsed'] < required):
+            raise ValidationError(
+                _("The snapshot quota allows %(available)s more GiB, "
+                  "%(required)s GiB requested.") % {
+                    'available': max(
+                        0, available - usages['totalSnapshotGigabytesUsed']),
+                    'required': required})
+        return cleaned_data
+
+    def handle(self, request, data):
+        try:
+            set_dict, unset_list = utils.parse_str_meta(data['metadata'])
+            if unset_list:
+                msg = _("Expected only pairs of key=value.")
+                raise ValidationError(message=msg)
+        except ValidationError as e:
+            self.api_error(e.messages[0])
+            return False
+        shares = [share for share in self.shares
+                  if share.id in data['share_ids']]
+        names = [format_snapshot_name(data['name_template'], share,
+                                      data['date'])
+                 for share in shares]
+        results = parallel.call_parallel(*[
+            (manila.share_snapshot_create, [request, share.id],
+             {'name': name, 'description': data['description'],
+              'metadata': set_dict})
+            for share, name in zip(shares, names)])
+        created = []
+        failed = []
+        for share, name, result in zip(shares, names, results):
+            try:
+                result.result()
+                created.append(name)
+            except Exception as e:
+                LOG.warning('Unable to create snapshot of share "%(share)s": '
+                            '%(error)s', {'share': share.id, 'error': e})
+                failed.append(share.name or share.id)
+        not_found = [share_id for share_id in self.not_found
+                     if share_id in data['share_ids']]
+        if not_found:
+            messages.error(request, _('Unable to find shares: %s') %
+                           ', '.join(not_found))
+        if failed:
+            messages.error(request,
+                           _('Unable to create snapshots of shares: %s') %
+                           ', '.join(failed))
+        if created:
+            messages.success(request,
+                             _('Creating share snapshots: %s') %
+                             ', '.join(created))
+        return True
+
+
 class UpdateShareSnapshotForm(forms.SelfHandlingForm):
     name = forms.CharField(max_length="255", label=_("Share Snapshot Name"))
     description = forms.CharField(
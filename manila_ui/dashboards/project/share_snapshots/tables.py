@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from django import shortcuts
 from django.template.defaultfilters import title
 from django.urls import reverse
 from django.utils.http import urlencode
@@ -23,21 +24,40 @@ from horizon import exceptions
 from horizon import tables
 
 from manila_ui.api import manila
+from manila_ui.dashboards import batch
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
+from manila_ui.dashboards import polling
 from manila_ui.dashboards import utils as project_utils
 
 
 DELETABLE_STATES = ("available", "error")
 
 
-class UpdateShareSnapshotRow(tables.Row):
+class UpdateShareSnapshotRow(polling.BulkUpdateRowMixin, tables.Row):
     ajax = True
 
     def get_data(self, request, snapshot_id):
         snapshot = manila.share_snapshot_get(request, snapshot_id)
         if not snapshot.name:
             snapshot.name = snapshot_id
+        snapshot.mount_snapshot_support = None
         return snapshot
 
+    def get_bulk_data(self, request, snapshot_ids):
+        snapshots, deleted_ids = polling.get_by_ids(
+            manila.share_snapshot_get, request, snapshot_ids)
+        shares = project_utils.get_shares(
+            request, [snapshot.share_id for snapshot in snapshots])
+        for snapshot in snapshots:
+            if not snapshot.name:
+                snapshot.name = snapshot.id
+            share = shares.get(snapshot.share_id)
+            snapshot.share = share and (share.name or share.id)
+            snapshot.mount_snapshot_support = getattr(
+                share, 'mount_snapshot_support', False)
+        return snapshots, deleted_ids
+
 
 def get_size(snapshot):
     return _("%sGiB") % snapshot.size
@@ -86,8 +106,24 @@ class CreateShareSnapshot(tables.LinkAction):
         return share.status in ("available", "in-use") and snapshot_support
 
 
-class DeleteShareSnapshot(tables.DeleteAction):
+class CreateShareSnapshots(tables.Action):
+    """Opens the form creating a snapshot of every selected share."""
+    name = "create_share_snapshots"
+    verbose_name = _("Snapshot Selected")
+    url = "horizon:project:share_snapshots:share_snapshots_create"
+    icon = "camera"
+    policy_rules = (("share", "share:create_snapshot"),)
+
+    def handle(self, data_table, request, object_ids):
+        query = urlencode({'share_id': object_ids}, doseq=True)
+        return shortcuts.redirect("%s?%s" % (reverse(self.url), query))
+
+
+class DeleteShareSnapshot(batch.ParallelBatchActionMixin,
+                          tables.DeleteAction):
     policy_rules = (("share", "share:delete_snapshot"),)
+    failure_message = _('Unable to delete snapshot "%s". One or more shares '
+                        'depend on it.')
 
     @staticmethod
     def action_present(count):
@@ -112,15 +148,7 @@ class DeleteShareSnapshot(tables.DeleteAction):
         return {"project_id": project_id}
 
     def delete(self, request, obj_id):
-        obj = self.table.get_object_by_id(obj_id)
-        name = self.table.get_object_display(obj)
-        try:
-            manila.share_snapshot_delete(request, obj_id)
-        except Exception:
-            msg = _('Unable to delete snapshot "%s". One or more shares '
-                    'depend on it.')
-            exceptions.handle(self.request, msg % name)
-            raise
+        manila.share_snapshot_delete(request, obj_id)
 
     def allowed(self, request, snapshot=None):
         if snapshot:
@@ -165,8 +193,12 @@ class ManageShareSnapshotRules(tables.LinkAction):
     policy_rules = (("share", "share:access_get_all"),)
 
     def allowed(self, request, snapshot=None):
-        share = manila.share_get(request, snapshot.share_id)
-        return share.mount_snapshot_support
+        # NOTE: views set 'mount_snapshot_support' for all rows at once, the
+        # share is only fetched for rows loaded one by one.
+        if getattr(snapshot, 'mount_snapshot_support', None) is None:
+            share = project_utils.get_share(request, snapshot.share_id)
+            snapshot.mount_snapshot_support = share.mount_snapshot_support
+        return snapshot.mount_snapshot_support
 
 
 class AddShareSnapshotRule(tables.LinkAction):
@@ -178,8 +210,10 @@ class AddShareSnapshotRule(tables.LinkAction):
     policy_rules = (("share", "share:allow_access"),)
 
     def allowed(self, request, snapshot=None):
-        snapshot = manila.share_snapshot_get(
-            request, self.table.kwargs['snapshot_id'])
+        snapshot = self.table.kwargs.get('snapshot')
+        if snapshot is None:
+            snapshot = manila.share_snapshot_get(
+                request, self.table.kwargs['snapshot_id'])
         return snapshot.status in ("available", "in-use")
 
     def get_link_url(self):
@@ -267,7 +301,18 @@ def get_metadata(snapshot):
     return project_utils.metadata_to_str(meta)
 
 
-class ShareSnapshotsTable(tables.DataTable):
+class ShareSnapshotsFilterAction(filtering.ServerFilterAction):
+    api_params = {'description': 'description~'}
+    filter_choices = (
+        ('name', _("Name"), True),
+        ('name~', _("Name contains"), True),
+        ('description', _("Description contains"), True),
+        ('status', _("Status"), True),
+    )
+
+
+class ShareSnapshotsTable(pagination.PagedTableMixin,
+                          polling.BulkUpdateTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("in-use", True),
         ("available", True),
@@ -306,6 +351,7 @@ class ShareSnapshotsTable(tables.DataTable):
         "share",
         verbose_name=_("Source"),
         link="horizon:project:shares:detail")
+    sort_keys = {'name': 'name', 'size': 'size', 'status': 'status'}
 
     def get_object_display(self, obj):
         return obj.name
@@ -316,7 +362,7 @@ class ShareSnapshotsTable(tables.DataTable):
         status_columns = ["status"]
         row_class = UpdateShareSnapshotRow
         table_actions = (
-            tables.NameFilterAction,
+            ShareSnapshotsFilterAction,
             DeleteShareSnapshot,
         )
         row_actions = (
@@ -14,6 +14,8 @@
 from django.utils.translation import gettext_lazy as _
 from horizon import tabs
 
+from manila_ui.dashboards import data_context
+
 
 class ShareSnapshotOverviewTab(tabs.Tab):
     name = _("Share Snapshot Overview")
@@ -21,10 +23,10 @@ class ShareSnapshotOverviewTab(tabs.Tab):
     template_name = "project/share_snapshots/_detail.html"
 
     def get_context_data(self, request):
-        return {"snapshot": self.tab_group.kwargs['snapshot']}
+        return {"snapshot": self.tab_group.data_context['snapshot']}
 
 
-class ShareSnapshotDetailTabs(tabs.TabGroup):
+class ShareSnapshotDetailTabs(data_context.DataContextMixin, tabs.TabGroup):
     slug = "share_snapshot_details"
     tabs = (
         ShareSnapshotOverviewTab,
@@ -26,6 +26,10 @@ urlpatterns = [
         r'^(?P<share_id>[^/]+)/share_snapshot_create/$',
         views.CreateShareSnapshotView.as_view(),
         name='share_snapshot_create'),
+    re_path(
+        r'^share_snapshots_create/$',
+        views.CreateShareSnapshotsView.as_view(),
+        name='share_snapshots_create'),
     re_path(
         r'^(?P<snapshot_id>[^/]+)/share_snapshot_edit/$',
         views.UpdateShareSnapshotView.as_view(),
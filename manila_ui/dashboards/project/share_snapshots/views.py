@@ -22,13 +22,17 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.share_snapshots import forms as ss_forms
 from manila_ui.dashboards.project.share_snapshots import tables as ss_tables
 from manila_ui.dashboards.project.share_snapshots import tabs as ss_tabs
 from manila_ui.dashboards import utils as ui_utils
 
 
-class ShareSnapshotsView(tables.MultiTableView):
+class ShareSnapshotsView(filtering.ServerFilterViewMixin,
+                         pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         ss_tables.ShareSnapshotsTable,
     )
@@ -38,12 +42,17 @@ class ShareSnapshotsView(tables.MultiTableView):
     @memoized.memoized_method
     def get_share_snapshots_data(self):
         try:
-            snapshots = manila.share_snapshot_list(self.request)
-            shares = manila.share_list(self.request)
-            share_names = dict([(share.id, share.name or share.id)
-                                for share in shares])
+            snapshots = self.paginate(
+                manila.share_snapshot_list, filter_table='share_snapshots')
+            shares = ui_utils.get_shares(
+                self.request, [snapshot.share_id for snapshot in snapshots])
             for snapshot in snapshots:
-                snapshot.share = share_names.get(snapshot.share_id)
+                share = shares.get(snapshot.share_id)
+                snapshot.share = share and (share.name or share.id)
+                # NOTE: row actions check the share of every row, so it is
+                # resolved here once for the whole table.
+                snapshot.mount_snapshot_support = getattr(
+                    share, 'mount_snapshot_support', False)
         except Exception:
             msg = _("Unable to retrieve share snapshots list.")
             exceptions.handle(self.request, msg)
@@ -52,6 +61,29 @@ class ShareSnapshotsView(tables.MultiTableView):
         return snapshots
 
 
+def get_snapshot_details(request, snapshot_id):
+    """Returns a snapshot with the details shown by its detail view.
+
+    The parent share is fetched once per request, and the rules and export
+    locations of snapshots of shares supporting mounting snapshots are
+    fetched concurrently.
+    """
+    snapshot = manila.share_snapshot_get(request, snapshot_id)
+    share = ui_utils.get_share(request, snapshot.share_id)
+    snapshot.share_name_or_id = share.name or share.id
+    snapshot.mount_snapshot_support = share.mount_snapshot_support
+    if share.mount_snapshot_support:
+        rules, export_locations = parallel.call_parallel(
+            (manila.share_snapshot_rules_list, [request, snapshot_id]),
+            (manila.share_snap_export_location_list, [request, snapshot]),
+        )
+        snapshot.rules = rules.result()
+        snapshot.export_locations = export_locations.result()
+        snapshot.el_size = ui_utils.calculate_longest_str_size(
+            [exp['path'] for exp in snapshot.export_locations])
+    return snapshot
+
+
 class ShareSnapshotDetailView(tabs.TabView):
     tab_group_class = ss_tabs.ShareSnapshotDetailTabs
     template_name = 'project/share_snapshots/detail.html'
@@ -72,32 +104,19 @@ class ShareSnapshotDetailView(tabs.TabView):
     @memoized.memoized_method
     def get_data(self):
         try:
-            snapshot_id = self.kwargs['snapshot_id']
-            snapshot = manila.share_snapshot_get(self.request, snapshot_id)
-            share = manila.share_get(self.request, snapshot.share_id)
-            if share.mount_snapshot_support:
-                snapshot.rules = manila.share_snapshot_rules_list(
-                    self.request, snapshot_id)
-                snapshot.export_locations = (
-                    manila.share_snap_export_location_list(
-                        self.request, snapshot))
-                export_locations = [
-                    exp['path'] for exp in snapshot.export_locations
-                ]
-                snapshot.el_size = ui_utils.calculate_longest_str_size(
-                    export_locations)
-
-            snapshot.share_name_or_id = share.name or share.id
+            return get_snapshot_details(
+                self.request, self.kwargs['snapshot_id'])
         except Exception:
             exceptions.handle(
                 self.request,
                 _('Unable to retrieve snapshot details.'),
                 redirect=self.redirect_url)
-        return snapshot
 
     def get_tabs(self, request, *args, **kwargs):
         snapshot = self.get_data()
-        return self.tab_group_class(request, snapshot=snapshot, **kwargs)
+        return self.tab_group_class(
+            request, snapshot=snapshot,
+            share=ui_utils.get_share(request, snapshot.share_id), **kwargs)
 
 
 class CreateShareSnapshotView(forms.ModalFormView):
@@ -127,6 +146,22 @@ class CreateShareSnapshotView(forms.ModalFormView):
         return {'share_id': self.kwargs["share_id"]}
 
 
+class CreateShareSnapshotsView(forms.ModalFormView):
+    form_class = ss_forms.CreateShareSnapshotsForm
+    form_id = "create_share_snapshots"
+    template_name = 'project/share_snapshots/create_snapshots.html'
+    modal_header = _("Create Share Snapshots")
+    modal_id = "create_share_snapshots_modal"
+    submit_label = _("Create Share Snapshots")
+    submit_url = reverse_lazy(
+        "horizon:project:share_snapshots:share_snapshots_create")
+    success_url = reverse_lazy('horizon:project:share_snapshots:index')
+    page_title = _('Create Share Snapshots')
+
+    def get_initial(self):
+        return {'share_ids': self.request.GET.getlist('share_id')}
+
+
 class UpdateShareSnapshotView(forms.ModalFormView):
     form_class = ss_forms.UpdateShareSnapshotForm
     form_id = "update_share_snapshot"
@@ -210,8 +245,7 @@ class ManageShareSnapshotRulesView(tables.DataTableView):
 
     def get_context_data(self, **kwargs):
         context = super(self.__class__, self).get_context_data(**kwargs)
-        snapshot = manila.share_snapshot_get(
-            self.request, self.kwargs['snapshot_id'])
+        snapshot = self.get_snapshot()
         context['snapshot_display_name'] = snapshot.name or snapshot.id
         context["snapshot"] = self.get_data()
         context["page_title"] = _("Snapshot Rules: "
@@ -219,6 +253,11 @@ class ManageShareSnapshotRulesView(tables.DataTableView):
             'snapshot_display_name': context['snapshot_display_name']}
         return context
 
+    @memoized.memoized_method
+    def get_snapshot(self):
+        return manila.share_snapshot_get(
+            self.request, self.kwargs['snapshot_id'])
+
     @memoized.memoized_method
     def get_data(self):
         try:
@@ -231,6 +270,9 @@ class ManageShareSnapshotRulesView(tables.DataTableView):
                 self.request,
                 _('Unable to retrieve share snapshot rules.'),
                 redirect=redirect)
+        # NOTE: table actions check the snapshot, hand it to the table to
+        # not fetch it again.
+        self.table.kwargs['snapshot'] = self.get_snapshot()
         return rules
 
 
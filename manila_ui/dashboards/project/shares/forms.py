@@ -13,6 +13,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import ipaddress
+import logging
+
 from django.conf import settings
 from django.forms import ValidationError
 from django.urls import reverse
@@ -23,11 +27,49 @@ from horizon import messages
 from horizon.utils.memoized import memoized
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
 from manila_ui.dashboards import utils
 from manila_ui import features
 from manilaclient.common.apiclient import exceptions as m_exceptions
 import time
 
+LOG = logging.getLogger(__name__)
+
+
+def get_share_network_choices(request):
+    return [(sn.id, sn.name or sn.id)
+            for sn in manila.share_network_list(request)]
+
+
+def get_share_group_choices(request):
+    return [("", "")] + [(sg.id, sg.name or sg.id)
+                         for sg in manila.share_group_list(request)]
+
+
+def get_snapshot_choices(request):
+    snapshots = manila.share_snapshot_list(
+        request, search_opts={'status': 'available'})
+    return [('', _("Choose a snapshot"))] + [(s.id, s) for s in snapshots]
+
+
+def has_available_snapshots(request):
+    return bool(manila.share_snapshot_list(
+        request, detailed=False, search_opts={'status': 'available'},
+        limit=1))
+
+
+# Choices of the Create Share form loaded by the browser, with the functions
+# listing them.
+LAZY_CHOICES = collections.OrderedDict([
+    ('share_networks', get_share_network_choices),
+    ('share_groups', get_share_group_choices),
+    ('snapshots', get_snapshot_choices),
+])
+
+
+def get_choices_url(kind):
+    return reverse("horizon:project:shares:create_choices", args=(kind,))
+
 
 class CreateForm(forms.SelfHandlingForm):
     name = forms.CharField(max_length="255", label=_("Share Name"))
@@ -55,23 +97,45 @@ class CreateForm(forms.SelfHandlingForm):
             ['NFS', 'CIFS', 'GlusterFS', 'HDFS', 'CephFS', 'MapRFS'])
         self.enable_public_shares = manila_features.get(
             'enable_public_shares', True)
-        share_networks = manila.share_network_list(request)
-        share_types = manila.share_type_list(request)
+        share_groups_enabled = features.is_share_groups_enabled()
+        # NOTE: the form is shown without the choices of share networks,
+        # share groups and snapshots, which are loaded from the
+        # 'create_choices' view by the browser. They are only needed to
+        # validate a submitted form.
+        lazy_kinds = []
+        if self.is_bound:
+            lazy_kinds.append('share_networks')
+            if share_groups_enabled:
+                lazy_kinds.append('share_groups')
+        # NOTE: "Snapshot" is only offered as the source of a new share when
+        # there is a snapshot to choose, which is checked with one snapshot
+        # lookup.
+        check_snapshots = not (self.is_bound or "snapshot_id" in request.GET)
+        calls = [
+            (manila.share_type_list, [request]),
+            (manila.availability_zone_list, [request]),
+        ] + [(LAZY_CHOICES[kind], [request]) for kind in lazy_kinds]
+        if check_snapshots:
+            calls.append((has_available_snapshots, [request]))
+        calls = parallel.call_parallel(*calls)
+        if check_snapshots:
+            snapshots_call = calls.pop()
+        results = [call.result() for call in calls]
+        share_types, availability_zones = results[:2]
+        lazy_choices = dict(zip(lazy_kinds, results[2:]))
         self.fields['share_type'].choices = (
             [(utils.transform_dashed_name(st.name), st.name) for st in
              share_types]
         )
 
-        availability_zones = manila.availability_zone_list(request)
         self.fields['availability_zone'].choices = (
             [("", "")] + [(az.name, az.name) for az in availability_zones])
 
-        if features.is_share_groups_enabled():
-            share_groups = manila.share_group_list(request)
+        if share_groups_enabled:
             self.fields['sg'] = forms.ChoiceField(
                 label=_("Share Group"),
-                choices=[("", "")] + [(sg.id, sg.name or sg.id)
-                                      for sg in share_groups],
+                choices=self._get_lazy_choices(lazy_choices, 'share_groups'),
+                widget=self._get_lazy_widget('share_groups'),
                 required=False)
 
         self.sn_field_name_prefix = 'share-network-choices-'
@@ -81,21 +145,18 @@ class CreateForm(forms.SelfHandlingForm):
             # NOTE(vponomaryov): Set and tie share-network field only for
             # share types with enabled handling of share servers.
             if (isinstance(dhss, str) and dhss.lower() in ['true', '1']):
-                sn_choices = (
-                    [(sn.id, sn.name or sn.id) for sn in share_networks])
-                sn_field_name = (
-                    self.sn_field_name_prefix +
-                    utils.transform_dashed_name(st.name)
-                )
+                st_slug = utils.transform_dashed_name(st.name)
+                sn_field_name = self.sn_field_name_prefix + st_slug
                 sn_field = forms.ChoiceField(
                     label=_("Share Network"), required=True,
-                    choices=sn_choices,
-                    widget=forms.Select(attrs={
-                        'class': 'switched',
-                        'data-switch-on': 'sharetype',
-                        'data-sharetype-%s' % utils.transform_dashed_name(
-                            st.name): _("Share Network"),
-                    }))
+                    choices=self._get_lazy_choices(
+                        lazy_choices, 'share_networks'),
+                    widget=self._get_lazy_widget(
+                        'share_networks', attrs={
+                            'class': 'switched',
+                            'data-switch-on': 'sharetype',
+                            'data-sharetype-%s' % st_slug: _("Share Network"),
+                        }))
                 self.fields[sn_field_name] = sn_field
 
         self.fields['share_source_type'] = forms.ChoiceField(
@@ -148,32 +209,42 @@ class CreateForm(forms.SelfHandlingForm):
             except Exception:
                 exceptions.handle(request,
                                   _('Unable to load the specified snapshot.'))
+        elif check_snapshots and not self._has_snapshots(snapshots_call):
+            del self.fields['share_source_type']
+            del self.fields['snapshot']
         else:
-            source_type_choices = []
+            # NOTE: snapshots are only listed once "Snapshot" is chosen as
+            # the source of the share.
+            self.fields['share_source_type'].choices = [
+                ('no_source_type', _("No source, empty share")),
+                ('snapshot', _("Snapshot")),
+            ]
+            self.fields['snapshot'].choices = [('', _("Choose a snapshot"))]
+            if not self.is_bound:
+                self.fields['snapshot'].widget.attrs.update({
+                    'data-choices-url': get_choices_url('snapshots'),
+                    'data-choices-on': '#id_share_source_type',
+                    'data-choices-value': 'snapshot',
+                })
+
+    def _has_snapshots(self, snapshots_call):
+        try:
+            return snapshots_call.result()
+        except Exception:
+            exceptions.handle(self.request,
+                              _("Unable to retrieve share snapshots."))
+            return False
 
-            try:
-                snapshot_list = manila.share_snapshot_list(request)
-                snapshots = [s for s in snapshot_list
-                             if s.status == 'available']
-                if snapshots:
-                    source_type_choices.append(("snapshot",
-                                                _("Snapshot")))
-                    choices = [('', _("Choose a snapshot"))] + \
-                              [(s.id, s) for s in snapshots]
-                    self.fields['snapshot'].choices = choices
-                else:
-                    del self.fields['snapshot']
-            except Exception:
-                exceptions.handle(request, _("Unable to retrieve "
-                                             "share snapshots."))
-
-            if source_type_choices:
-                choices = ([('no_source_type',
-                             _("No source, empty share"))] +
-                           source_type_choices)
-                self.fields['share_source_type'].choices = choices
-            else:
-                del self.fields['share_source_type']
+    def _get_lazy_choices(self, lazy_choices, kind):
+        if kind in lazy_choices:
+            return lazy_choices[kind]
+        return [('', _("Loading..."))]
+
+    def _get_lazy_widget(self, kind, attrs=None):
+        attrs = dict(attrs or {})
+        if not self.is_bound:
+            attrs['data-choices-url'] = get_choices_url(kind)
+        return forms.Select(attrs=attrs)
 
     def clean(self):
         cleaned_data = super(CreateForm, self).clean()
@@ -365,6 +436,119 @@ class AddRule(forms.SelfHandlingForm):
                 request, _('Unable to add rule.'), redirect=redirect)
 
 
+def get_rule_key(access_type, access_to):
+    """Returns the key telling whether two access rules grant the same."""
+    if access_type == 'ip':
+        try:
+            return access_type, ipaddress.ip_network(access_to, strict=False)
+        except ValueError:
+            pass
+    return access_type, access_to
+
+
+class AddRules(AddRule):
+    # Entries of other access types, e.g. the distinguished names of 'cert'
+    # rules, may contain commas.
+    comma_separated_access_types = ('ip', 'user')
+
+    access_to = forms.CharField(
+        label=_("Access To"), required=True,
+        widget=forms.Textarea(attrs={'rows': 8}),
+        help_text=_("One entry per line, e.g. IP addresses or CIDRs for the "
+                    "'ip' access type. Entries of the 'ip' and 'user' access "
+                    "types may also be separated by commas."))
+
+    def clean(self):
+        cleaned_data = super(AddRules, self).clean()
+        access_type = cleaned_data.get('access_type')
+        access_to = cleaned_data.get('access_to')
+        if not access_type or not access_to:
+            return cleaned_data
+        entries = []
+        keys = set()
+        invalid = []
+        if access_type in self.comma_separated_access_types:
+            access_to = access_to.replace(',', '\n')
+        for entry in access_to.splitlines():
+            entry = entry.strip()
+            if not entry:
+                continue
+            if len(entry) > 255:
+                invalid.append(entry[:32] + '...')
+                continue
+            if access_type == 'ip':
+                try:
+                    ipaddress.ip_network(entry, strict=True)
+                except ValueError:
+                    invalid.append(entry)
+                    continue
+            key = get_rule_key(access_type, entry)
+            if key not in keys:
+                keys.add(key)
+                entries.append(entry)
+        if invalid:
+            self.add_error('access_to', _("Invalid entries: %s") %
+                           ', '.join(invalid))
+        elif not entries:
+            self.add_error('access_to', _("No entry was given."))
+        cleaned_data['entries'] = entries
+        return cleaned_data
+
+    def handle(self, request, data):
+        share_id = self.initial['share_id']
+        redirect = reverse("horizon:project:shares:manage_rules",
+                           args=[share_id])
+        try:
+            set_dict, unset_list = utils.parse_str_meta(data['metadata'])
+            if unset_list:
+                msg = _("Expected only pairs of key=value.")
+                raise ValidationError(message=msg)
+        except ValidationError as e:
+            self.api_error(e.messages[0])
+            return False
+        try:
+            existing = set(
+                get_rule_key(rule.access_type, rule.access_to)
+                for rule in manila.share_rules_list(request, share_id))
+        except Exception:
+            exceptions.handle(request, _('Unable to retrieve share rules.'),
+                              redirect=redirect)
+        entries = []
+        skipped = []
+        for entry in data['entries']:
+            if get_rule_key(data['access_type'], entry) in existing:
+                skipped.append(entry)
+            else:
+                entries.append(entry)
+
+        results = parallel.call_parallel(*[
+            (manila.share_allow, [request, share_id],
+             {'access_to': entry, 'access_type': data['access_type'],
+              'access_level': data['access_level'], 'metadata': set_dict})
+            for entry in entries])
+        created = []
+        failed = []
+        for entry, result in zip(entries, results):
+            try:
+                result.result()
+                created.append(entry)
+            except Exception as e:
+                LOG.warning('Unable to add rule for "%(entry)s": %(error)s',
+                            {'entry': entry, 'error': e})
+                failed.append(entry)
+
+        if skipped:
+            messages.info(request, _('Rules exist already for: %s') %
+                          ', '.join(skipped))
+        if failed:
+            messages.error(request, _('Unable to add rules for: %s') %
+                           ', '.join(failed))
+        if created:
+            messages.success(request, _('Creating rules for: %s') %
+                             ', '.join(created))
+        return True
+
+
 class UpdateRuleMetadataForm(forms.SelfHandlingForm):
     metadata = forms.CharField(widget=forms.Textarea,
                                label=_("Metadata"), required=False)
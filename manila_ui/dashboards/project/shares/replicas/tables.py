@@ -46,7 +46,9 @@ class CreateReplica(tables.LinkAction):
     policy_rules = (("share", "share:create_replica"),)
 
     def allowed(self, request, datum=None):
-        share = manila.share_get(request, self.table.kwargs['share_id'])
+        share = self.table.kwargs.get('share')
+        if share is None:
+            share = manila.share_get(request, self.table.kwargs['share_id'])
         return share.replication_type is not None
 
     def get_policy_target(self, request, datum=None):
@@ -105,8 +107,13 @@ class DeleteReplica(tables.DeleteAction):
 
     def allowed(self, request, replica=None):
         if replica:
-            share = manila.share_get(request, replica.share_id)
-            replicas = manila.share_replica_list(request, replica.share_id)
+            share = self.table.kwargs.get('share')
+            if share is None:
+                share = manila.share_get(request, replica.share_id)
+            replicas = self.table.kwargs.get('replicas')
+            if replicas is None:
+                replicas = manila.share_replica_list(
+                    request, replica.share_id)
             if share.replication_type is None:
                 return False
             elif (share.replication_type == 'writable' and
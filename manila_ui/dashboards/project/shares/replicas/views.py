@@ -38,32 +38,40 @@ class ManageReplicasView(tables.DataTableView):
 
     def get_context_data(self, **kwargs):
         context = super(ManageReplicasView, self).get_context_data(**kwargs)
+        share = self.get_share()
+        context["share_display_name"] = share.name or share.id
+        context["share"] = self.get_data()
+        context["page_title"] = _(
+            "Share Replicas: %(share_display_name)s") % {
+                "share_display_name": context["share_display_name"]}
+        return context
+
+    @memoized.memoized_method
+    def get_share(self):
         try:
-            share = manila.share_get(self.request, self.kwargs["share_id"])
+            return manila.share_get(self.request, self.kwargs["share_id"])
         except Exception:
             redirect = reverse(self._redirect_url)
             exceptions.handle(
                 self.request,
                 _('Unable to retrieve share %s.') % self.kwargs["share_id"],
                 redirect=redirect)
-        context["share_display_name"] = share.name or share.id
-        context["share"] = self.get_data()
-        context["page_title"] = _(
-            "Share Replicas: %(share_display_name)s") % {
-                "share_display_name": context["share_display_name"]}
-        return context
 
     @memoized.memoized_method
     def get_data(self):
         try:
             share_id = self.kwargs['share_id']
-            return manila.share_replica_list(self.request, share_id)
+            replicas = manila.share_replica_list(self.request, share_id)
         except Exception:
             redirect = reverse(self._redirect_url)
             exceptions.handle(
                 self.request,
                 _('Unable to retrieve share replicas.'),
                 redirect=redirect)
+        # NOTE: row actions check the share and its replicas, hand them to
+        # the table to not fetch them again for every row.
+        self.table.kwargs.update(share=self.get_share(), replicas=replicas)
+        return replicas
 
 
 class DetailReplicaView(tabs.TabView):
@@ -18,12 +18,14 @@ from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 from django.utils.translation import pgettext_lazy
-from horizon import exceptions
-from horizon import messages
 from horizon import tables
 from horizon.utils import filters
 
 from manila_ui.api import manila
+from manila_ui.dashboards import batch
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
+from manila_ui.dashboards import polling
 from manila_ui.dashboards.project.share_snapshots import tables as ss_tables
 from manila_ui.dashboards import utils
 from manila_ui import features
@@ -35,7 +37,7 @@ DELETABLE_STATES = (
 )
 
 
-class DeleteShare(tables.DeleteAction):
+class DeleteShare(batch.ParallelBatchActionMixin, tables.DeleteAction):
     policy_rules = (("share", "share:delete"),)
 
     @staticmethod
@@ -61,13 +63,10 @@ class DeleteShare(tables.DeleteAction):
         return {"project_id": project_id}
 
     def delete(self, request, obj_id):
-        share = manila.share_get(request, obj_id)
-        try:
-            manila.share_delete(
-                request, share.id, share_group_id=share.share_group_id)
-        except Exception:
-            msg = _('Unable to delete share "%s".') % obj_id
-            messages.error(request, msg)
+        share = self.get_datum(obj_id) or manila.share_get(request, obj_id)
+        manila.share_delete(
+            request, obj_id,
+            share_group_id=getattr(share, 'share_group_id', None))
 
     def allowed(self, request, share=None):
         if share:
@@ -179,7 +178,7 @@ class RevertShare(tables.LinkAction):
         )
 
 
-class UpdateRow(tables.Row):
+class UpdateRow(polling.BulkUpdateRowMixin, tables.Row):
     ajax = True
 
     def get_data(self, request, share_id):
@@ -192,16 +191,33 @@ class UpdateRow(tables.Row):
             share.share_network = share_net.name or share_net.id
         else:
             share.share_network = None
-        share.metadata = utils.metadata_to_str(share.metadata)
 
         return share
 
+    def get_bulk_data(self, request, share_ids):
+        shares, deleted_ids = polling.get_by_ids(
+            manila.share_get, request, share_ids)
+        share_nets, __ = polling.get_by_ids(
+            manila.share_network_get, request,
+            [share.share_network_id for share in shares
+             if share.share_network_id])
+        share_nets_names = dict(
+            (share_net.id, share_net.name) for share_net in share_nets)
+        for share in shares:
+            if not share.name:
+                share.name = share.id
+            share.share_network = (
+                share_nets_names.get(share.share_network_id) or
+                share.share_network_id)
+        return shares, deleted_ids
+
 
 def get_size(share):
     return _("%sGiB") % share.size
 
 
-class SharesTableBase(tables.DataTable):
+class SharesTableBase(pagination.PagedTableMixin,
+                      polling.BulkUpdateTableMixin, tables.DataTable):
     STATUS_CHOICES = (
         ("available", True), ("AVAILABLE", True),
         ("creating", None), ("CREATING", None),
@@ -253,7 +269,8 @@ class SharesTableBase(tables.DataTable):
                                 verbose_name=_("Description"),
                                 truncate=40)
     metadata = tables.Column("metadata",
-                             verbose_name=_("Metadata"))
+                             verbose_name=_("Metadata"),
+                             filters=(utils.metadata_to_str,))
     size = tables.Column(get_size,
                          verbose_name=_("Size"),
                          attrs={'data-type': 'size'})
@@ -263,6 +280,7 @@ class SharesTableBase(tables.DataTable):
                            status=True,
                            status_choices=STATUS_CHOICES,
                            display_choices=STATUS_DISPLAY_CHOICES)
+    sort_keys = {'name': 'name', 'size': 'size', 'status': 'status'}
 
     def get_object_display(self, obj):
         return obj.name or obj.id
@@ -313,14 +331,22 @@ class AddRule(tables.LinkAction):
     policy_rules = (("share", "share:allow_access"),)
 
     def allowed(self, request, share=None):
-        share = manila.share_get(request, self.table.kwargs['share_id'])
+        share = self.table.kwargs.get('share')
+        if share is None:
+            share = manila.share_get(request, self.table.kwargs['share_id'])
         return share.status in ("available", "in-use")
 
     def get_link_url(self):
         return reverse(self.url, args=[self.table.kwargs['share_id']])
 
 
-class DeleteRule(tables.DeleteAction):
+class AddRules(AddRule):
+    name = "rules_add"
+    verbose_name = _("Add rules")
+    url = 'horizon:project:shares:rules_add'
+
+
+class DeleteRule(batch.ParallelBatchActionMixin, tables.DeleteAction):
     policy_rules = (("share", "share:deny_access"),)
 
     @staticmethod
@@ -340,11 +366,7 @@ class DeleteRule(tables.DeleteAction):
         )
 
     def delete(self, request, obj_id):
-        try:
-            manila.share_deny(request, self.table.kwargs['share_id'], obj_id)
-        except Exception:
-            msg = _('Unable to delete rule "%s".') % obj_id
-            exceptions.handle(request, msg)
+        manila.share_deny(request, self.table.kwargs['share_id'], obj_id)
 
 
 class EditRuleMetadata(tables.LinkAction):
@@ -364,22 +386,27 @@ class EditRuleMetadata(tables.LinkAction):
         return rule.state == "active"
 
 
-class UpdateRuleRow(tables.Row):
+class UpdateRuleRow(polling.BulkUpdateRowMixin, tables.Row):
     ajax = True
 
     def get_data(self, request, rule_id):
-        rule = manila.share_rule_get(request, rule_id)
-        rule.metadata = utils.metadata_to_str(rule.metadata)
-        return rule
+        return manila.share_rule_get(request, rule_id)
+
+    def get_bulk_data(self, request, rule_ids):
+        # NOTE: the rules of a share are never paginated.
+        return polling.filter_by_ids(
+            manila.share_rules_list(request, self.table.kwargs['share_id']),
+            rule_ids)
 
 
-class RulesTable(tables.DataTable):
+class RulesTable(polling.BulkUpdateTableMixin, tables.DataTable):
     access_type = tables.Column("access_type", verbose_name=_("Access Type"))
     access_to = tables.Column("access_to", verbose_name=_("Access to"))
     access_level = tables.Column(
         "access_level", verbose_name=_("Access Level"))
     metadata = tables.Column(
-        "metadata", verbose_name=_("Metadata"))
+        "metadata", verbose_name=_("Metadata"),
+        filters=(utils.metadata_to_str,))
     status = tables.Column("state", verbose_name=_("Status"))
     access_key = tables.Column("access_key", verbose_name=_("Access Key"))
     created_at = tables.Column("created_at", verbose_name=_("Created At"),
@@ -397,6 +424,7 @@ class RulesTable(tables.DataTable):
         row_class = UpdateRuleRow
         table_actions = (
             AddRule,
+            AddRules,
             DeleteRule)
         row_actions = (
             DeleteRule,
@@ -408,6 +436,16 @@ def get_share_network(share):
     return name if name != "None" else None
 
 
+class SharesFilterAction(filtering.ServerFilterAction):
+    api_params = {'description': 'description~'}
+    filter_choices = (
+        ('name', _("Name"), True),
+        ('name~', _("Name contains"), True),
+        ('description', _("Description contains"), True),
+        ('status', _("Status"), True),
+    )
+
+
 class SharesTable(SharesTableBase):
     name = tables.WrappingColumn(
         "name", verbose_name=_("Name"),
@@ -422,6 +460,7 @@ class SharesTable(SharesTableBase):
     share_network = tables.Column("share_network",
                                   verbose_name=_("Share Network"),
                                   empty_value="-")
+    sort_keys = dict(SharesTableBase.sort_keys, proto='share_proto')
 
     class Meta(object):
         name = "shares"
@@ -429,8 +468,9 @@ class SharesTable(SharesTableBase):
         status_columns = ["status"]
         row_class = UpdateRow
         table_actions = (
-            tables.NameFilterAction,
+            SharesFilterAction,
             CreateShare,
+            ss_tables.CreateShareSnapshots,
             DeleteShare)
         row_actions = (
             EditShare,
@@ -15,6 +15,7 @@ from horizon import exceptions
 from horizon import tabs
 
 from manila_ui.api import manila
+from manila_ui.dashboards import data_context
 from manila_ui.dashboards.project.shares import tables as shares_tables
 
 
@@ -24,8 +25,7 @@ class OverviewTab(tabs.Tab):
     template_name = "project/shares/_detail.html"
 
     def get_context_data(self, request):
-        share = self.tab_group.kwargs['share']
-        return {"share": share}
+        return {"share": self.tab_group.data_context['share']}
 
 
 class ExportLocationsTab(tabs.TableTab):
@@ -37,16 +37,10 @@ class ExportLocationsTab(tabs.TableTab):
 
     def get_export_locations_data(self):
         try:
-            share = self.tab_group.kwargs['share']
+            share = self.tab_group.data_context['share']
             self._tables[
                 self.table_classes[0].Meta.name].kwargs['share_id'] = share.id
-            if not hasattr(share, 'export_locations'):
-                try:
-                    share.export_locations = manila.share_export_location_list(
-                        self.request, share.id)
-                except Exception:
-                    share.export_locations = []
-            all_locations = getattr(share, 'export_locations', [])
+            all_locations = self.tab_group.data_context['export_locations']
             filter_string = self.request.GET.get(
                 'export_locations__filter__q', '').strip().lower()
             if filter_string:
@@ -62,10 +56,19 @@ class ExportLocationsTab(tabs.TableTab):
             return []
 
 
-class ShareDetailTabs(tabs.TabGroup):
+class ShareDetailTabs(data_context.DataContextMixin, tabs.TabGroup):
     slug = "share_details"
     tabs = (
         OverviewTab,
         ExportLocationsTab,
     )
     sticky = False
+
+    def load_export_locations(self):
+        share = self.data_context['share']
+        if hasattr(share, 'export_locations'):
+            return share.export_locations
+        try:
+            return manila.share_export_location_list(self.request, share.id)
+        except Exception:
+            return []
@@ -28,6 +28,10 @@ urlpatterns = [
         r'^create/$',
         shares_views.CreateView.as_view(),
         name='create'),
+    re_path(
+        r'^create/choices/(?P<kind>[^/]+)/$',
+        shares_views.CreateChoicesView.as_view(),
+        name='create_choices'),
     re_path(
         r'^(?P<share_id>[^/]+)/rules/$',
         shares_views.ManageRulesView.as_view(),
@@ -36,6 +40,10 @@ urlpatterns = [
         r'^(?P<share_id>[^/]+)/rule_add/$',
         shares_views.AddRuleView.as_view(),
         name='rule_add'),
+    re_path(
+        r'^(?P<share_id>[^/]+)/rules_add/$',
+        shares_views.AddRulesView.as_view(),
+        name='rules_add'),
     re_path(
         r'^rules/(?P<rule_id>[^/]+)/update_rule_metadata/$',
         shares_views.UpdateRuleMetadataView.as_view(),
@@ -12,9 +12,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from django import http
 from django.urls import reverse
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
+from django.views import generic
 from horizon import exceptions
 from horizon import forms
 from horizon import tables
@@ -22,10 +24,13 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.api import parallel
+from manila_ui.dashboards import filtering
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.shares import forms as share_form
 from manila_ui.dashboards.project.shares import tables as shares_tables
 from manila_ui.dashboards.project.shares import tabs as shares_tabs
-from manila_ui.dashboards import utils as ui_utils
+from manila_ui import exceptions as manila_exceptions
 
 
 class ShareTableMixIn(object):
@@ -44,7 +49,8 @@ class ShareTableMixIn(object):
                 share.name = share.id
 
 
-class SharesView(tables.MultiTableView, ShareTableMixIn):
+class SharesView(filtering.ServerFilterViewMixin, pagination.PagedViewMixin,
+                 tables.MultiTableView, ShareTableMixIn):
     table_classes = (
         shares_tables.SharesTable,
     )
@@ -53,27 +59,24 @@ class SharesView(tables.MultiTableView, ShareTableMixIn):
 
     @memoized.memoized_method
     def get_shares_data(self):
+        share_nets, shares = parallel.call_parallel(
+            (manila.share_network_list, [self.request]),
+            (self.paginate, [manila.share_list], {'filter_table': 'shares'}),
+        )
         share_nets_names = {}
-        share_nets = manila.share_network_list(self.request)
-        for share_net in share_nets:
+        for share_net in share_nets.result():
             share_nets_names[share_net.id] = share_net.name
         try:
-            shares = manila.share_list(self.request)
+            shares = shares.result()
             for share in shares:
                 share.share_network = (
                     share_nets_names.get(share.share_network_id) or
                     share.share_network_id)
-                share.metadata = ui_utils.metadata_to_str(share.metadata)
 
-            snapshots = manila.share_snapshot_list(self.request, detailed=True)
-            share_ids_with_snapshots = []
-            for snapshot in snapshots:
-                share_ids_with_snapshots.append(snapshot.to_dict()['share_id'])
+            share_ids_with_snapshots = manila.share_snapshot_index(
+                self.request, [share.id for share in shares])
             for share in shares:
-                if share.to_dict()['id'] in share_ids_with_snapshots:
-                    setattr(share, 'has_snapshot', True)
-                else:
-                    setattr(share, 'has_snapshot', False)
+                share.has_snapshot = share.id in share_ids_with_snapshots
         except Exception:
             exceptions.handle(
                 self.request, _('Unable to retrieve share list.'))
@@ -134,6 +137,32 @@ class CreateView(forms.ModalFormView):
         return context
 
 
+class CreateChoicesView(generic.View):
+    """Returns one kind of choices of the Create Share form as JSON.
+
+    Snapshots are returned with their name and size, which the form uses to
+    fill in the share it creates from one of them.
+    """
+
+    def get(self, request, kind):
+        if kind not in share_form.LAZY_CHOICES:
+            raise http.Http404()
+        try:
+            choices = share_form.LAZY_CHOICES[kind](request)
+        except Exception as e:
+            exceptions.handle(request, ignore=True)
+            return http.HttpResponse(
+                status=manila_exceptions.get_http_status(e))
+        result = []
+        for value, label in choices:
+            choice = {"value": value, "label": label}
+            if kind == 'snapshots' and value:
+                choice["label"] = "%s (%sGiB)" % (label.name, label.size)
+                choice["data"] = {"name": label.name, "size": label.size}
+            result.append(choice)
+        return http.JsonResponse({"choices": result})
+
+
 class UpdateView(forms.ModalFormView):
     form_class = share_form.UpdateForm
     form_id = "update_share"
@@ -242,6 +271,16 @@ class AddRuleView(forms.ModalFormView):
                        args=[self.kwargs['share_id']])
 
 
+class AddRulesView(AddRuleView):
+    form_class = share_form.AddRules
+    form_id = "rules_add"
+    template_name = 'project/shares/rules_add.html'
+    modal_header = _("Add Rules")
+    modal_id = "rules_add_modal"
+    submit_url = "horizon:project:shares:rules_add"
+    page_title = _('Add Rules')
+
+
 class UpdateRuleMetadataView(forms.ModalFormView):
     form_class = share_form.UpdateRuleMetadataForm
     form_id = ""
@@ -303,13 +342,17 @@ class ManageRulesView(tables.DataTableView):
 
     def get_context_data(self, **kwargs):
         context = super(ManageRulesView, self).get_context_data(**kwargs)
-        share = manila.share_get(self.request, self.kwargs['share_id'])
+        share = self.get_share()
         context['share_display_name'] = share.name or share.id
         context["page_title"] = _("Share Rules: "
                                   "%(share_display_name)s") % {
             'share_display_name': context['share_display_name']}
         return context
 
+    @memoized.memoized_method
+    def get_share(self):
+        return manila.share_get(self.request, self.kwargs['share_id'])
+
     @memoized.memoized_method
     def get_data(self):
         try:
@@ -322,9 +365,9 @@ class ManageRulesView(tables.DataTableView):
                               redirect=redirect)
             return []
 
-        for rule in rules:
-            rule.metadata = ui_utils.metadata_to_str(rule.metadata)
-
+        # NOTE: table actions check the share, hand it to the table to not
+        # fetch it again.
+        self.table.kwargs['share'] = self.get_share()
         return rules
 
 
@@ -20,6 +20,7 @@ from horizon import tables
 from horizon.utils.filters import parse_isotime
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 
 
 def get_date(message):
@@ -68,7 +69,7 @@ class UserMessageIDColumn(tables.Column):
         return reverse(self.link, args=(message.message_id,))
 
 
-class UserMessagesTable(tables.DataTable):
+class UserMessagesTable(pagination.PagedTableMixin, tables.DataTable):
     message_id = tables.Column(
         "id",
         verbose_name=_("ID"),
@@ -89,6 +90,9 @@ class UserMessagesTable(tables.DataTable):
     created_at = tables.Column(
         get_date,
         verbose_name=_("Created At"))
+    sort_keys = {'message_level': 'message_level',
+                 'resource_type': 'resource_type',
+                 'resource_id': 'resource_id', 'created_at': 'created_at'}
 
     def get_object_display(self, obj):
         return obj.id
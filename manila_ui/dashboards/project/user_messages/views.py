@@ -20,11 +20,12 @@ from horizon import tabs
 from horizon.utils import memoized
 
 from manila_ui.api import manila
+from manila_ui.dashboards import pagination
 from manila_ui.dashboards.project.user_messages import tables as um_tables
 from manila_ui.dashboards.project.user_messages import tabs as um_tabs
 
 
-class UserMessagesView(tables.MultiTableView):
+class UserMessagesView(pagination.PagedViewMixin, tables.MultiTableView):
     table_classes = (
         um_tables.UserMessagesTable,
     )
@@ -34,7 +35,7 @@ class UserMessagesView(tables.MultiTableView):
     @memoized.memoized_method
     def get_user_messages_data(self):
         try:
-            messages = manila.messages_list(self.request)
+            messages = self.paginate(manila.messages_list)
         except Exception:
             msg = _("Unable to retrieve messages list.")
             exceptions.handle(self.request, msg)
@@ -13,12 +13,27 @@
 #    under the License.
 import base64
 import binascii
+import functools
+import hashlib
+import logging
 import re
 
+from django.conf import settings
+from django.core.cache import cache
 from django.forms import ValidationError
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
+from manila_ui.api import manila
+from manila_ui.api import neutron
+from manila_ui.api import parallel
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_NEUTRON_NAME_CACHE_TTL = 60
+NEUTRON_NAME_CACHE_PREFIX = 'manila_ui:neutron_name'
+# Maximum number of formatted metadata kept by metadata_to_str().
+METADATA_CACHE_SIZE = 1024
 
 html_escape_table = {
     "&": "&amp;",
@@ -27,10 +42,11 @@ html_escape_table = {
     ">": "&gt;",
     "<": "&lt;",
 }
+html_escape_translation = str.maketrans(html_escape_table)
 
 
 def html_escape(text):
-    return ''.join(html_escape_table.get(s, s) for s in text)
+    return text.translate(html_escape_translation)
 
 
 def parse_str_meta(meta_s):
@@ -75,30 +91,85 @@ def parse_str_meta(meta_s):
     return set_dict, unset_list
 
 
-def metadata_to_str(metadata, meta_visible_limit=4, text_length_limit=25):
-
-    # Only convert dictionaries
-    if not hasattr(metadata, 'keys'):
-        return metadata
-
+def _format_metadata(items, meta_visible_limit, text_length_limit):
     meta = []
-    meta_keys = sorted(metadata.keys())
-    meta_keys = meta_keys[:meta_visible_limit]
-    for k in meta_keys:
+    for k, v in items[:meta_visible_limit]:
         k_shortenned = k
         if len(k) > text_length_limit:
             k_shortenned = k[:text_length_limit] + '...'
-        v = metadata[k]
         v = v if isinstance(v, str) else str(v)
         if len(v) > text_length_limit:
             v = v[:text_length_limit] + '...'
         meta.append("%s = %s" % (html_escape(k_shortenned), html_escape(v)))
     meta_str = "<br/>".join(meta)
-    if len(metadata.keys()) > meta_visible_limit and meta_str[-3:] != "...":
+    if len(items) > meta_visible_limit and meta_str[-3:] != "...":
         meta_str += '...'
     return mark_safe(meta_str)  # nosec B308
 
 
+_format_cached_metadata = functools.lru_cache(maxsize=METADATA_CACHE_SIZE)(
+    _format_metadata)
+
+
+def metadata_to_str(metadata, meta_visible_limit=4, text_length_limit=25):
+    """Formats metadata as HTML, e.g. for table cells.
+
+    Results are kept in a bounded LRU cache keyed by the metadata items and
+    the limits, since tables show the same metadata, e.g. extra specs, on
+    many rows and on every page load. Tables should format metadata in a
+    column filter, so that only the rows shown pay for it.
+    """
+    # Only convert dictionaries
+    if not hasattr(metadata, 'keys'):
+        return metadata
+
+    items = tuple(sorted(metadata.items()))
+    try:
+        return _format_cached_metadata(
+            items, meta_visible_limit, text_length_limit)
+    except TypeError:
+        # NOTE: unhashable values, e.g. lists, are formatted every time.
+        return _format_metadata(items, meta_visible_limit, text_length_limit)
+
+
+def specs_to_str(specs):
+    """Formats extra specs or group specs of types as HTML."""
+    return metadata_to_str(specs, 8, 45)
+
+
+@manila.request_memoized
+def get_share(request, share_id):
+    """Returns a share, fetched at most once per request.
+
+    Used for the parent share of other resources, e.g. snapshots, so that a
+    view, its tabs and its table actions share one copy of it.
+    """
+    return manila.share_get(request, share_id)
+
+
+def get_shares(request, share_ids):
+    """Returns the shares with the given IDs, by ID.
+
+    Shares are fetched concurrently with get_share(), on the bounded pool of
+    call_parallel(), so that naming the shares of a page of other resources
+    costs at most one call per share of the page rather than a listing of
+    all shares. Fetching by ID also finds the shares of other projects for
+    admins. Shares that cannot be fetched, e.g. because they were deleted
+    meanwhile, are left out.
+    """
+    share_ids = sorted(set(share_ids) - {None})
+    results = parallel.call_parallel(*[
+        (get_share, [request, share_id]) for share_id in share_ids])
+    shares = {}
+    for share_id, result in zip(share_ids, results):
+        try:
+            shares[share_id] = result.result()
+        except Exception:
+            LOG.debug("Unable to retrieve share '%s'.", share_id,
+                      exc_info=True)
+    return shares
+
+
 def get_nice_security_service_type(security_service):
     type_mapping = {
         'ldap': 'LDAP',
@@ -130,3 +201,90 @@ def transform_dashed_name(name):
         else:
             return base64.b32encode(name.encode()).decode().lower().replace(
                 '=', '_')
+
+
+def _get_neutron_name_cache_ttl():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return manila_config.get(
+        'neutron_name_cache_ttl', DEFAULT_NEUTRON_NAME_CACHE_TTL)
+
+
+def _get_neutron_name_cache_scope(request):
+    # NOTE: the networks a user can see depend on their project, so cached
+    # names are kept apart per project, identity endpoint and region.
+    scope = '%s|%s|%s' % (getattr(request.user, 'endpoint', None),
+                          getattr(request.user, 'services_region', None),
+                          getattr(request.user, 'project_id', None))
+    return hashlib.sha256(scope.encode('utf-8')).hexdigest()
+
+
+def _neutron_name_cache_key(scope, kind, resource_id):
+    return '%s:%s:%s:%s' % (NEUTRON_NAME_CACHE_PREFIX, scope, kind,
+                            resource_id)
+
+
+def _list_neutron_names(request, list_func, resource_ids):
+    """Returns a map of IDs to names of Neutron networks or subnets.
+
+    All of them are fetched with one listing filtered by ID. Resources that
+    were not listed, e.g. deleted ones, are mapped to None.
+    """
+    names = dict.fromkeys(resource_ids)
+    names.update((resource.id, resource.name_or_id)
+                 for resource in list_func(request, id=resource_ids))
+    return names
+
+
+def get_neutron_names(request, network_ids=(), subnet_ids=()):
+    """Returns maps of the given network and subnet IDs to their names.
+
+    Networks and subnets that are not in the Django cache yet are fetched
+    with one filtered listing of each kind, both run concurrently. Names are
+    cached for the number of seconds set by the 'neutron_name_cache_ttl'
+    key of the OPENSTACK_MANILA_FEATURES setting. Resources whose name is
+    unknown are left out of the maps.
+
+    :returns: a tuple of the network names and the subnet names.
+    """
+    list_funcs = {
+        'network': neutron.network_list,
+        'subnet': neutron.subnet_list,
+    }
+    requested = {
+        'network': sorted({r_id for r_id in network_ids if r_id}),
+        'subnet': sorted({r_id for r_id in subnet_ids if r_id}),
+    }
+    names = {'network': {}, 'subnet': {}}
+    scope = _get_neutron_name_cache_scope(request)
+    keys = {}
+    for kind, resource_ids in requested.items():
+        for resource_id in resource_ids:
+            key = _neutron_name_cache_key(scope, kind, resource_id)
+            keys[key] = (kind, resource_id)
+    # NOTE: names are cached in tuples, to tell resources that were not
+    # found from resources that are not cached.
+    for key, (name,) in cache.get_many(keys).items():
+        kind, resource_id = keys[key]
+        names[kind][resource_id] = name
+    missing = [
+        (kind, [r_id for r_id in resource_ids if r_id not in names[kind]])
+        for kind, resource_ids in requested.items()]
+    missing = [(kind, r_ids) for kind, r_ids in missing if r_ids]
+    listings = parallel.call_parallel(*[
+        (_list_neutron_names, [request, list_funcs[kind], resource_ids])
+        for kind, resource_ids in missing])
+    fetched = {}
+    for (kind, resource_ids), listing in zip(missing, listings):
+        try:
+            names[kind].update(listing.result())
+        except Exception:
+            LOG.debug("Unable to retrieve Neutron %ss %s.", kind,
+                      resource_ids, exc_info=True)
+            continue
+        fetched.update(
+            (_neutron_name_cache_key(scope, kind, r_id), (names[kind][r_id],))
+            for r_id in resource_ids)
+    if fetched:
+        cache.set_many(fetched, timeout=_get_neutron_name_cache_ttl())
+    return tuple({r_id: name for r_id, name in names[kind].items() if name}
+                 for kind in ('network', 'subnet'))
@@ -33,3 +33,17 @@ NOT_FOUND = (
 RECOVERABLE = (
     manilaclient.ClientException,
 )
+
+
+def get_http_status(error):
+    """Returns the HTTP status of a response reporting the given error.
+
+    The status of manila and Horizon errors is kept when it is an error
+    status. Other errors, including Horizon's RecoverableError whose status
+    is the informational 100, are reported as internal server errors.
+    """
+    for attr in ('http_status', 'code', 'status_code'):
+        status = getattr(error, attr, None)
+        if isinstance(status, int) and 400 <= status < 600:
+            return status
+    return 500
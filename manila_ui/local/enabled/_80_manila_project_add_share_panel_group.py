@@ -28,3 +28,12 @@ ADD_EXCEPTIONS = {
     'not_found': exceptions.NOT_FOUND,
     'unauthorized': exceptions.UNAUTHORIZED,
 }
+
+# Provides the static files of manila UI.
+ADD_INSTALLED_APPS = ['manila_ui']
+
+# Polls the rows of manila tables in batches and loads the choices of forms.
+ADD_JS_FILES = [
+    'manila_ui/js/manila.tables.js',
+    'manila_ui/js/manila.forms.js',
+]
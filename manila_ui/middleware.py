@@ -0,0 +1,116 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import ipaddress
+import json
+import logging
+
+from django.conf import settings
+from django import http
+
+from manila_ui.api import manila
+from manila_ui.api import metrics
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_API_METRICS_ALLOWED_NETWORKS = ('127.0.0.0/8', '::1/128')
+
+
+def _get_metrics_config():
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    return (manila_config.get('api_metrics_header', False),
+            manila_config.get('api_metrics_log', False),
+            manila_config.get('api_metrics_path'))
+
+
+def _is_metrics_client_allowed(request):
+    manila_config = getattr(settings, 'OPENSTACK_MANILA_FEATURES', {})
+    networks = manila_config.get(
+        'api_metrics_allowed_networks', DEFAULT_API_METRICS_ALLOWED_NETWORKS)
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR'))
+    except ValueError:
+        return False
+    for network in networks:
+        try:
+            if address in ipaddress.ip_network(network, strict=False):
+                return True
+        except ValueError:
+            LOG.warning("Invalid network '%s' of the metrics clients.",
+                        network)
+    return False
+
+
+def _summarize(calls):
+    services = {}
+    for call in calls:
+        service = services.setdefault(
+            call.service, {'calls': 0, 'duration': 0.0, 'functions': {}})
+        service['calls'] += 1
+        service['duration'] += call.duration
+        functions = service['functions']
+        functions[call.function] = functions.get(call.function, 0) + 1
+    return services
+
+
+def _format_server_timing(services, saved_calls):
+    entries = [
+        '%s;dur=%.1f;desc="%d calls"' % (
+            name, service['duration'] * 1000, service['calls'])
+        for name, service in sorted(services.items())]
+    if saved_calls:
+        entries.append('manila-saved;desc="%d calls"' % saved_calls)
+    return ', '.join(entries)
+
+
+class APIMetricsMiddleware(object):
+    """Reports the manila, Neutron and Keystone calls made by manila UI.
+
+    Depending on the OPENSTACK_MANILA_FEATURES setting, the number and the
+    duration of the calls made to serve a request are sent in a
+    Server-Timing response header ('api_metrics_header') and logged as a
+    JSON line ('api_metrics_log'). The histograms of all calls made by the
+    process are served in the Prometheus text format at the path set by
+    'api_metrics_path', only to clients of the networks listed by
+    'api_metrics_allowed_networks'.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        header, log, path = _get_metrics_config()
+        if path and request.path == path:
+            if not _is_metrics_client_allowed(request):
+                return http.HttpResponseForbidden()
+            return http.HttpResponse(
+                metrics.HISTOGRAMS.render(),
+                content_type='text/plain; version=0.0.4; charset=utf-8')
+        response = self.get_response(request)
+        calls = metrics.get_calls(request)
+        if not calls or not (header or log):
+            return response
+        services = _summarize(calls)
+        saved_calls = manila.get_saved_calls(request)
+        if header:
+            response['Server-Timing'] = _format_server_timing(
+                services, saved_calls)
+        if log:
+            LOG.info(json.dumps({
+                'view': metrics.get_view_name(request),
+                'path': request.path,
+                'method': request.method,
+                'status': response.status_code,
+                'saved_calls': saved_calls,
+                'services': services,
+            }, sort_keys=True))
+        return response
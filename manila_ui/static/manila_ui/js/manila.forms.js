@@ -0,0 +1,75 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+
+/* Loads the choices of manila form selects having a "data-choices-url"
+ * attribute from that URL, so that forms are shown without waiting for every
+ * list they offer. Selects with a "data-choices-on" attribute are only loaded
+ * once the select it points to is set to their "data-choices-value". */
+horizon.manila_forms = {
+  init: function (root) {
+    var $root = $(root);
+    // Selects of one form sharing a URL, e.g. the share network of each
+    // share type, are filled by one request.
+    var requests = {};
+
+    $root.find('select[data-choices-url]').each(function () {
+      var $select = $(this);
+      var $switch = $root.find($select.attr('data-choices-on'));
+
+      if (!$switch.length) {
+        horizon.manila_forms.load_choices($select, requests);
+        return;
+      }
+      var load_on_value = function () {
+        if ($switch.val() === $select.attr('data-choices-value')) {
+          $switch.off('change', load_on_value);
+          horizon.manila_forms.load_choices($select, requests);
+        }
+      };
+      $switch.on('change', load_on_value);
+      load_on_value();
+    });
+  },
+
+  load_choices: function ($select, requests) {
+    var url = $select.attr('data-choices-url');
+
+    $select.removeAttr('data-choices-url');
+    requests[url] = requests[url] || $.ajax({url: url, dataType: 'json'});
+    requests[url].done(function (data) {
+      var value = $select.val();
+
+      $select.empty();
+      $.each(data.choices, function (i, choice) {
+        var $option = $(document.createElement('option'))
+          .val(choice.value)
+          .text(choice.label);
+        $.each(choice.data || {}, function (key, val) {
+          $option.attr('data-' + key, val);
+        });
+        $select.append($option);
+      });
+      if (value && $select.find('option[value="' + value + '"]').length) {
+        $select.val(value);
+      }
+    }).fail(function () {
+      horizon.alert('error', gettext('Unable to retrieve the choices.'));
+    });
+  }
+};
+
+horizon.modals.addModalInitFunction(horizon.manila_forms.init);
+horizon.addInitFunction(horizon.manila_forms.init_page = function () {
+  horizon.manila_forms.init('body');
+});
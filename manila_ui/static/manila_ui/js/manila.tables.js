@@ -0,0 +1,163 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+
+/* Polls the rows of manila tables in transitional states together, with one
+ * request per table instead of one request per row as Horizon does. */
+horizon.manila_tables = {
+  // Limit of rows updated by one request, to keep its URL short.
+  max_rows_per_request: 50,
+  decay_constant: 0,
+
+  update: function () {
+    var $rows_to_update = $('tr.warning.bulk-ajax-update');
+    var interval = $rows_to_update.attr('data-update-interval');
+    var max_rows = horizon.manila_tables.max_rows_per_request;
+    var rows_by_url = {};
+    var requests = [];
+
+    // do nothing if there are no rows to update.
+    if ($rows_to_update.length <= 0) { return; }
+
+    // Do not update the rows if an action column is expanded
+    if ($rows_to_update.find('.actions_column .btn-group.open').length) {
+      setTimeout(horizon.manila_tables.update, interval);
+      horizon.manila_tables.decay_constant = 0;
+      return;
+    }
+
+    $rows_to_update.each(function () {
+      var url = $(this).attr('data-bulk-update-url');
+      rows_by_url[url] = rows_by_url[url] || [];
+      rows_by_url[url].push(this);
+    });
+    $.each(rows_by_url, function (url, rows) {
+      for (var i = 0; i < rows.length; i += max_rows) {
+        requests.push(horizon.manila_tables.update_rows(
+          url, $(rows.slice(i, i + max_rows))));
+      }
+    });
+
+    $.when.apply($, requests).always(function () {
+      horizon.manila_tables.decay_constant++;
+      var next_poll = interval * horizon.manila_tables.decay_constant;
+      // Limit the interval to 30 secs
+      if (next_poll > 30 * 1000) { next_poll = 30 * 1000; }
+      setTimeout(horizon.manila_tables.update, next_poll);
+    });
+  },
+
+  update_rows: function (url, $rows) {
+    var $table = $rows.closest('table.datatable');
+    var obj_ids = $rows.map(function () {
+      return $(this).attr('data-object-id');
+    }).get();
+
+    return horizon.ajax.queue({
+      url: url,
+      data: {obj_id: obj_ids},
+      traditional: true,
+      dataType: 'json',
+      error: function () {
+        console.log(gettext("An error occurred while updating."));
+        $rows.removeClass("bulk-ajax-update");
+        $rows.find("i.ajax-updating").remove();
+      },
+      success: function (data) {
+        var changed = false;
+        $rows.each(function () {
+          var $row = $(this);
+          var obj_id = $row.attr('data-object-id');
+          var row_html = data.rows[obj_id];
+          if (row_html !== undefined) {
+            changed = horizon.manila_tables.replace_row(
+              $row, $(row_html)) || changed;
+          } else if ($.inArray(obj_id, data.deleted) !== -1) {
+            horizon.manila_tables.remove_row($table, $row);
+            changed = true;
+          }
+          // NOTE: rows which could not be updated are polled again.
+        });
+        if (changed) {
+          recompileAngularContent($table);
+          // Reset tablesorter's data cache.
+          $table.trigger("update");
+          horizon.manila_tables.decay_constant = 0;
+          // Check that quicksearch is enabled for this table
+          // Reset quicksearch's data cache.
+          if ($table.attr('id') in horizon.datatables.qs) {
+            horizon.datatables.qs[$table.attr('id')].cache();
+          }
+          // Enable launch action if quota is not exceeded
+          horizon.datatables.update_actions();
+        }
+      },
+      complete: function () {
+        // Revalidate the button check for the updated table
+        horizon.datatables.validate_button();
+      }
+    });
+  },
+
+  remove_row: function ($table, $row) {
+    // The object is gone, update the footer count and reset to default
+    // empty row if needed.
+    var row_count = horizon.datatables.update_footer_count($table, -1);
+    if (row_count === 0) {
+      var template = horizon.templates.compiled_templates[
+        "#empty_row_template"];
+      $row.replaceWith(template.render({
+        colspan: $table.find('.table_column_header th').length,
+        no_items_label: gettext("No items to display.")
+      }));
+    } else {
+      $row.remove();
+    }
+  },
+
+  replace_row: function ($row, $new_row) {
+    if ($new_row.hasClass('warning')) {
+      var $container = $(document.createElement('div'))
+        .addClass('progress-text horizon-loading-bar');
+      var $progress = $(document.createElement('div'))
+        .addClass('progress progress-striped active')
+        .appendTo($container);
+      $(document.createElement('div'))
+        .addClass('progress-bar')
+        .css("width", $new_row.find('[percent]:first').attr('percent') || "100%")
+        .appendTo($progress);
+      // if action/confirm is required, show progress-bar with "?"
+      // icon to indicate user action is required
+      if ($new_row.find('.btn-action-required').length > 0) {
+        $(document.createElement('span'))
+          .addClass('fa fa-question-circle progress-bar-text')
+          .appendTo($container);
+      }
+      $new_row.find("td.warning:last").prepend($container);
+    }
+
+    // Only replace row if the html content has changed
+    if ($new_row.html() === $row.html()) { return false; }
+    var $checkbox = $row.find('.table-row-multi-select');
+    if ($checkbox.length && $checkbox[0].checked) {
+      // Preserve the checkbox if it's already clicked
+      $new_row.find('.table-row-multi-select').prop('checked', true);
+    }
+    $row.replaceWith($new_row);
+    return true;
+  }
+};
+
+horizon.addInitFunction(horizon.manila_tables.init = function () {
+  horizon.manila_tables.update();
+});
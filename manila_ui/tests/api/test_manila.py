@@ -13,10 +13,16 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
+
 import ddt
 from openstack_dashboard.api import base as horizon_api
+from oslo_utils import timeutils
+import requests
 from unittest import mock
 
+from manilaclient.v2 import share_types
+
 from manila_ui.api import manila as api
 from manila_ui.tests import helpers as base
 
@@ -64,7 +70,30 @@ class ManilaApiTests(base.APITestCase):
 
         expected_kwargs = kwargs or {}
         self.manilaclient.shares.list.assert_called_once_with(
-            search_opts=expected_kwargs)
+            search_opts=expected_kwargs, sort_key=None, sort_dir=None)
+
+    def test_share_list_sorted(self):
+        api.share_list(self.request, sort_key='name', sort_dir='desc',
+                       limit=21)
+
+        self.manilaclient.shares.list.assert_called_once_with(
+            search_opts={'limit': 21}, sort_key='name', sort_dir='desc')
+
+    @ddt.data(
+        ({'limit': 21}, {'limit': 21}),
+        ({'limit': 21, 'offset': 20}, {'limit': 21, 'offset': 20}),
+        ({'offset': 0}, {}),
+    )
+    @ddt.unpack
+    def test_share_list_paginated(self, kwargs, expected_opts):
+        search_opts = {'all_tenants': True}
+
+        api.share_list(self.request, search_opts=search_opts, **kwargs)
+
+        expected_opts.update(search_opts)
+        self.manilaclient.shares.list.assert_called_once_with(
+            search_opts=expected_opts, sort_key=None, sort_dir=None)
+        self.assertEqual({'all_tenants': True}, search_opts)
 
     def test_share_get(self):
         api.share_get(self.request, self.id)
@@ -342,6 +371,51 @@ class ManilaApiTests(base.APITestCase):
             sort_dir=kwargs.get("sort_dir"),
         )
 
+    @ddt.data(None, {'all_tenants': True})
+    def test_share_snapshot_index(self, search_opts):
+        def fake_list(detailed, search_opts, sort_key, sort_dir):
+            if search_opts['share_id'] == 'fake_share_1':
+                return [mock.Mock()]
+            return []
+
+        self.manilaclient.share_snapshots.list.side_effect = fake_list
+
+        result = api.share_snapshot_index(
+            self.request, ['fake_share_2', 'fake_share_1', 'fake_share_1'],
+            search_opts=search_opts)
+
+        self.assertEqual({'fake_share_1'}, result)
+        expected_opts = dict(search_opts or {}, limit=1)
+        self.manilaclient.share_snapshots.list.assert_has_calls([
+            mock.call(detailed=False, sort_key=None, sort_dir=None,
+                      search_opts=dict(expected_opts, share_id=share_id))
+            for share_id in ('fake_share_1', 'fake_share_2')],
+            any_order=True)
+        self.assertEqual(2, self.manilaclient.share_snapshots.list.call_count)
+
+    def test_share_snapshot_index_no_shares(self):
+        self.assertEqual(set(), api.share_snapshot_index(self.request, []))
+
+        self.manilaclient.share_snapshots.list.assert_not_called()
+
+    def test_share_snapshot_index_many_shares(self):
+        share_ids = ['fake_share_%s' % i for i in range(60)]
+        self.manilaclient.share_snapshots.list.side_effect = (
+            lambda search_opts, **kwargs: (
+                [mock.Mock(share_id='fake_share_1')]
+                if search_opts['share_id'] == 'fake_share_1' else []))
+
+        result = api.share_snapshot_index(self.request, share_ids)
+
+        self.assertEqual({'fake_share_1'}, result)
+        # NOTE: the whole listing of snapshots is never walked.
+        self.manilaclient.share_snapshots.list.assert_has_calls([
+            mock.call(detailed=False, sort_key=None, sort_dir=None,
+                      search_opts={'limit': 1, 'share_id': share_id})
+            for share_id in share_ids], any_order=True)
+        self.assertEqual(
+            len(share_ids), self.manilaclient.share_snapshots.list.call_count)
+
     @ddt.data(True, False)
     def test_snapshot_create(self, force):
         name = 'fake_snapshot_name'
@@ -502,6 +576,32 @@ class ManilaApiTests(base.APITestCase):
         self.manilaclient.share_servers.list.assert_called_once_with(
             search_opts=kwargs)
 
+    @ddt.data(
+        (['id1', 'id2', 'id1'], {'id1'}),
+        ([], set()),
+    )
+    @ddt.unpack
+    def test_share_server_index(self, share_server_ids, expected):
+        def fake_list(search_opts, **kwargs):
+            if search_opts['share_server_id'] == 'id1':
+                return [mock.Mock()]
+            return []
+
+        self.manilaclient.shares.list.side_effect = fake_list
+
+        result = api.share_server_index(self.request, share_server_ids)
+
+        self.assertEqual(expected, result)
+        self.manilaclient.shares.list.assert_has_calls([
+            mock.call(search_opts={'all_tenants': True, 'limit': 1,
+                                   'share_server_id': share_server_id},
+                      sort_key=None, sort_dir=None)
+            for share_server_id in sorted(set(share_server_ids))],
+            any_order=True)
+        self.assertEqual(
+            len(set(share_server_ids)),
+            self.manilaclient.shares.list.call_count)
+
     def test_share_server_get(self):
         share_serv_id = 'fake_share_server'
         api.share_server_get(self.request, share_serv_id)
@@ -740,7 +840,8 @@ class ManilaApiTests(base.APITestCase):
     def test_share_type_list(self):
         api.share_type_list(self.request)
 
-        self.manilaclient.share_types.list.assert_called_once_with()
+        self.manilaclient.share_types.list.assert_called_once_with(
+            search_opts=None)
 
     def test_share_type_get(self):
         share_type_id = "fake_share_type_id"
@@ -927,6 +1028,100 @@ class ManilaApiTests(base.APITestCase):
         }
         self.assertEqual(result, expected_result)
         self.manilaclient.limits.get.assert_called_once()
+
+    def test_tenant_absolute_limits_memoized(self):
+        self.manilaclient.limits.get.return_value.absolute = get_fake_limits()
+
+        result = api.tenant_absolute_limits(self.request)
+        result_memoized = api.tenant_absolute_limits(self.request)
+
+        self.assertIs(result, result_memoized)
+        self.manilaclient.limits.get.assert_called_once_with()
+        self.assertEqual(1, api.get_saved_calls(self.request))
+
+    def test_request_memoized(self):
+        func = mock.Mock(
+            __name__='fake_list', side_effect=lambda r, *a, **k: [a, k])
+        memoized = api.request_memoized(func)
+        other_request = mock.Mock()
+
+        results = [
+            memoized(self.request, 'foo', bar='baz'),
+            memoized(self.request, 'foo', bar='baz'),
+            memoized(self.request, 'foo'),
+            memoized(other_request, 'foo', bar='baz'),
+            memoized(self.request, ['unhashable']),
+            memoized(self.request, ['unhashable']),
+        ]
+
+        self.assertIs(results[0], results[1])
+        self.assertEqual([('foo', ), {}], results[2])
+        self.assertIsNot(results[0], results[3])
+        self.assertEqual(5, func.call_count)
+        self.assertEqual(1, api.get_saved_calls(self.request))
+        self.assertEqual(0, api.get_saved_calls(other_request))
+
+    def _reference_cached_list(self):
+        manager = self.manilaclient.share_types
+        manager.resource_class = share_types.ShareType
+        func = mock.Mock(__name__='fake_list', side_effect=lambda r, *a: [
+            share_types.ShareType(manager, {'id': 'fake_id', 'name': a[0]})])
+        return func, api.reference_cached('share_types')(func)
+
+    def test_reference_cached(self):
+        func, cached = self._reference_cached_list()
+
+        results = [cached(self.request, 'foo'), cached(self.request, 'foo'),
+                   cached(self.request, 'bar')]
+
+        self.assertEqual(['foo', 'foo', 'bar'],
+                         [result[0].name for result in results])
+        self.assertIsInstance(results[1][0], share_types.ShareType)
+        self.assertEqual(2, func.call_count)
+
+    def test_reference_cached_per_project(self):
+        func, cached = self._reference_cached_list()
+        other_request = mock.Mock()
+        other_request.user.project_id = 'other_project_id'
+        other_request.user.roles = self.request.user.roles
+
+        cached(self.request, 'foo')
+        cached(other_request, 'foo')
+
+        self.assertEqual(2, func.call_count)
+
+    def test_reference_cached_invalidated(self):
+        func, cached = self._reference_cached_list()
+
+        cached(self.request, 'foo')
+        api.share_type_create(self.request, 'fake_name', True)
+        cached(self.request, 'foo')
+        api.share_group_type_delete(self.request, 'fake_sg_type')
+        cached(self.request, 'foo')
+
+        self.assertEqual(2, func.call_count)
+
+    def test_reference_cached_invalidated_on_error(self):
+        func, cached = self._reference_cached_list()
+        self.manilaclient.share_types.delete.side_effect = ValueError('fake')
+
+        cached(self.request, 'foo')
+        self.assertRaises(
+            ValueError, api.share_type_delete, self.request, 'fake_id')
+        cached(self.request, 'foo')
+
+        self.assertEqual(2, func.call_count)
+
+    def test_reference_cached_disabled(self):
+        func, cached = self._reference_cached_list()
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={
+                'reference_data_cache_ttl': 0}):
+            cached(self.request, 'foo')
+            cached(self.request, 'foo')
+
+        self.assertEqual(2, func.call_count)
+
     # Share instance tests
 
     def test_share_instance_list(self):
@@ -934,6 +1129,53 @@ class ManilaApiTests(base.APITestCase):
 
         self.manilaclient.share_instances.list.assert_called_once_with()
 
+    @ddt.data(
+        ({}, list(range(5))),
+        ({'limit': 2}, [0, 1]),
+        ({'limit': 2, 'offset': 3}, [3, 4]),
+        ({'offset': 4}, [4]),
+    )
+    @ddt.unpack
+    def test_share_instance_list_sliced(self, kwargs, expected):
+        self.manilaclient.share_instances.list.return_value = list(range(5))
+
+        result = api.share_instance_list(self.request, **kwargs)
+
+        self.assertEqual(expected, result)
+
+    @ddt.data(
+        (0, [0, 1, 2], True, False),
+        (3, [3, 4], False, True),
+    )
+    @ddt.unpack
+    def test_list_paged(self, offset, expected, has_more, has_prev):
+        items = list(range(5))
+        list_func = mock.Mock(
+            side_effect=lambda request, limit, offset, **kwargs: (
+                items[offset:offset + limit]))
+
+        result = api.list_paged(
+            list_func, self.request, 3, offset=offset, detailed=True)
+
+        self.assertEqual((expected, has_more, has_prev), result)
+        list_func.assert_called_once_with(
+            self.request, limit=4, offset=offset, detailed=True)
+
+    def test_iter_pages(self):
+        items = list(range(5))
+        # NOTE: the API caps pages at 2 items, below the asked page size.
+        list_func = mock.Mock(
+            side_effect=lambda request, limit, offset, **kwargs: (
+                items[offset:offset + min(limit, 2)]))
+
+        result = list(api.iter_pages(
+            list_func, self.request, 3, sort_key='id'))
+
+        self.assertEqual([[0, 1], [2, 3], [4]], result)
+        list_func.assert_has_calls([
+            mock.call(self.request, limit=3, offset=offset, sort_key='id')
+            for offset in (0, 2, 4, 5)])
+
     def test_share_instance_get(self):
         api.share_instance_get(self.request, self.id)
 
@@ -1368,3 +1610,110 @@ class IsShareServiceEnabledTests(base.TestCase):
             horizon_api, 'is_service_enabled', return_value=False,
         ):
             self.assertFalse(api.is_share_service_enabled(request))
+
+
+@ddt.ddt
+class ManilaClientPoolTests(base.TestCase):
+
+    def setUp(self):
+        super(ManilaClientPoolTests, self).setUp()
+        api._CLIENT_POOL.clear()
+        self.addCleanup(api._CLIENT_POOL.clear)
+        self.mock_object(
+            horizon_api, "url_for",
+            mock.Mock(return_value="http://fake.manila:8786/v2"))
+        self.mock_object(
+            api.manila_client, "Client",
+            mock.Mock(side_effect=lambda *a, **kw: mock.Mock()))
+
+    def _get_request(self, token_id="fake_token", expires=None):
+        request = mock.Mock()
+        request.user.token.id = token_id
+        request.user.token.expires = expires or (
+            timeutils.utcnow() + datetime.timedelta(hours=1))
+        return request
+
+    def test_manilaclient_reused_for_same_token(self):
+        request = self._get_request()
+
+        first = api.manilaclient(request)
+        second = api.manilaclient(request)
+
+        self.assertIs(first, second)
+        api.manila_client.Client.assert_called_once_with(
+            api.MANILA_VERSION,
+            username=request.user.username,
+            project_id=request.user.tenant_id,
+            session=mock.ANY,
+            service_catalog_url="http://fake.manila:8786/v2",
+            insecure=mock.ANY,
+            cacert=mock.ANY,
+            http_log_debug=mock.ANY,
+            user_agent=api.MANILA_UI_USER_AGENT_REPR)
+
+    def test_manilaclient_new_client_per_token(self):
+        first = api.manilaclient(self._get_request("token_1"))
+        second = api.manilaclient(self._get_request("token_2"))
+
+        self.assertIsNot(first, second)
+        self.assertEqual(2, api.manila_client.Client.call_count)
+
+    def test_manilaclient_expired_token_evicted(self):
+        request = self._get_request(
+            expires=timeutils.utcnow() - datetime.timedelta(seconds=1))
+
+        first = api.manilaclient(request)
+        second = api.manilaclient(request)
+
+        self.assertIsNot(first, second)
+
+    @ddt.data(0, 1)
+    def test_manilaclient_pool_size(self, size):
+        features = {'client_cache_size': size}
+        with self.settings(OPENSTACK_MANILA_FEATURES=features):
+            first = api.manilaclient(self._get_request("token_1"))
+            api.manilaclient(self._get_request("token_2"))
+            third = api.manilaclient(self._get_request("token_1"))
+
+        self.assertIsNot(first, third)
+        self.assertEqual(3, api.manila_client.Client.call_count)
+
+
+class ManilaClientConnectionTests(base.TestCase):
+
+    def setUp(self):
+        super(ManilaClientConnectionTests, self).setUp()
+        api._CLIENT_POOL.clear()
+        self.addCleanup(api._CLIENT_POOL.clear)
+        self.mock_object(
+            horizon_api, "url_for",
+            mock.Mock(return_value="http://fake.manila:8786/v2"))
+
+    def _get_response(self, *args, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = b'{"shares": []}'
+        return response
+
+    def test_manilaclient_reuses_session_connections(self):
+        request = mock.Mock()
+        request.user.token.id = "fake_token"
+        request.user.token.expires = (
+            timeutils.utcnow() + datetime.timedelta(hours=1))
+        self.mock_object(requests, "request")
+        patcher = mock.patch.object(
+            requests.adapters.HTTPAdapter, "send", autospec=True,
+            side_effect=self._get_response)
+        mock_send = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        api.share_list(request)
+        api.share_list(request)
+
+        self.assertEqual(2, mock_send.call_count)
+        self.assertFalse(requests.request.called)
+        session = api.manilaclient(request).client.session.session
+        adapter = session.get_adapter("http://fake.manila:8786/v2")
+        sent_with = {id(call.args[0]) for call in mock_send.call_args_list}
+        self.assertEqual({id(adapter)}, sent_with)
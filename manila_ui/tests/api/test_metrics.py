@@ -0,0 +1,118 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from django import http
+from openstack_dashboard.api import keystone as api_keystone
+from unittest import mock
+
+from manila_ui.api import keystone
+from manila_ui.api import manila
+from manila_ui.api import metrics
+from manila_ui.tests import helpers as base
+
+
+class MetricsTests(base.APITestCase):
+
+    def setUp(self):
+        super(MetricsTests, self).setUp()
+        self.request = http.HttpRequest()
+        self.request.resolver_match = mock.Mock(
+            view_name='horizon:project:shares:index')
+        self.now = self.mock_object(
+            metrics.time, "monotonic", mock.Mock(side_effect=[1.0, 1.25]))
+        self.addCleanup(metrics.HISTOGRAMS.reset)
+        metrics.HISTOGRAMS.reset()
+
+    def test_manila_wrapper_timed(self):
+        manila.share_list(self.request)
+
+        self.assertEqual(
+            [metrics.APICall('manila', 'share_list', 0.25)],
+            metrics.get_calls(self.request))
+
+    def test_memoized_wrapper_timed_once(self):
+        manila.share_type_list(self.request)
+        manila.share_type_list(self.request)
+
+        self.assertEqual(
+            [metrics.APICall('manila', 'share_type_list', 0.25)],
+            metrics.get_calls(self.request))
+        self.assertEqual(1, manila.get_saved_calls(self.request))
+
+    def test_helpers_not_timed(self):
+        self.manilaclient.shares.list.return_value = []
+
+        manila.list_paged(manila.share_list, self.request, 2)
+
+        self.assertEqual(
+            ['share_list'],
+            [call.function for call in metrics.get_calls(self.request)])
+
+    def test_reference_data_helpers_not_timed(self):
+        manila.invalidate_reference_data('share_types')
+        manila.share_type_delete(self.request, 'fake_share_type_id')
+
+        self.assertEqual(
+            [metrics.APICall('manila', 'share_type_delete', 0.25)],
+            metrics.get_calls(self.request))
+        self.assertNotIn('invalidate_reference_data',
+                         metrics.HISTOGRAMS.render())
+        for helper in (manila.invalidate_reference_data,
+                       manila.reference_cached,
+                       manila.invalidates_reference_data):
+            self.assertFalse(hasattr(helper, 'metrics_service'))
+
+    def test_failed_call_timed(self):
+        self.manilaclient.shares.get.side_effect = ValueError('fake')
+
+        self.assertRaises(ValueError, manila.share_get, self.request, 'fake')
+        self.assertEqual(
+            [metrics.APICall('manila', 'share_get', 0.25)],
+            metrics.get_calls(self.request))
+
+    def test_instrumented_api(self):
+        self.mock_object(
+            api_keystone, "tenant_list",
+            mock.Mock(return_value=([], False)))
+
+        result = keystone.tenant_list(self.request, admin=True)
+
+        self.assertEqual(([], False), result)
+        api_keystone.tenant_list.assert_called_once_with(
+            self.request, admin=True)
+        self.assertEqual(
+            [metrics.APICall('keystone', 'tenant_list', 0.25)],
+            metrics.get_calls(self.request))
+        self.assertIs(api_keystone.VERSIONS, keystone.VERSIONS)
+
+    def test_render(self):
+        manila.share_list(self.request)
+
+        text = metrics.HISTOGRAMS.render()
+
+        labels = 'service="manila",function="share_list"'
+        self.assertIn(
+            'manila_ui_api_call_duration_seconds_bucket{%s,le="0.1"} 0' %
+            labels, text)
+        self.assertIn(
+            'manila_ui_api_call_duration_seconds_bucket{%s,le="0.25"} 1' %
+            labels, text)
+        self.assertIn(
+            'manila_ui_api_call_duration_seconds_bucket{%s,le="+Inf"} 1' %
+            labels, text)
+        self.assertIn(
+            'manila_ui_api_call_duration_seconds_sum{%s} 0.25' % labels, text)
+        self.assertIn(
+            'manila_ui_api_call_duration_seconds_count{%s} 1' % labels, text)
+        self.assertIn(
+            'manila_ui_view_api_calls_total{view="horizon:project:shares:'
+            'index",service="manila"} 1', text)
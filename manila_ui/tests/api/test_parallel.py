@@ -0,0 +1,86 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+import ddt
+from unittest import mock
+
+from manila_ui.api import parallel
+from manila_ui.tests import helpers as base
+
+
+@ddt.ddt
+class ParallelTests(base.TestCase):
+
+    def test_call_parallel_keeps_order_and_arguments(self):
+        first = mock.Mock(return_value='first')
+        second = mock.Mock(return_value='second')
+        third = mock.Mock(return_value='third')
+
+        results = parallel.call_parallel(
+            first, (second, ['a']), (third, ['b'], {'c': 'd'}))
+
+        self.assertEqual(
+            ['first', 'second', 'third'], [r.result() for r in results])
+        first.assert_called_once_with()
+        second.assert_called_once_with('a')
+        third.assert_called_once_with('b', c='d')
+
+    def test_call_parallel_keeps_errors_per_call(self):
+        results = parallel.call_parallel(
+            mock.Mock(side_effect=ValueError('fake')),
+            mock.Mock(return_value='ok'))
+
+        self.assertRaises(ValueError, results[0].result)
+        self.assertEqual('ok', results[1].result())
+
+    def test_call_parallel_runs_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        results = parallel.call_parallel(
+            barrier.wait, barrier.wait, barrier.wait)
+
+        self.assertEqual({0, 1, 2}, {r.result() for r in results})
+
+    @ddt.data(1, 2)
+    def test_call_parallel_bounded_pool(self, max_workers):
+        active = []
+        peak = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def _call():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+                if len(active) == max_workers:
+                    # NOTE: calls are held open for a while once the pool is
+                    # full, so that calls beyond the bound would be seen.
+                    threading.Timer(0.2, release.set).start()
+            release.wait(timeout=5)
+            with lock:
+                active.pop()
+
+        features = {'api_max_workers': max_workers}
+        with self.settings(OPENSTACK_MANILA_FEATURES=features):
+            with mock.patch.object(
+                    parallel.futures, 'ThreadPoolExecutor',
+                    wraps=parallel.futures.ThreadPoolExecutor) as executor:
+                parallel.call_parallel(*[_call] * (max_workers + 2))
+
+        executor.assert_called_once_with(max_workers=max_workers)
+        self.assertTrue(release.is_set())
+        self.assertEqual(max_workers, max(peak))
+
+    def test_call_parallel_no_calls(self):
+        self.assertEqual([], parallel.call_parallel())
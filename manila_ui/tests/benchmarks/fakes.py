@@ -0,0 +1,581 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+In-process stand-ins for the manila, Keystone and Neutron APIs.
+
+The fakes serve a seeded synthetic :class:`Dataset` the way the real services
+would: lists honor 'limit', 'offset', sorting, project scoping and the
+filters of manila, and every call is counted and may be delayed by a given
+latency, so that views can be benchmarked offline against any number of
+resources.
+"""
+
+import collections
+import datetime
+import random
+import threading
+import time
+import uuid
+
+from manilaclient import base
+from manilaclient.common.apiclient import exceptions
+from manilaclient.v2 import availability_zones
+from manilaclient.v2 import limits
+from manilaclient.v2 import resource_locks
+from manilaclient.v2 import security_services
+from manilaclient.v2 import share_access_rules
+from manilaclient.v2 import share_networks
+from manilaclient.v2 import share_servers
+from manilaclient.v2 import share_snapshots
+from manilaclient.v2 import share_types
+from manilaclient.v2 import shares
+from openstack_dashboard import api
+
+from manila_ui import api as manila_ui_api
+from manila_ui.tests import helpers
+
+DEFAULT_SEED = 20240101
+SHARE_STATUSES = ('available', 'available', 'available', 'available',
+                  'creating', 'error', 'deleting', 'extending')
+SNAPSHOT_STATUSES = ('available', 'available', 'available', 'creating',
+                     'error')
+KEYSTONE_FUNCTIONS = ('tenant_get', 'tenant_list', 'user_get', 'user_list')
+NEUTRON_FUNCTIONS = ('network_get', 'network_list', 'subnet_get',
+                     'subnet_list')
+_EPOCH = datetime.datetime(2024, 1, 1)
+
+
+class Dataset(object):
+    """Seeded synthetic resources of a cloud with the given number of shares.
+
+    The numbers of the other resources derive from the number of shares, and
+    the same seed always yields the same resources. Access rules are only
+    generated when the rules of a share are listed, to keep the memory used
+    by big datasets low.
+
+    :param shares: number of shares.
+    :param project_id: ID of the project of the user running the views, the
+        first of the generated projects.
+    :param user_id: ID of that user.
+    :param projects: number of projects owning the resources.
+    :param snapshots_per_share: ratio of snapshots to shares.
+    :param rules_per_share: number of access rules of every share.
+    :param locks_per_share: ratio of resource locks to shares, half of them
+        on shares and the other half on access rules.
+    :param shares_per_server: ratio of shares to share networks, each of them
+        having one share server.
+    """
+
+    def __init__(self, shares, project_id, user_id, seed=DEFAULT_SEED,
+                 projects=10, snapshots_per_share=0.5, rules_per_share=3,
+                 locks_per_share=0.1, shares_per_server=100):
+        self.size = shares
+        self.project_id = project_id
+        self.seed = seed
+        self.rules_per_share = rules_per_share
+        self._random = random.Random(seed)
+        self._rule_index = None
+
+        project_ids = [project_id] + [
+            self._uuid() for i in range(max(projects - 1, 0))]
+        self.projects = [
+            {'id': p_id, 'name': 'project-%d' % i}
+            for i, p_id in enumerate(project_ids)]
+        self.users = [{'id': user_id, 'name': 'user-0'}] + [
+            {'id': self._uuid(), 'name': 'user-%d' % i}
+            for i in range(1, len(project_ids))]
+
+        self.networks = []
+        self.subnets = []
+        self.share_networks = []
+        self.share_servers = []
+        for i in range(max(shares // shares_per_server, 1)):
+            self._add_share_network(i, project_ids[i % len(project_ids)])
+
+        self.shares = [
+            self._make_share(i, i % len(self.share_networks))
+            for i in range(shares)]
+        self.snapshots = [
+            self._make_snapshot(i, self._random.choice(self.shares))
+            for i in range(int(shares * snapshots_per_share))]
+        self.locks = [
+            self._make_lock(i, self._random.choice(self.shares))
+            for i in range(int(shares * locks_per_share))]
+
+    def _uuid(self):
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def _created_at(self, i):
+        return (_EPOCH + datetime.timedelta(seconds=i)).isoformat()
+
+    def _add_share_network(self, i, project_id):
+        network = {'id': self._uuid(), 'name': 'net-%d' % i,
+                   'tenant_id': project_id, 'status': 'ACTIVE',
+                   'admin_state_up': True, 'shared': False,
+                   'subnets': []}
+        subnet = {'id': self._uuid(), 'name': 'subnet-%d' % i,
+                  'network_id': network['id'], 'tenant_id': project_id,
+                  'ip_version': 4, 'cidr': '10.%d.%d.0/24' % (
+                      i // 256 % 256, i % 256)}
+        network['subnets'].append(subnet['id'])
+        self.networks.append(network)
+        self.subnets.append(subnet)
+        share_network = {
+            'id': self._uuid(),
+            'name': 'share-network-%d' % i,
+            'description': 'Share network %d' % i,
+            'project_id': project_id,
+            'status': 'active',
+            'created_at': self._created_at(i),
+            'share_network_subnets': [{
+                'id': self._uuid(),
+                'availability_zone': None,
+                'neutron_net_id': network['id'],
+                'neutron_subnet_id': subnet['id'],
+                'network_type': 'vlan',
+                'segmentation_id': 1000 + i,
+                'cidr': subnet['cidr'],
+                'ip_version': 4,
+                'gateway': None,
+                'mtu': 1500,
+            }],
+        }
+        self.share_networks.append(share_network)
+        self.share_servers.append({
+            'id': self._uuid(),
+            'status': 'active',
+            'host': 'host-%d@backend#pool' % (i % 8),
+            'project_id': project_id,
+            'share_network_id': share_network['id'],
+            'share_network_name': share_network['name'],
+            'share_network_subnet_id': (
+                share_network['share_network_subnets'][0]['id']),
+            'backend_details': {'ip': '10.0.0.%d' % (i % 250 + 1)},
+            'is_auto_deletable': True,
+            'identifier': self._uuid(),
+            'security_service_update_support': False,
+            'created_at': self._created_at(i),
+            'updated_at': None,
+        })
+
+    def _make_share(self, i, network_index):
+        # NOTE: every share network has one share server, at the same index.
+        share_network = self.share_networks[network_index]
+        server = self.share_servers[network_index]
+        return {
+            'id': self._uuid(),
+            'name': 'share-%d' % i if i % 20 else '',
+            'description': 'Share %d' % i,
+            'status': self._random.choice(SHARE_STATUSES),
+            'size': self._random.randint(1, 1000),
+            'share_proto': self._random.choice(('NFS', 'CIFS')),
+            'share_type': 'default-type-id',
+            'share_type_name': 'default',
+            'is_public': not i % 10,
+            'metadata': {'index': str(i), 'tier': self._random.choice(
+                ('gold', 'silver', 'bronze'))},
+            'project_id': share_network['project_id'],
+            'user_id': self.users[0]['id'],
+            'host': server['host'],
+            'availability_zone': 'nova',
+            'share_network_id': share_network['id'],
+            'share_server_id': server['id'],
+            'share_group_id': None,
+            'snapshot_id': None,
+            'snapshot_support': True,
+            'create_share_from_snapshot_support': True,
+            'mount_snapshot_support': not i % 3,
+            'revert_to_snapshot_support': True,
+            'replication_type': None,
+            'has_replicas': False,
+            'task_state': None,
+            'created_at': self._created_at(i),
+        }
+
+    def _make_snapshot(self, i, share):
+        return {
+            'id': self._uuid(),
+            'name': 'snapshot-%d' % i,
+            'description': 'Snapshot %d' % i,
+            'status': self._random.choice(SNAPSHOT_STATUSES),
+            'size': share['size'],
+            'share_size': share['size'],
+            'share_id': share['id'],
+            'share_proto': share['share_proto'],
+            'project_id': share['project_id'],
+            'user_id': share['user_id'],
+            'created_at': self._created_at(i),
+        }
+
+    def _make_lock(self, i, share):
+        lock = {
+            'id': self._uuid(),
+            'resource_action': 'delete',
+            'lock_reason': 'Lock %d' % i,
+            'lock_context': 'user',
+            'user_id': share['user_id'],
+            'project_id': share['project_id'],
+            'created_at': self._created_at(i),
+        }
+        if i % 2 or not self.rules_per_share:
+            lock.update(resource_id=share['id'], resource_type='share')
+        else:
+            rule = self.rules(share['id'])[
+                self._random.randrange(self.rules_per_share)]
+            lock.update(resource_id=rule['id'], resource_type='access_rule',
+                        parent_resource_id=share['id'])
+        return lock
+
+    def rules(self, share_id):
+        """Returns the access rules of a share, the same on every call."""
+        rules = []
+        for i in range(self.rules_per_share):
+            rules.append({
+                'id': str(uuid.uuid5(uuid.NAMESPACE_OID,
+                                     '%s/%d' % (share_id, i))),
+                'share_id': share_id,
+                'access_type': 'ip',
+                'access_to': '10.%d.%d.0/24' % (
+                    i, uuid.UUID(share_id).int % 256),
+                'access_level': 'rw' if i else 'ro',
+                'access_key': None,
+                'state': 'active',
+                'metadata': {},
+                'created_at': self._created_at(i),
+                'updated_at': None,
+            })
+        return rules
+
+    def rule(self, rule_id):
+        if self._rule_index is None:
+            self._rule_index = {}
+            for share in self.shares:
+                for rule in self.rules(share['id']):
+                    self._rule_index[rule['id']] = share['id']
+        share_id = self._rule_index.get(rule_id)
+        for rule in self.rules(share_id) if share_id else ():
+            if rule['id'] == rule_id:
+                return rule
+        raise exceptions.NotFound()
+
+
+class FakeService(object):
+    """Counts the calls made to a fake service and delays them."""
+
+    def __init__(self, name, latency=0.0):
+        self.name = name
+        self.latency = latency
+        self.calls = collections.Counter()
+        self._lock = threading.Lock()
+
+    def call(self, function):
+        with self._lock:
+            self.calls[function] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+
+    @property
+    def call_count(self):
+        return sum(self.calls.values())
+
+
+def _filter(records, search_opts, project_id, sort_key=None, sort_dir=None):
+    """Applies the search options of a manila list API to records."""
+    search_opts = dict(search_opts or {})
+    limit = search_opts.pop('limit', None)
+    offset = int(search_opts.pop('offset', 0) or 0)
+    sort_key = search_opts.pop('sort_key', sort_key)
+    sort_dir = search_opts.pop('sort_dir', sort_dir)
+    all_projects = any([search_opts.pop('all_tenants', False),
+                        search_opts.pop('all_projects', False)])
+    if not all_projects:
+        search_opts.setdefault('project_id', project_id)
+    for key, value in search_opts.items():
+        if key.endswith('~'):
+            key, value = key[:-1], str(value).lower()
+            records = [r for r in records
+                       if value in str(r.get(key) or '').lower()]
+        else:
+            records = [r for r in records
+                       if key not in r or str(r[key]) == str(value)]
+    if sort_key:
+        records = sorted(
+            records, key=lambda r: (r.get(sort_key) is None,
+                                    r.get(sort_key)),
+            reverse=(sort_dir == 'desc'))
+    end = None if limit is None else offset + int(limit)
+    return records[offset:end]
+
+
+class FakeManager(object):
+    resource_class = None
+
+    def __init__(self, client, records=()):
+        self.client = client
+        self.records = records
+        self._by_id = None
+
+    def _call(self, function):
+        self.client.service.call(
+            '%s.%s' % (self.resource_class.__name__, function))
+
+    def _wrap(self, record):
+        return self.resource_class(self, dict(record), loaded=True)
+
+    def _list(self, search_opts=None, sort_key=None, sort_dir=None):
+        self._call('list')
+        return [self._wrap(record) for record in _filter(
+            self.records, search_opts, self.client.dataset.project_id,
+            sort_key, sort_dir)]
+
+    def list(self, detailed=True, search_opts=None, sort_key=None,
+             sort_dir=None):
+        return self._list(search_opts, sort_key, sort_dir)
+
+    def get(self, resource):
+        self._call('get')
+        if self._by_id is None:
+            self._by_id = {record['id']: record for record in self.records}
+        try:
+            return self._wrap(self._by_id[base.getid(resource)])
+        except KeyError:
+            raise exceptions.NotFound()
+
+
+class FakeShareManager(FakeManager):
+    resource_class = shares.Share
+
+
+class FakeShareSnapshotManager(FakeManager):
+    resource_class = share_snapshots.ShareSnapshot
+
+    def access_list(self, snapshot):
+        self._call('access_list')
+        return []
+
+
+class FakeShareAccessRuleManager(FakeManager):
+    resource_class = share_access_rules.ShareAccessRule
+
+    def access_list(self, share, search_opts=None):
+        self._call('access_list')
+        return [self._wrap(rule) for rule in
+                self.client.dataset.rules(base.getid(share))]
+
+    def get(self, share_access_rule):
+        self._call('get')
+        return self._wrap(
+            self.client.dataset.rule(base.getid(share_access_rule)))
+
+
+class FakeResourceLockManager(FakeManager):
+    resource_class = resource_locks.ResourceLock
+
+    def list(self, search_opts=None, sort_key=None, sort_dir=None):
+        return self._list(search_opts, sort_key, sort_dir)
+
+
+class FakeShareServerManager(FakeManager):
+    resource_class = share_servers.ShareServer
+
+    def list(self, search_opts=None):
+        return self._list(search_opts)
+
+
+class FakeShareNetworkManager(FakeManager):
+    resource_class = share_networks.ShareNetwork
+
+
+class FakeSecurityServiceManager(FakeManager):
+    resource_class = security_services.SecurityService
+
+
+class FakeShareTypeManager(FakeManager):
+    resource_class = share_types.ShareType
+
+    def list(self, search_opts=None, show_all=True):
+        self._call('list')
+        return [self._wrap(record) for record in self.records]
+
+
+class FakeAvailabilityZoneManager(FakeManager):
+    resource_class = availability_zones.AvailabilityZone
+
+    def list(self):
+        self._call('list')
+        return [self._wrap(record) for record in self.records]
+
+
+class FakeLimitsManager(FakeManager):
+    resource_class = limits.Limits
+
+    def get(self):
+        self._call('get')
+        dataset = self.client.dataset
+        project_shares = [share for share in dataset.shares
+                          if share['project_id'] == dataset.project_id]
+        # NOTE: -1 stands for unlimited quotas.
+        return self._wrap({'rate': [], 'absolute': {
+            'maxTotalShares': -1,
+            'maxTotalShareGigabytes': -1,
+            'maxTotalShareSnapshots': -1,
+            'maxTotalSnapshotGigabytes': -1,
+            'maxTotalShareNetworks': -1,
+            'maxTotalShareReplicas': -1,
+            'maxTotalReplicaGigabytes': -1,
+            'totalSharesUsed': len(project_shares),
+            'totalShareGigabytesUsed': sum(
+                share['size'] for share in project_shares),
+            'totalShareSnapshotsUsed': 0,
+            'totalSnapshotGigabytesUsed': 0,
+            'totalShareNetworksUsed': 0,
+            'totalShareReplicasUsed': 0,
+            'totalReplicaGigabytesUsed': 0,
+        }})
+
+
+class FakeManilaClient(object):
+    """Stand-in for the manila client returned by ``api.manila``."""
+
+    def __init__(self, dataset, latency=0.0):
+        self.dataset = dataset
+        self.service = FakeService('manila', latency)
+        self.shares = FakeShareManager(self, dataset.shares)
+        self.share_snapshots = FakeShareSnapshotManager(
+            self, dataset.snapshots)
+        self.share_access_rules = FakeShareAccessRuleManager(self)
+        self.resource_locks = FakeResourceLockManager(self, dataset.locks)
+        self.share_servers = FakeShareServerManager(
+            self, dataset.share_servers)
+        self.share_networks = FakeShareNetworkManager(
+            self, dataset.share_networks)
+        self.security_services = FakeSecurityServiceManager(self)
+        self.share_types = FakeShareTypeManager(self, [{
+            'id': 'default-type-id', 'name': 'default',
+            'extra_specs': {'driver_handles_share_servers': 'True'}}])
+        self.availability_zones = FakeAvailabilityZoneManager(
+            self, [{'id': 'nova-id', 'name': 'nova'}])
+        self.limits = FakeLimitsManager(self)
+
+
+class FakeKeystone(object):
+    """Stand-in for the functions of ``openstack_dashboard.api.keystone``."""
+
+    def __init__(self, dataset, latency=0.0):
+        self.service = FakeService('keystone', latency)
+        self.projects = [helpers.FakeEntity(p['id'], p['name'])
+                         for p in dataset.projects]
+        self.users = [helpers.FakeEntity(u['id'], u['name'])
+                      for u in dataset.users]
+
+    @staticmethod
+    def _get(entities, entity_id):
+        for entity in entities:
+            if entity.id == entity_id:
+                return entity
+        raise exceptions.NotFound()
+
+    def tenant_get(self, request, project, admin=True):
+        self.service.call('tenant_get')
+        return self._get(self.projects, getattr(project, 'id', project))
+
+    def tenant_list(self, request, paginate=False, marker=None, domain=None,
+                    user=None, admin=True, filters=None):
+        self.service.call('tenant_list')
+        return list(self.projects), False
+
+    def user_get(self, request, user_id, admin=True):
+        self.service.call('user_get')
+        return self._get(self.users, user_id)
+
+    def user_list(self, request, project=None, domain=None, group=None,
+                  filters=None):
+        self.service.call('user_list')
+        return list(self.users)
+
+
+class FakeNeutron(object):
+    """Stand-in for the functions of ``openstack_dashboard.api.neutron``."""
+
+    def __init__(self, dataset, latency=0.0):
+        self.service = FakeService('neutron', latency)
+        self.networks = {n['id']: n for n in dataset.networks}
+        self.subnets = {s['id']: s for s in dataset.subnets}
+
+    @staticmethod
+    def _list(records, params):
+        ids = params.get('id')
+        if ids is None:
+            return list(records.values())
+        if isinstance(ids, str):
+            ids = [ids]
+        return [records[i] for i in ids if i in records]
+
+    def network_get(self, request, network_id, expand_subnet=True, **params):
+        self.service.call('network_get')
+        return api.neutron.Network(dict(self.networks[network_id]))
+
+    def network_list(self, request, single_page=False, **params):
+        self.service.call('network_list')
+        return [api.neutron.Network(dict(n))
+                for n in self._list(self.networks, params)]
+
+    def subnet_get(self, request, subnet_id, **params):
+        self.service.call('subnet_get')
+        return api.neutron.Subnet(dict(self.subnets[subnet_id]))
+
+    def subnet_list(self, request, **params):
+        self.service.call('subnet_list')
+        return [api.neutron.Subnet(dict(s))
+                for s in self._list(self.subnets, params)]
+
+
+class FakeCloud(object):
+    """Serves a dataset with fake manila, Keystone and Neutron APIs.
+
+    :param latency: delay of every call in seconds, per service name.
+    """
+
+    def __init__(self, dataset, latency=None):
+        latency = latency or {}
+        self.dataset = dataset
+        self.manila = FakeManilaClient(dataset, latency.get('manila', 0.0))
+        self.keystone = FakeKeystone(dataset, latency.get('keystone', 0.0))
+        self.neutron = FakeNeutron(dataset, latency.get('neutron', 0.0))
+        self.services = (self.manila.service, self.keystone.service,
+                         self.neutron.service)
+
+    def install(self, test_case):
+        """Replaces the APIs with the fakes for the test case."""
+        test_case.mock_object(
+            manila_ui_api.manila, 'manilaclient',
+            lambda request: self.manila)
+        for name in KEYSTONE_FUNCTIONS:
+            test_case.mock_object(
+                api.keystone, name, getattr(self.keystone, name))
+        for name in NEUTRON_FUNCTIONS:
+            test_case.mock_object(
+                api.neutron, name, getattr(self.neutron, name))
+
+    def reset(self):
+        for service in self.services:
+            service.reset()
+
+    def get_call_counts(self):
+        """Returns the number of calls made to each service."""
+        return dict((service.name, service.call_count)
+                    for service in self.services)
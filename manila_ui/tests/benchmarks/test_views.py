@@ -0,0 +1,153 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmarks of manila UI views against synthetic datasets.
+
+The benchmarks only run when the MANILA_UI_BENCHMARKS environment variable is
+set, e.g. with ``tox -e benchmark``, and are configured with:
+
+* MANILA_UI_BENCHMARK_SIZES: comma separated numbers of shares of the
+  datasets, "10000,50000,100000" by default.
+* MANILA_UI_BENCHMARK_LATENCY: latency of every API call in milliseconds,
+  0 by default.
+* MANILA_UI_BENCHMARK_REPORT: path of a file to write the results to as JSON.
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import tag
+from django.urls import reverse
+from openstack_auth import policy
+
+from manila_ui.api import metrics
+from manila_ui.tests.benchmarks import fakes
+from manila_ui.tests import helpers as test
+
+DEFAULT_SIZES = "10000,50000,100000"
+# Names of the benchmarked views, with the dataset collection whose first
+# resource is shown by detail views.
+VIEWS = (
+    ('horizon:project:shares:index', None),
+    ('horizon:project:share_snapshots:index', None),
+    ('horizon:project:resource_locks:index', None),
+    ('horizon:project:share_networks:index', None),
+    ('horizon:project:share_networks:share_network_detail', 'share_networks'),
+    ('horizon:admin:shares:index', None),
+    ('horizon:admin:share_snapshots:index', None),
+    ('horizon:admin:share_servers:index', None),
+    ('horizon:admin:resource_locks:index', None),
+)
+
+
+def _get_sizes():
+    sizes = os.environ.get('MANILA_UI_BENCHMARK_SIZES') or DEFAULT_SIZES
+    return [int(size) for size in sizes.split(',') if size.strip()]
+
+
+def _get_latency():
+    latency = float(os.environ.get('MANILA_UI_BENCHMARK_LATENCY') or 0)
+    return dict.fromkeys(('manila', 'keystone', 'neutron'), latency / 1000)
+
+
+@tag('benchmark')
+@unittest.skipUnless(os.environ.get('MANILA_UI_BENCHMARKS'),
+                     "The MANILA_UI_BENCHMARKS env variable is not set.")
+class ViewBenchmarks(test.BaseAdminViewTests):
+
+    @classmethod
+    def setUpClass(cls):
+        super(ViewBenchmarks, cls).setUpClass()
+        cls.results = []
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ViewBenchmarks, cls).tearDownClass()
+        report_path = os.environ.get('MANILA_UI_BENCHMARK_REPORT')
+        if report_path:
+            with open(report_path, 'w') as report:
+                json.dump(cls.results, report, indent=2, sort_keys=True)
+        sys.stdout.write(cls._format_results(cls.results))
+
+    @staticmethod
+    def _format_results(results):
+        row = "%-52s %8s %9s %7s %9s %8s %9s\n"
+        lines = ["\n", row % ('view', 'shares', 'seconds', 'manila',
+                              'keystone', 'neutron', 'peak MiB')]
+        for result in results:
+            calls = result['api_calls']
+            lines.append(row % (
+                result['view'], result['size'], '%.3f' % result['seconds'],
+                calls['manila'], calls['keystone'], calls['neutron'],
+                '%.1f' % (result['peak_memory'] / 1024.0 / 1024.0)))
+        return ''.join(lines)
+
+    def setUp(self):
+        super(ViewBenchmarks, self).setUp()
+        self.mock_object(
+            policy, "check",
+            mock.Mock(side_effect=(lambda *args, **kwargs: True)))
+
+    def _get(self, cloud, url):
+        # NOTE: cached data, e.g. project names, must not hide API calls.
+        cache.clear()
+        cloud.reset()
+        res = self.client.get(url)
+        self.assertEqual(200, res.status_code)
+        self.assertNoMessages()
+        return res
+
+    def _benchmark(self, cloud, view, collection=None):
+        args = []
+        if collection:
+            args.append(getattr(cloud.dataset, collection)[0]['id'])
+        url = reverse(view, args=args)
+        # NOTE: the first run, which also compiles the templates, measures
+        # the peak memory, as tracing allocations slows the view down.
+        gc.collect()
+        tracemalloc.start()
+        try:
+            self._get(cloud, url)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        gc.collect()
+        start = time.perf_counter()
+        res = self._get(cloud, url)
+        seconds = time.perf_counter() - start
+        self.results.append({
+            'view': view,
+            'size': cloud.dataset.size,
+            'seconds': seconds,
+            'peak_memory': peak_memory,
+            'api_calls': cloud.get_call_counts(),
+            'wrapper_calls': len(metrics.get_calls(res.wsgi_request)),
+        })
+
+    def test_views(self):
+        latency = _get_latency()
+        for size in _get_sizes():
+            dataset = fakes.Dataset(
+                size, project_id=self.tenant.id, user_id=self.user.id)
+            cloud = fakes.FakeCloud(dataset, latency=latency)
+            cloud.install(self)
+            for view, collection in VIEWS:
+                with self.subTest(view=view, size=size):
+                    self._benchmark(cloud, view, collection)
@@ -19,7 +19,6 @@ from openstack_dashboard.api import keystone as api_keystone
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
-from manila_ui.dashboards.admin import utils
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 from manila_ui.tests.test_data import keystone_data
@@ -34,8 +33,9 @@ class SecurityServicesTests(test.BaseAdminViewTests):
         self.mock_object(
             api_keystone, "tenant_list",
             mock.Mock(return_value=(keystone_data.projects, None)))
-        # Reset taken list of projects to avoid test interference
-        utils.PROJECTS = {}
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
 
     def test_detail_view(self):
         sec_service = test_data.sec_service
@@ -88,9 +88,9 @@ class SecurityServicesTests(test.BaseAdminViewTests):
 
         res = self.client.post(INDEX_URL, formData)
 
-        api_keystone.tenant_list.assert_called_once_with(mock.ANY)
+        api_keystone.tenant_get.assert_not_called()
         api_manila.security_service_delete.assert_called_once_with(
             mock.ANY, test_data.sec_service.id)
         api_manila.security_service_list.assert_called_once_with(
-            mock.ANY, search_opts={'all_tenants': True})
+            mock.ANY, limit=21, offset=0, search_opts={'all_tenants': True})
         self.assertRedirectsNoFollow(res, INDEX_URL)
@@ -51,7 +51,7 @@ class ShareGroupSnapshotTests(test.BaseAdminViewTests):
         self.assertMessageCount(error=0)
         self.assertNoMessages()
         api_manila.share_group_snapshot_list.assert_called_once_with(
-            mock.ANY, search_opts={'all_tenants': True})
+            mock.ANY, limit=21, offset=0, search_opts={'all_tenants': True})
         api_manila.share_group_list.assert_called_once_with(mock.ANY)
         self.assertTemplateUsed(res, 'admin/share_group_snapshots/index.html')
         self.assertContains(res, "<h1>Share Group Snapshots</h1>")
@@ -196,5 +196,5 @@ class ShareGroupSnapshotTests(test.BaseAdminViewTests):
         api_manila.share_group_snapshot_delete.assert_called_once_with(
             mock.ANY, self.sgs.id)
         api_manila.share_group_snapshot_list.assert_called_once_with(
-            mock.ANY, search_opts={'all_tenants': True})
+            mock.ANY, limit=21, offset=0, search_opts={'all_tenants': True})
         self.assertRedirectsNoFollow(res, INDEX_URL)
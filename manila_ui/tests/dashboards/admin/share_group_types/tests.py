@@ -105,5 +105,5 @@ class ShareGroupTypeTests(test.BaseAdminViewTests):
         api_manila.share_group_type_delete.assert_called_once_with(
             mock.ANY, self.share_group_type_alt.id)
         api_manila.share_group_type_list.assert_called_once_with(
-            mock.ANY)
+            mock.ANY, limit=21, offset=0)
         self.assertRedirectsNoFollow(res, INDEX_URL)
@@ -64,7 +64,8 @@ class ShareInstanceTests(test.BaseAdminViewTests):
                 '<a href="/admin/shares/%s/" >%s</a>' % (
                     si.share_id, si.share_id),
                 1, 200)
-        api_manila.share_instance_list.assert_called_once_with(mock.ANY)
+        api_manila.share_instance_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
         self.assertEqual(0, api_keystone.tenant_list.call_count)
 
     def test_detail_view_share_instance(self):
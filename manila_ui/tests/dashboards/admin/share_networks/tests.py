@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import ddt
 from django.urls import reverse
 from horizon import exceptions as horizon_exceptions
 from neutronclient.client import exceptions
@@ -22,8 +23,6 @@ from oslo_utils import timeutils
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
-from manila_ui.dashboards.admin import share_networks
-from manila_ui.dashboards.admin import utils
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 from manila_ui.tests.test_data import keystone_data
@@ -31,20 +30,7 @@ from manila_ui.tests.test_data import keystone_data
 INDEX_URL = reverse('horizon:admin:share_networks:index')
 
 
-class ShareNetworksTableMock(mock.Mock):
-    def __init__(self, *args, **kwargs):
-        mock.Mock.__init__(self)
-        self.request = {}
-        self.share_networks = {}
-
-
-class ShareNetwork:
-    def __init__(self, id, name, description):
-        self.id = id
-        self.name = name
-        self.description = description
-
-
+@ddt.ddt
 class ShareNetworksTests(test.BaseAdminViewTests):
 
     def setUp(self):
@@ -52,8 +38,9 @@ class ShareNetworksTests(test.BaseAdminViewTests):
         self.mock_object(
             api_keystone, "tenant_list",
             mock.Mock(return_value=(keystone_data.projects, None)))
-        # Reset taken list of projects to avoid test interference
-        utils.PROJECTS = {}
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
 
     class FakeAZ(object):
         def __init__(self, name, id):
@@ -75,9 +62,15 @@ class ShareNetworksTests(test.BaseAdminViewTests):
         network = self.networks.first()
         subnet = self.subnets.first()
         self.mock_object(
-            api_neutron, "network_get", mock.Mock(return_value=network))
+            api_neutron, "network_list",
+            mock.Mock(side_effect=lambda request, id: [
+                api_neutron.Network(dict(network.to_dict(), id=net_id))
+                for net_id in id]))
         self.mock_object(
-            api_neutron, "subnet_get", mock.Mock(return_value=subnet))
+            api_neutron, "subnet_list",
+            mock.Mock(side_effect=lambda request, id: [
+                api_neutron.Subnet(dict(subnet.to_dict(), id=subnet_id))
+                for subnet_id in id]))
         self.mock_object(
             api_manila, "availability_zone_list",
             mock.Mock(return_value=[self.FakeAZ('fake_az', 'fake_az')])
@@ -100,15 +93,12 @@ class ShareNetworksTests(test.BaseAdminViewTests):
         self.assertContains(res, "<a href=\"/admin/security_services"
                                  "/%s\">%s</a>" % (sec_service.id,
                                                    sec_service.name), 1, 200)
-        network_get_calls = [mock.call(mock.ANY, sub['neutron_net_id']
-                                       ) for sub in share_network_subnets]
-        subnet_get_calls = [mock.call(mock.ANY, sub['neutron_subnet_id']
-                                      ) for sub in share_network_subnets]
-
-        api_neutron.network_get.assert_has_calls(network_get_calls,
-                                                 any_order=True)
-        api_neutron.subnet_get.assert_has_calls(subnet_get_calls,
-                                                any_order=True)
+        api_neutron.network_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_net_id']
+                                 for sub in share_network_subnets}))
+        api_neutron.subnet_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_subnet_id']
+                                 for sub in share_network_subnets}))
         self.assertNoMessages()
         api_manila.share_network_security_service_list.assert_called_once_with(
             mock.ANY, share_net.id)
@@ -131,11 +121,11 @@ class ShareNetworksTests(test.BaseAdminViewTests):
             api_manila, "share_network_security_service_list",
             mock.Mock(return_value=[sec_service]))
         self.mock_object(
-            api_neutron, "network_get", mock.Mock(
-                side_effect=exceptions.NeutronClientException('fake', 500)))
+            api_neutron, "network_list", mock.Mock(return_value=[]))
         self.mock_object(
-            api_neutron, "subnet_get", mock.Mock(
-                side_effect=exceptions.NeutronClientException('fake', 500)))
+            api_neutron, "subnet_list", mock.Mock(
+                side_effect=exceptions.NeutronClientException(
+                    'fake', status_code=500)))
         self.mock_object(
             api_manila, "availability_zone_list",
             mock.Mock(return_value=[])
@@ -151,15 +141,12 @@ class ShareNetworksTests(test.BaseAdminViewTests):
             self.assertNotContains(res, "<dd>%s</dd>" % sub['neutron_net_id'])
             self.assertNotContains(res,
                                    "<dd>%s</dd>" % sub['neutron_subnet_id'])
-        network_get_calls = [mock.call(mock.ANY, sub['neutron_net_id']
-                                       ) for sub in share_network_subnets]
-        subnet_get_calls = [mock.call(mock.ANY, sub['neutron_subnet_id']
-                                      ) for sub in share_network_subnets]
-
-        api_neutron.network_get.assert_has_calls(network_get_calls,
-                                                 any_order=True)
-        api_neutron.subnet_get.assert_has_calls(subnet_get_calls,
-                                                any_order=True)
+        api_neutron.network_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_net_id']
+                                 for sub in share_network_subnets}))
+        api_neutron.subnet_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_subnet_id']
+                                 for sub in share_network_subnets}))
         self.assertContains(res, "<a href=\"/admin/security_services"
                                  "/%s\">%s</a>" % (sec_service.id,
                                                    sec_service.name), 1, 200)
@@ -195,68 +182,38 @@ class ShareNetworksTests(test.BaseAdminViewTests):
                 test_data.inactive_share_network]))
         res = self.client.post(INDEX_URL, formData)
         self.assertRedirectsNoFollow(res, INDEX_URL)
-        api_keystone.tenant_list.assert_called_once_with(mock.ANY)
+        api_keystone.tenant_get.assert_called_once_with(
+            mock.ANY, test_data.active_share_network.project_id, admin=True)
         api_manila.share_network_delete.assert_called_once_with(
             mock.ANY, share_network.id)
         api_manila.share_network_list.assert_called_once_with(
-            mock.ANY, detailed=True, search_opts={'all_tenants': True})
-
-    def test_get_filters(self):
-        share_net = [
-            ShareNetwork('share_net_1', 'share_net_name_1', 'desc1'),
-            ShareNetwork('share_net_2', 'share_net_name_2', 'desc2'),
-            ShareNetwork('share_net_3', 'share_net_name_3', 'desc3'),
-        ]
-        share_networks_view = share_networks.views.ShareNetworksView()
-        share_networks_view._tables = {
-            'share_networks': ShareNetworksTableMock()
-        }
-
-        mock_filters = {
-            'action': '<ShareNetworksFilterAction: filter>',
-            'value_param': 'share_networks__filter__q',
-            'value': '',
-            'field_param': 'share_networks__filter__q_field',
-            'field': None,
-            'changed': False
-        }
-        self.mock_object(share_networks_view, 'get_server_filter_info',
-                         mock.Mock(return_value=mock_filters))
-
-        # Test with empty filter string and no filter field selected
-        filtered_data = share_networks_view.get_filters(share_net)
-        self.assertEqual(len(filtered_data), len(share_net))
-        self.assertEqual(filtered_data, share_net)
-
-        mock_filters_name = {
-            'action': '<ShareNetworksFilterAction: filter>',
-            'value_param': 'share_networks__filter__q',
-            'value': 'share_net_name_1',
-            'field_param': 'share_networks__filter__q_field',
-            'field': 'name',
-            'changed': False
-        }
-        self.mock_object(share_networks_view, 'get_server_filter_info',
-                         mock.Mock(return_value=mock_filters_name))
-
-        # Test with specific filter string ("share_net_name_1") on "name" field
-        filtered_data = share_networks_view.get_filters(share_net)
-        self.assertEqual(len(filtered_data), 1)
-        self.assertEqual(filtered_data[0].name, 'share_net_name_1')
+            mock.ANY, limit=21, offset=0, detailed=True,
+            search_opts={'all_tenants': True})
+
+    @ddt.data(
+        ('name', {'name': 'desc'}),
+        ('name~', {'name~': 'desc'}),
+        ('description', {'description~': 'desc'}),
+    )
+    @ddt.unpack
+    def test_index_filtered_by_api(self, field, filter_opts):
+        share_net = test_data.active_share_network
+        self.mock_object(
+            api_manila, "share_network_list",
+            mock.Mock(return_value=[share_net]))
 
-        mock_filters_description = {
-            'action': '<ShareNetworksFilterAction: filter>',
-            'value_param': 'share_networks__filter__q',
-            'value': 'desc1',
-            'field_param': 'share_networks__filter__q_field',
-            'field': 'description',
-            'changed': False
-        }
+        res = self.client.post(INDEX_URL, {
+            'share_networks__filter__q': 'desc',
+            'share_networks__filter__q_field': field})
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        self.assertFalse(api_manila.share_network_list.called)
 
-        self.mock_object(share_networks_view, 'get_server_filter_info',
-                         mock.Mock(return_value=mock_filters_description))
+        # NOTE: the filter also applies to the following pages.
+        res = self.client.get(INDEX_URL)
 
-        # Test with specific filter string ("desc1") on "description" field
-        filtered_data = share_networks_view.get_filters(share_net)
-        self.assertEqual(len(filtered_data), 1)
-        self.assertEqual(filtered_data[0].description, 'desc1')
+        self.assertEqual(200, res.status_code)
+        self.assertEqual(
+            [share_net], list(res.context['share_networks_table'].data))
+        api_manila.share_network_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0, detailed=True,
+            search_opts=dict(filter_opts, all_tenants=True))
@@ -13,16 +13,20 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from django.test.utils import override_settings
 from django.urls import reverse
 from horizon import exceptions as horizon_exceptions
+from manilaclient.v2 import share_servers as share_servers_api
 from openstack_dashboard.api import keystone as api_keystone
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
+from manila_ui.dashboards.admin import export
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 
 INDEX_URL = reverse('horizon:admin:share_servers:index')
+EXPORT_URL = reverse('horizon:admin:share_servers:export')
 
 
 class ShareServerTests(test.BaseAdminViewTests):
@@ -42,12 +46,13 @@ class ShareServerTests(test.BaseAdminViewTests):
             api_manila, "share_server_list",
             mock.Mock(return_value=share_servers))
         self.mock_object(
-            api_manila, "share_list",
-            mock.Mock(side_effect=[
-                [], [test_data.share], [test_data.nameless_share]]))
+            api_manila, "share_server_index",
+            mock.Mock(return_value={test_data.share_server_errored.id}))
+        self.mock_object(api_manila, "share_list")
         self.mock_object(
-            api_keystone, "tenant_list",
-            mock.Mock(return_value=(projects, None)))
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=lambda request, project_id, admin: (
+                projects_dict[project_id])))
 
         res = self.client.get(INDEX_URL)
 
@@ -67,13 +72,93 @@ class ShareServerTests(test.BaseAdminViewTests):
                     share_server.share_network_id,
                     share_server.share_network),
                 1, 200)
-        api_manila.share_list.assert_has_calls([
-            mock.call(
-                mock.ANY, search_opts={'share_server_id': share_server.id})
-            for share_server in share_servers
-        ])
-        api_manila.share_server_list.assert_called_once_with(mock.ANY)
-        self.assertEqual(1, api_keystone.tenant_list.call_count)
+        self.assertContains(
+            res, 'share_servers__delete__%s' % share_servers[0].id, 1, 200)
+        self.assertNotContains(
+            res, 'share_servers__delete__%s' % share_servers[1].id)
+        api_manila.share_server_index.assert_called_once_with(
+            mock.ANY, [share_server.id for share_server in share_servers])
+        api_manila.share_list.assert_not_called()
+        api_manila.share_server_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
+        api_keystone.tenant_get.assert_has_calls([
+            mock.call(mock.ANY, project.id, admin=True)
+            for project in projects], any_order=True)
+
+    def test_list_share_servers_index_error(self):
+        # NOTE: copies, without the 'has_shares' set by other tests.
+        share_servers = [
+            share_servers_api.ShareServer(
+                share_server.manager, share_server._info)
+            for share_server in (test_data.share_server,
+                                 test_data.share_server_errored)
+        ]
+        self.mock_object(
+            api_manila, "share_server_list",
+            mock.Mock(return_value=share_servers))
+        self.mock_object(
+            api_manila, "share_server_index",
+            mock.Mock(side_effect=Exception('fake')))
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=lambda request, project_id, admin: type(
+                'FakeProject', (object, ),
+                {'id': project_id, 'name': '%s_name' % project_id})))
+
+        res = self.client.get(INDEX_URL)
+
+        # NOTE: the share servers are still listed, but none of them is
+        # offered for deletion while their shares are unknown.
+        self.assertEqual(200, res.status_code)
+        self.assertContains(
+            res, 'Unable to retrieve the shares of share servers')
+        for share_server in share_servers:
+            self.assertContains(
+                res,
+                '<a href="/admin/share_servers/%s" >%s</a>' % (
+                    share_server.id, share_server.id),
+                1, 200)
+            self.assertNotContains(
+                res, 'share_servers__delete__%s' % share_server.id)
+
+    def test_bulk_row_update(self):
+        share_servers = [
+            test_data.share_server,
+            test_data.share_server_errored,
+        ]
+
+        def fake_share_server_get(request, share_serv_id):
+            if share_serv_id == share_servers[0].id:
+                return share_servers[0]
+            raise horizon_exceptions.NotFound()
+
+        self.mock_object(api_manila, "share_server_list")
+        self.mock_object(
+            api_manila, "share_server_index",
+            mock.Mock(return_value={test_data.share_server_errored.id}))
+        self.mock_object(
+            api_manila, "share_server_get",
+            mock.Mock(side_effect=fake_share_server_get))
+        self.mock_object(api_keystone, "tenant_get")
+
+        res = self.client.get(
+            INDEX_URL + '?action=bulk_row_update&table=share_servers'
+            '&obj_id=%s&obj_id=%s' % (share_servers[0].id, 'deleted_id'),
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(res.status_code, 200)
+        rows = res.json()['rows']
+        self.assertEqual([share_servers[0].id], list(rows))
+        self.assertIn('share_servers__delete__%s' % share_servers[0].id,
+                      rows[share_servers[0].id])
+        self.assertEqual(['deleted_id'], res.json()['deleted'])
+        api_manila.share_server_get.assert_has_calls([
+            mock.call(mock.ANY, share_servers[0].id),
+            mock.call(mock.ANY, 'deleted_id'),
+        ], any_order=True)
+        api_manila.share_server_index.assert_called_once_with(
+            mock.ANY, [share_servers[0].id])
+        api_manila.share_server_list.assert_not_called()
 
     def test_detail_view_share_server(self):
         share_server = test_data.share_server
@@ -133,3 +218,53 @@ class ShareServerTests(test.BaseAdminViewTests):
         self.assertRedirectsNoFollow(res, INDEX_URL)
         api_manila.share_server_get.assert_called_once_with(
             mock.ANY, share_server.id)
+
+    def test_export_share_servers(self):
+        share_servers = [
+            test_data.share_server,
+            test_data.share_server_errored,
+        ]
+        self.mock_object(
+            api_manila, "share_server_list",
+            mock.Mock(return_value=share_servers))
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=lambda request, project_id, admin: type(
+                'FakeProject', (object, ),
+                {'id': project_id, 'name': '%s_name' % project_id})))
+
+        res = self.client.get(EXPORT_URL)
+        lines = b''.join(res.streaming_content).decode().splitlines()
+
+        self.assertEqual(200, res.status_code)
+        self.assertEqual(3, len(lines))
+        for share_server, line in zip(share_servers, lines[1:]):
+            self.assertTrue(line.startswith('%s,%s,%s,%s_name,' % (
+                share_server.id, share_server.host, share_server.project_id,
+                share_server.project_id)))
+        api_manila.share_server_list.assert_called_once_with(mock.ANY)
+
+    @override_settings(OPENSTACK_MANILA_FEATURES={'api_max_limit': 2})
+    def test_export_share_servers_truncated(self):
+        share_servers = [
+            test_data.share_server,
+            test_data.share_server_errored,
+        ]
+        self.mock_object(
+            api_manila, "share_server_list",
+            mock.Mock(return_value=share_servers))
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=lambda request, project_id, admin: type(
+                'FakeProject', (object, ),
+                {'id': project_id, 'name': '%s_name' % project_id})))
+
+        res = self.client.get(EXPORT_URL)
+        chunks = []
+
+        self.assertEqual(200, res.status_code)
+        self.assertRaises(
+            export.TruncatedListError, chunks.extend, res.streaming_content)
+        lines = b''.join(chunks).decode().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertEqual(export.EXPORT_ERROR_MARKER, lines[-1])
@@ -19,7 +19,6 @@ from openstack_dashboard.api import keystone as api_keystone
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
-from manila_ui.dashboards.admin import utils
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 from manila_ui.tests.test_data import keystone_data
@@ -34,8 +33,9 @@ class SnapshotsTests(test.BaseAdminViewTests):
         self.mock_object(
             api_keystone, "tenant_list",
             mock.Mock(return_value=(keystone_data.projects, None)))
-        # Reset taken list of projects to avoid test interference
-        utils.PROJECTS = {}
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
 
     def test_detail_view(self):
         snapshot = test_data.snapshot
@@ -129,6 +129,27 @@ class SnapshotsTests(test.BaseAdminViewTests):
         api_manila.share_snapshot_get.assert_called_once_with(
             mock.ANY, test_data.snapshot.id)
 
+    def test_index_share_names(self):
+        share = test_data.share
+        snapshots = [test_data.snapshot, test_data.snapshot_mount_support]
+        self.mock_object(
+            api_manila, "share_snapshot_list",
+            mock.Mock(return_value=snapshots))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(side_effect=[
+                share, horizon_exceptions.NotFound()]))
+        self.mock_object(api_manila, "share_list")
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(200, res.status_code)
+        self.assertNoMessages()
+        self.assertContains(res, share.name)
+        api_manila.share_get.assert_has_calls([
+            mock.call(mock.ANY, snapshot.share_id)
+            for snapshot in snapshots], any_order=True)
+        api_manila.share_list.assert_not_called()
+
     def test_delete_snapshot(self):
         share = test_data.share
         snapshot = test_data.snapshot
@@ -138,14 +159,17 @@ class SnapshotsTests(test.BaseAdminViewTests):
             api_manila, "share_snapshot_list",
             mock.Mock(return_value=[snapshot]))
         self.mock_object(
-            api_manila, "share_list", mock.Mock(return_value=[share]))
+            api_manila, "share_get", mock.Mock(return_value=share))
+        self.mock_object(api_manila, "share_list")
 
         res = self.client.post(INDEX_URL, formData)
 
-        api_keystone.tenant_list.assert_called_once_with(mock.ANY)
+        api_keystone.tenant_get.assert_not_called()
         api_manila.share_snapshot_delete.assert_called_once_with(
             mock.ANY, test_data.snapshot.id)
         api_manila.share_snapshot_list.assert_called_once_with(
-            mock.ANY, search_opts={'all_tenants': True})
-        api_manila.share_list.assert_called_once_with(mock.ANY)
+            mock.ANY, limit=21, offset=0, search_opts={'all_tenants': True})
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, snapshot.share_id)
+        api_manila.share_list.assert_not_called()
         self.assertRedirectsNoFollow(res, INDEX_URL)
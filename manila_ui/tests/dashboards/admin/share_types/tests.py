@@ -14,12 +14,12 @@
 #    under the License.
 
 from django.urls import reverse
+from manilaclient.v2 import share_types
 from openstack_dashboard.api import keystone as api_keystone
 from openstack_dashboard.api import neutron as api_neutron
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
-from manila_ui.dashboards.admin import utils
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 from manila_ui.tests.test_data import keystone_data
@@ -42,8 +42,54 @@ class ShareTypeTests(test.BaseAdminViewTests):
             mock.Mock(return_value=(keystone_data.projects, None)))
         self.mock_object(
             api_neutron, "is_service_enabled", mock.Mock(return_value=[True]))
-        # Reset taken list of projects to avoid test interference
-        utils.PROJECTS = {}
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
+
+    def _set_filter(self, field, value):
+        res = self.client.post(INDEX_URL, {
+            'share_types__filter__q': value,
+            'share_types__filter__q_field': field})
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
+    def _share_type(self, name, extra_specs):
+        return share_types.ShareType(
+            share_types.ShareTypeManager(test_data.FakeAPIClient),
+            {'id': '%s-id' % name, 'name': name,
+             'share_type_access:is_public': True,
+             'extra_specs': extra_specs})
+
+    def test_index_filtered_by_extra_spec(self):
+        share_type = self._share_type('foo', {'snapshot_support': 'True'})
+        self._set_filter('extra_specs', 'snapshot_support = True')
+        self.mock_object(
+            api_manila, "share_type_list",
+            mock.Mock(return_value=[share_type]))
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(
+            [share_type], list(res.context['share_types_table'].data))
+        api_manila.share_type_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0,
+            search_opts={'extra_specs': {'snapshot_support': 'True'}})
+
+    def test_index_filtered_in_python(self):
+        types = [self._share_type('foo', {'snapshot_support': 'True'}),
+                 self._share_type('bar', {'mount_snapshot_support': 'x'}),
+                 self._share_type('baz', {'snapshot_support': 'False'})]
+        self._set_filter('extra_specs', 'TRUE')
+        self.mock_object(
+            api_manila, "share_type_list", mock.Mock(return_value=types))
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(
+            ['foo'],
+            [st.name for st in res.context['share_types_table'].data])
+        # NOTE: types are matched on their extra specs, not on the escaped
+        # HTML the table shows them as.
+        api_manila.share_type_list.assert_called_once_with(mock.ANY)
 
     def test_create_share_type(self):
         url = reverse('horizon:admin:share_types:create_type')
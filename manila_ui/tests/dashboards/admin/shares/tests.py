@@ -13,19 +13,24 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import csv
+import json
+
 import ddt
 from django.urls import reverse
+from manilaclient.v2 import shares as shares_api
 from openstack_dashboard.api import keystone as api_keystone
 from openstack_dashboard.api import neutron as api_neutron
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
-from manila_ui.dashboards.admin import utils
+from manila_ui.dashboards.admin import export
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 from manila_ui.tests.test_data import keystone_data
 
 INDEX_URL = reverse('horizon:admin:shares:index')
+EXPORT_URL = reverse('horizon:admin:shares:export')
 
 
 @ddt.ddt
@@ -33,23 +38,22 @@ class SharesTests(test.BaseAdminViewTests):
 
     def setUp(self):
         super(self.__class__, self).setUp()
-        self.mock_object(utils.timeutils, 'now', mock.Mock(return_value=1))
         self.mock_object(
             api_keystone, "tenant_list",
             mock.Mock(return_value=(keystone_data.projects, None)))
-        # Reset taken list of projects to avoid test interference
-        utils.PROJECTS = {}
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
 
     def test_index(self):
-        snaps = [test_data.snapshot]
         shares = [test_data.share, test_data.nameless_share,
                   test_data.other_share]
-        utils.timeutils.now.side_effect = [4] + [24 + i for i in range(4)]
 
         self.mock_object(
             api_manila, "share_list", mock.Mock(return_value=shares))
         self.mock_object(
-            api_manila, "share_snapshot_list", mock.Mock(return_value=snaps))
+            api_manila, "share_snapshot_index",
+            mock.Mock(return_value={test_data.share.id}))
         self.mock_object(
             api_neutron, "is_service_enabled", mock.Mock(return_value=[True]))
 
@@ -58,17 +62,44 @@ class SharesTests(test.BaseAdminViewTests):
         self.assertTemplateUsed(res, 'admin/shares/index.html')
         self.assertEqual(res.status_code, 200)
         api_manila.share_list.assert_called_with(
-            mock.ANY, search_opts={'all_tenants': True})
-        api_manila.share_snapshot_list.assert_called_with(
-            mock.ANY, detailed=True, search_opts={'all_tenants': True})
-        api_keystone.tenant_list.assert_called_once_with(mock.ANY)
+            mock.ANY, limit=21, offset=0, search_opts={'all_tenants': True})
+        api_manila.share_snapshot_index.assert_called_once_with(
+            mock.ANY, [share.id for share in shares],
+            search_opts={'all_tenants': True})
+        self.assertEqual(
+            [True, False, False],
+            [share.has_snapshot
+             for share in res.context['shares_table'].data])
+        api_keystone.tenant_get.assert_not_called()
+
+    def test_bulk_row_update(self):
+        self.mock_object(api_manila, "share_list")
+        self.mock_object(
+            api_manila, "share_get",
+            mock.Mock(return_value=test_data.share))
+        self.mock_object(
+            api_manila, "share_network_get",
+            mock.Mock(return_value=test_data.active_share_network))
+
+        res = self.client.get(
+            INDEX_URL + '?action=bulk_row_update&table=shares&obj_id=%s' %
+            test_data.share.id, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([test_data.share.id], list(res.json()['rows']))
+        self.assertEqual([], res.json()['deleted'])
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, test_data.share.id)
+        api_manila.share_network_get.assert_called_once_with(
+            mock.ANY, test_data.share.share_network_id)
+        api_manila.share_list.assert_not_called()
 
     def test_delete_share(self):
         url = reverse('horizon:admin:shares:index')
         share = test_data.share
         formData = {'action': 'shares__delete__%s' % share.id}
         self.mock_object(
-            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+            api_manila, "share_snapshot_index", mock.Mock(return_value=set()))
         self.mock_object(api_manila, "share_delete")
         self.mock_object(
             api_manila, "share_get", mock.Mock(return_value=share))
@@ -77,13 +108,13 @@ class SharesTests(test.BaseAdminViewTests):
 
         res = self.client.post(url, formData)
 
-        api_keystone.tenant_list.assert_called_once_with(mock.ANY)
+        api_keystone.tenant_get.assert_not_called()
         api_manila.share_delete.assert_called_once_with(
             mock.ANY, share.id, share_group_id=share.share_group_id)
         api_manila.share_list.assert_called_once_with(
-            mock.ANY, search_opts={'all_tenants': True})
-        api_manila.share_snapshot_list.assert_called_once_with(
-            mock.ANY, detailed=True, search_opts={'all_tenants': True})
+            mock.ANY, limit=21, offset=0, search_opts={'all_tenants': True})
+        api_manila.share_snapshot_index.assert_called_once_with(
+            mock.ANY, [share.id], search_opts={'all_tenants': True})
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
     @ddt.data(None, Exception('fake'))
@@ -249,3 +280,116 @@ class SharesTests(test.BaseAdminViewTests):
         else:
             self.assertTemplateUsed(
                 res, 'admin/shares/' + method + '.html')
+
+    def _get_export_shares(self):
+        return [
+            shares_api.Share(
+                shares_api.ShareManager(test_data.FakeAPIClient),
+                {'id': 'fake_share_id%s' % i, 'name': 'share%s' % i,
+                 'project_id': project_id, 'status': 'available',
+                 'size': i, 'share_proto': 'NFS', 'is_public': False})
+            for i, project_id in enumerate(('foo_id', 'bar_id', 'foo_id'))
+        ]
+
+    def _get_streamed_lines(self, res):
+        return b''.join(res.streaming_content).decode().splitlines()
+
+    def test_export_csv(self):
+        shares = self._get_export_shares()
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(side_effect=[shares[:2], shares[2:], []]))
+
+        res = self.client.get(EXPORT_URL)
+        lines = self._get_streamed_lines(res)
+
+        self.assertEqual(200, res.status_code)
+        self.assertEqual('text/csv', res['Content-Type'])
+        self.assertRegex(res['Content-Disposition'],
+                         r'^attachment; filename="shares-\d{14}\.csv"$')
+        self.assertEqual(4, len(lines))
+        self.assertTrue(
+            lines[0].startswith('id,name,project_id,project_name,'))
+        self.assertTrue(lines[1].startswith(
+            'fake_share_id0,share0,foo_id,foo_name,available,0,NFS,'))
+        self.assertTrue(lines[2].startswith(
+            'fake_share_id1,share1,bar_id,bar_name,available,1,NFS,'))
+        self.assertTrue(lines[3].startswith(
+            'fake_share_id2,share2,foo_id,foo_name,available,2,NFS,'))
+        api_manila.share_list.assert_has_calls([
+            mock.call(mock.ANY, limit=1000, offset=offset,
+                      search_opts={'all_tenants': True}, sort_key='id',
+                      sort_dir='asc')
+            for offset in (0, 2, 3)])
+
+    def test_export_csv_formulas_escaped(self):
+        shares = self._get_export_shares()
+        names = ['=HYPERLINK("http://example.com")', '@SUM(A1)', '-1+1']
+        for share, name in zip(shares, names):
+            share.name = name
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(side_effect=[shares, []]))
+
+        res = self.client.get(EXPORT_URL)
+        rows = list(csv.reader(self._get_streamed_lines(res)))
+
+        self.assertEqual(200, res.status_code)
+        self.assertEqual(["'%s" % name for name in names],
+                         [row[1] for row in rows[1:]])
+        # NOTE: numbers are not text and are kept as they are.
+        self.assertEqual(['0', '1', '2'], [row[5] for row in rows[1:]])
+
+    def test_export_ndjson(self):
+        shares = self._get_export_shares()
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(side_effect=[shares, []]))
+
+        res = self.client.get(EXPORT_URL + '?format=ndjson')
+        rows = [json.loads(line) for line in self._get_streamed_lines(res)]
+
+        self.assertEqual(200, res.status_code)
+        self.assertEqual('application/x-ndjson', res['Content-Type'])
+        self.assertEqual(['share0', 'share1', 'share2'],
+                         [row['name'] for row in rows])
+        self.assertEqual(['foo_name', 'bar_name', 'foo_name'],
+                         [row['project_name'] for row in rows])
+        self.assertIsNone(rows[0]['host'])
+
+    @ddt.data(
+        ('csv', export.EXPORT_ERROR_MARKER),
+        ('ndjson', json.dumps({'error': export.EXPORT_ERROR_MARKER})),
+    )
+    @ddt.unpack
+    def test_export_exception_once_started(self, export_format, marker):
+        shares = self._get_export_shares()
+        exc = type('CustomExc', (Exception, ), {})
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(side_effect=[shares[:2], exc]))
+        chunks = []
+
+        res = self.client.get(EXPORT_URL + '?format=%s' % export_format)
+
+        self.assertEqual(200, res.status_code)
+        self.assertRaises(exc, chunks.extend, res.streaming_content)
+        lines = b''.join(chunks).decode().splitlines()
+        self.assertEqual(marker, lines[-1])
+        self.assertEqual(2, len([line for line in lines
+                                 if 'fake_share_id' in line]))
+
+    def test_export_unknown_format(self):
+        self.mock_object(api_manila, "share_list")
+
+        res = self.client.get(EXPORT_URL + '?format=xml')
+
+        self.assertEqual(400, res.status_code)
+        api_manila.share_list.assert_not_called()
+
+    def test_export_exception(self):
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(side_effect=type('CustomExc', (Exception, ), {})))
+
+        res = self.client.get(EXPORT_URL)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
@@ -0,0 +1,298 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from django.core.cache import cache
+from keystoneclient import exceptions as keystone_exceptions
+from openstack_dashboard.api import keystone as api_keystone
+
+from manila_ui.dashboards.admin import utils
+from manila_ui.tests import helpers as base
+from manila_ui.tests.test_data import keystone_data
+
+
+class ProjectNameCacheTests(base.TestCase):
+
+    def setUp(self):
+        super(ProjectNameCacheTests, self).setUp()
+        self.request = self._get_request('RegionOne')
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
+        self.mock_object(
+            api_keystone, "tenant_list",
+            mock.Mock(return_value=(keystone_data.projects, False)))
+        self.now = self.mock_object(
+            utils.timeutils, "utcnow_ts", mock.Mock(return_value=1000))
+        self.mock_object(utils.exceptions, "handle")
+
+    def _get_request(self, region):
+        return mock.Mock(user=mock.Mock(
+            endpoint='http://keystone.example.com/identity/v3',
+            services_region=region))
+
+    def test_get_project_names(self):
+        result = utils.get_project_names(
+            self.request, ['foo_id', 'bar_id', None, 'foo_id'])
+
+        self.assertEqual({'foo_id': 'foo_name', 'bar_id': 'bar_name'}, result)
+        api_keystone.tenant_get.assert_has_calls([
+            mock.call(self.request, 'bar_id', admin=True),
+            mock.call(self.request, 'foo_id', admin=True),
+        ], any_order=True)
+        self.assertEqual(2, api_keystone.tenant_get.call_count)
+        api_keystone.tenant_list.assert_not_called()
+
+    def test_get_project_names_cached(self):
+        utils.get_project_names(self.request, ['foo_id'])
+        api_keystone.tenant_get.reset_mock()
+
+        result = utils.get_project_names(self.request, ['foo_id', 'bar_id'])
+
+        self.assertEqual({'foo_id': 'foo_name', 'bar_id': 'bar_name'}, result)
+        api_keystone.tenant_get.assert_called_once_with(
+            self.request, 'bar_id', admin=True)
+
+    def test_get_project_names_not_found(self):
+        result = utils.get_project_names(self.request, ['deleted_id'])
+        result_cached = utils.get_project_names(self.request, ['deleted_id'])
+
+        self.assertEqual({'deleted_id': None}, result)
+        self.assertEqual(result, result_cached)
+        api_keystone.tenant_get.assert_called_once_with(
+            self.request, 'deleted_id', admin=True)
+
+    def test_get_project_names_many_missing(self):
+        project_ids = ['foo_id'] + [
+            'fake_%s' % i for i in range(utils.PROJECT_NAME_MAX_LOOKUPS)]
+
+        result = utils.get_project_names(self.request, project_ids)
+
+        self.assertEqual('foo_name', result.pop('foo_id'))
+        self.assertEqual(
+            dict.fromkeys(project_ids[1:]), result)
+        api_keystone.tenant_list.assert_called_once_with(self.request)
+        api_keystone.tenant_get.assert_not_called()
+        # Projects of the full listing are cached too
+        self.assertEqual(
+            {'bar_id': 'bar_name'},
+            utils.get_project_names(self.request, ['bar_id']))
+        api_keystone.tenant_get.assert_not_called()
+
+    def test_get_project_names_per_region(self):
+        utils.get_project_names(self.request, ['foo_id'])
+        other_request = self._get_request('RegionTwo')
+
+        utils.get_project_names(other_request, ['foo_id'])
+
+        api_keystone.tenant_get.assert_has_calls([
+            mock.call(self.request, 'foo_id', admin=True),
+            mock.call(other_request, 'foo_id', admin=True),
+        ])
+
+    def _make_stale(self):
+        utils.get_project_names(self.request, ['foo_id'])
+        api_keystone.tenant_get.reset_mock()
+        api_keystone.tenant_get.side_effect = None
+        api_keystone.tenant_get.return_value = type(
+            'Project', (object, ), {'id': 'foo_id', 'name': 'new_name'})
+        self.now.return_value += utils.DEFAULT_PROJECT_NAME_CACHE_TTL + 1
+
+    def test_get_project_names_stale(self):
+        self._make_stale()
+
+        result = utils.get_project_names(self.request, ['foo_id'])
+        result_cached = utils.get_project_names(self.request, ['foo_id'])
+
+        self.assertEqual({'foo_id': 'new_name'}, result)
+        self.assertEqual({'foo_id': 'new_name'}, result_cached)
+        api_keystone.tenant_get.assert_called_once_with(
+            self.request, 'foo_id', admin=True)
+
+    def test_get_project_names_stale_refresh_running(self):
+        self._make_stale()
+        scope = utils._get_project_name_cache_scope(self.request)
+        cache.add('%s:%s:refresh' % (utils.PROJECT_NAME_CACHE_PREFIX, scope),
+                  True)
+
+        result = utils.get_project_names(self.request, ['foo_id'])
+
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        api_keystone.tenant_get.assert_not_called()
+
+    def test_get_project_names_stale_refresh_error(self):
+        self._make_stale()
+        api_keystone.tenant_get.side_effect = Exception('fake')
+
+        result = utils.get_project_names(self.request, ['foo_id'])
+
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        utils.exceptions.handle.assert_not_called()
+        scope = utils._get_project_name_cache_scope(self.request)
+        self.assertIsNone(cache.get(
+            '%s:%s:refresh' % (utils.PROJECT_NAME_CACHE_PREFIX, scope)))
+
+    def test_get_project_names_error(self):
+        utils.get_project_names(self.request, ['foo_id'])
+        api_keystone.tenant_get.side_effect = Exception('fake')
+
+        result = utils.get_project_names(self.request, ['foo_id', 'bar_id'])
+
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        utils.exceptions.handle.assert_called_once_with(
+            self.request, mock.ANY)
+
+    def test_set_project_name_to_objects(self):
+        objects = [mock.Mock(project_id='foo_id'),
+                   mock.Mock(project_id='deleted_id'),
+                   mock.Mock(spec=[])]
+
+        utils.set_project_name_to_objects(self.request, objects)
+
+        self.assertEqual(
+            ['foo_name', None, None],
+            [obj.project_name for obj in objects])
+
+
+class UserNameCacheTests(base.TestCase):
+
+    def setUp(self):
+        super(UserNameCacheTests, self).setUp()
+        cache.clear()
+        self.request = self._get_request('admin_user_id', 'admin')
+        self.users = {
+            'foo_id': base.FakeEntity('foo_id', 'foo_name'),
+            'bar_id': base.FakeEntity('bar_id', 'bar_name'),
+        }
+        self.mock_object(
+            api_keystone, "user_get",
+            mock.Mock(side_effect=self._user_get))
+
+    def _get_request(self, user_id, *roles):
+        return mock.Mock(user=mock.Mock(
+            id=user_id, project_id='fake_project_id',
+            roles=[{'name': role} for role in roles],
+            endpoint='http://keystone.example.com/identity/v3',
+            services_region='RegionOne'))
+
+    def _user_get(self, request, user_id, admin=True):
+        if request.user.roles != [{'name': 'admin'}]:
+            raise keystone_exceptions.Forbidden()
+        if user_id == 'failing_id':
+            raise Exception('fake')
+        if user_id == 'forbidden_id':
+            raise keystone_exceptions.Forbidden()
+        if user_id == 'unauthorized_id':
+            raise keystone_exceptions.Unauthorized()
+        if user_id not in self.users:
+            raise keystone_exceptions.NotFound()
+        return self.users[user_id]
+
+    def test_get_user_names(self):
+        result = utils.get_user_names(
+            self.request, ['foo_id', 'bar_id', None, 'foo_id'])
+
+        self.assertEqual({'foo_id': 'foo_name', 'bar_id': 'bar_name'}, result)
+        api_keystone.user_get.assert_has_calls([
+            mock.call(self.request, 'bar_id', admin=True),
+            mock.call(self.request, 'foo_id', admin=True),
+        ], any_order=True)
+        self.assertEqual(2, api_keystone.user_get.call_count)
+
+    def test_get_user_names_cached(self):
+        utils.get_user_names(self.request, ['foo_id'])
+        api_keystone.user_get.reset_mock()
+
+        result = utils.get_user_names(self.request, ['foo_id', 'bar_id'])
+
+        self.assertEqual({'foo_id': 'foo_name', 'bar_id': 'bar_name'}, result)
+        api_keystone.user_get.assert_called_once_with(
+            self.request, 'bar_id', admin=True)
+
+    def test_get_user_names_not_found(self):
+        result = utils.get_user_names(self.request, ['deleted_id'])
+        result_cached = utils.get_user_names(self.request, ['deleted_id'])
+
+        self.assertEqual({}, result)
+        self.assertEqual(result, result_cached)
+        api_keystone.user_get.assert_called_once_with(
+            self.request, 'deleted_id', admin=True)
+
+    @mock.patch.object(cache, 'set_many', wraps=cache.set_many)
+    def test_get_user_names_denied(self, set_many):
+        user_ids = ['forbidden_id', 'unauthorized_id']
+
+        result = utils.get_user_names(self.request, user_ids + ['foo_id'])
+        result_cached = utils.get_user_names(self.request, user_ids)
+
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        self.assertEqual({}, result_cached)
+        self.assertEqual(3, api_keystone.user_get.call_count)
+        self.assertEqual(
+            [([('foo_name',)], utils.DEFAULT_USER_NAME_CACHE_TTL),
+             ([(None,), (None,)], utils.USER_NAME_DENIED_CACHE_TTL)],
+            [(list(args[0].values()), kwargs['timeout'])
+             for args, kwargs in set_many.call_args_list])
+
+    def test_get_user_names_per_roles(self):
+        member_request = self._get_request('member_id', 'member')
+
+        member_result = utils.get_user_names(member_request, ['foo_id'])
+        result = utils.get_user_names(self.request, ['foo_id'])
+        member_result_cached = utils.get_user_names(
+            member_request, ['foo_id'])
+
+        # NOTE: the denial of a member neither hides the name from admins
+        # nor is hidden by the name admins may look up.
+        self.assertEqual({}, member_result)
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        self.assertEqual({}, member_result_cached)
+        api_keystone.user_get.assert_has_calls([
+            mock.call(member_request, 'foo_id', admin=True),
+            mock.call(self.request, 'foo_id', admin=True),
+        ])
+        self.assertEqual(2, api_keystone.user_get.call_count)
+
+    def test_get_user_names_denied_per_user(self):
+        utils.get_user_names(self._get_request('member_id', 'member'),
+                             ['foo_id'])
+        other_request = self._get_request('other_member_id', 'member')
+
+        result = utils.get_user_names(other_request, ['foo_id'])
+
+        self.assertEqual({}, result)
+        api_keystone.user_get.assert_called_with(
+            other_request, 'foo_id', admin=True)
+        self.assertEqual(2, api_keystone.user_get.call_count)
+
+    def test_get_user_names_shared_per_roles(self):
+        utils.get_user_names(self.request, ['foo_id'])
+        other_request = self._get_request('other_admin_id', 'admin')
+
+        result = utils.get_user_names(other_request, ['foo_id'])
+
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        api_keystone.user_get.assert_called_once_with(
+            self.request, 'foo_id', admin=True)
+
+    def test_get_user_names_error(self):
+        result = utils.get_user_names(self.request, ['failing_id', 'foo_id'])
+        result_retried = utils.get_user_names(self.request, ['failing_id'])
+
+        self.assertEqual({'foo_id': 'foo_name'}, result)
+        self.assertEqual({}, result_retried)
+        self.assertEqual(3, api_keystone.user_get.call_count)
+
+    def test_get_user_names_none(self):
+        self.assertEqual({}, utils.get_user_names(self.request, [None]))
+        api_keystone.user_get.assert_not_called()
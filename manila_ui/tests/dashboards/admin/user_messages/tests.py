@@ -20,7 +20,6 @@ from unittest import mock
 from horizon import exceptions as horizon_exceptions
 
 from manila_ui.api import manila as api_manila
-from manila_ui.dashboards.admin import utils
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 from manila_ui.tests.test_data import keystone_data
@@ -37,8 +36,9 @@ class UserMessagesViewTests(test.BaseAdminViewTests):
         self.mock_object(
             api_keystone, "tenant_list",
             mock.Mock(return_value=(keystone_data.projects, None)))
-        # Reset taken list of projects to avoid test interference
-        utils.PROJECTS = {}
+        self.mock_object(
+            api_keystone, "tenant_get",
+            mock.Mock(side_effect=keystone_data.tenant_get))
 
     @ddt.data(None, Exception('fake'))
     def test_view(self, exc):
@@ -54,7 +54,8 @@ class UserMessagesViewTests(test.BaseAdminViewTests):
         self.client.get(url)
 
         self.assertNoMessages()
-        api_manila.messages_list.assert_called_once_with(mock.ANY)
+        api_manila.messages_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
 
     @ddt.data(None, Exception('fake'))
     def test_delete_message(self, exc):
@@ -71,7 +72,8 @@ class UserMessagesViewTests(test.BaseAdminViewTests):
         self.assertEqual(res.status_code, 302)
 
         self.assertRedirectsNoFollow(res, INDEX_URL)
-        api_manila.messages_list.assert_called_once_with(mock.ANY)
+        api_manila.messages_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
         api_manila.messages_delete.assert_called_once_with(
             mock.ANY, test_data.fake_message_1.id)
 
@@ -11,6 +11,7 @@
 #    under the License.
 
 from django.urls import reverse
+from manilaclient.v2 import resource_locks
 from unittest import mock
 
 from openstack_auth import policy
@@ -33,8 +34,11 @@ class ResourceLocksViewTests(test.TestCase):
             api_manila, "resource_lock_list",
             mock.Mock(return_value=locks))
         self.mock_object(
-            api_manila, "share_list",
-            mock.Mock(return_value=[share]))
+            api_manila, "share_get",
+            mock.Mock(return_value=share))
+        self.mock_object(
+            api_manila, "share_rules_list",
+            mock.Mock(return_value=[]))
         self.mock_object(
             api_manila, "share_rule_get",
             mock.Mock(return_value=rule))
@@ -56,8 +60,86 @@ class ResourceLocksViewTests(test.TestCase):
         self.assertEqual(api_manila.resource_lock_list.call_count, 1)
         api_manila.resource_lock_list.assert_called_once_with(
             mock.ANY, search_opts={})
+        api_manila.share_get.assert_called_once_with(mock.ANY, share.id)
+        api_manila.share_rules_list.assert_called_once_with(
+            mock.ANY, share.id)
         api_manila.share_rule_get.assert_called_once_with(mock.ANY, rule.id)
 
+    def test_index_view_rules_listed_per_share(self):
+        share = test_data.share
+        rule = test_data.ip_rule
+        locks = test_data.resource_locks_list
+        self.mock_object(
+            api_manila, "resource_lock_list",
+            mock.Mock(return_value=locks))
+        self.mock_object(
+            api_manila, "share_get",
+            mock.Mock(return_value=share))
+        self.mock_object(
+            api_manila, "share_rules_list",
+            mock.Mock(return_value=[rule]))
+        self.mock_object(api_manila, "share_rule_get")
+        self.mock_object(
+            policy, "check",
+            mock.Mock(side_effect=(lambda *args, **kwargs: True)))
+        res = self.client.get(INDEX_URL)
+        self.assertNoMessages()
+        rules_table = res.context['rules_locks_table'].data
+        self.assertEqual(len(rules_table), 1)
+        self.assertEqual(rules_table[0].access_to, rule.access_to)
+        self.assertEqual(rules_table[0].parent_resource_name, share.name)
+        api_manila.share_get.assert_called_once_with(mock.ANY, share.id)
+        api_manila.share_rules_list.assert_called_once_with(
+            mock.ANY, share.id)
+        self.assertFalse(api_manila.share_rule_get.called)
+
+    def test_index_view_shares_fetched_by_id(self):
+        share = test_data.share
+        rule = test_data.ip_rule
+        locks = test_data.resource_locks_list
+        self.mock_object(
+            api_manila, "resource_lock_list",
+            mock.Mock(return_value=locks))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(return_value=share))
+        self.mock_object(api_manila, "share_list")
+        self.mock_object(
+            api_manila, "share_rules_list",
+            mock.Mock(return_value=[rule]))
+        self.mock_object(
+            policy, "check",
+            mock.Mock(side_effect=(lambda *args, **kwargs: True)))
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertNoMessages()
+        shares_table = res.context['shares_locks_table'].data
+        rules_table = res.context['rules_locks_table'].data
+        self.assertEqual(shares_table[0].resource_name, share.name)
+        self.assertEqual(rules_table[0].parent_resource_name, share.name)
+        api_manila.share_get.assert_called_once_with(mock.ANY, share.id)
+        self.assertFalse(api_manila.share_list.called)
+
+    def test_index_view_named_locks_not_resolved(self):
+        lock = resource_locks.ResourceLock(
+            test_data.lock_1.manager,
+            dict(test_data.lock_1._info, resource_name="Named share"))
+        self.mock_object(
+            api_manila, "resource_lock_list",
+            mock.Mock(return_value=[lock]))
+        self.mock_object(api_manila, "share_get")
+        self.mock_object(api_manila, "share_list")
+        self.mock_object(
+            policy, "check",
+            mock.Mock(side_effect=(lambda *args, **kwargs: True)))
+        res = self.client.get(INDEX_URL)
+        self.assertNoMessages()
+        shares_table = res.context['shares_locks_table'].data
+        self.assertEqual(len(shares_table), 1)
+        self.assertEqual(shares_table[0].resource_name, "Named share")
+        self.assertFalse(api_manila.share_get.called)
+        self.assertFalse(api_manila.share_list.called)
+
     def test_update_lock_get(self):
         lock = test_data.lock_1
         self.mock_object(
@@ -97,8 +179,8 @@ class ResourceLocksViewTests(test.TestCase):
         self.mock_object(api_manila, "resource_lock_delete")
         self.mock_object(api_manila, "resource_lock_list",
                          mock.Mock(return_value=test_data.resource_locks_list))
-        self.mock_object(api_manila, "share_list",
-                         mock.Mock(return_value=test_data.shares_list))
+        self.mock_object(api_manila, "share_get",
+                         mock.Mock(return_value=test_data.share))
         self.mock_object(api.keystone, "user_list",
                          mock.Mock(return_value=[self.user]))
         self.mock_object(policy, "check",
@@ -125,20 +207,48 @@ class ResourceLocksViewTests(test.TestCase):
         expected_url = f"{INDEX_URL}?tab=resource_lock_tabs__rules_tab"
         self.assertRedirectsNoFollow(res, expected_url)
 
-    def test_index_view_user_list_failure_shows_id(self):
-        lock = test_data.lock_1
-        lock.user_id = "non-existent-user-uuid"
+    def test_index_view_user_get_failure_shows_id(self):
+        lock = resource_locks.ResourceLock(
+            test_data.lock_1.manager,
+            dict(test_data.lock_1._info, user_id="non-existent-user-uuid"))
         locks = [lock]
         self.mock_object(api_manila, "resource_lock_list",
                          mock.Mock(return_value=locks))
-        self.mock_object(api_manila, "share_list",
-                         mock.Mock(return_value=[test_data.share]))
-        self.mock_object(api.keystone, "user_list",
+        self.mock_object(api_manila, "share_get",
+                         mock.Mock(return_value=test_data.share))
+        self.mock_object(api.keystone, "user_get",
                          mock.Mock(side_effect=Exception("Keystone down")))
+        self.mock_object(api.keystone, "user_list")
         self.mock_object(policy, "check",
                          mock.Mock(side_effect=(lambda *args, **kwargs: True)))
         res = self.client.get(INDEX_URL)
         self.assertNoMessages()
         shares_table = res.context['shares_locks_table'].data
         self.assertEqual(shares_table[0].user_name, "non-existent-user-uuid")
-        api.keystone.user_list.assert_called_once()
+        api.keystone.user_get.assert_called_once_with(
+            mock.ANY, "non-existent-user-uuid", admin=True)
+        self.assertFalse(api.keystone.user_list.called)
+
+    def test_index_view_user_name_looked_up(self):
+        user = test.FakeEntity("other-user-uuid", "other_user")
+        lock = resource_locks.ResourceLock(
+            test_data.lock_1.manager,
+            dict(test_data.lock_1._info, user_id=user.id))
+        self.mock_object(api_manila, "resource_lock_list",
+                         mock.Mock(return_value=[lock]))
+        self.mock_object(api_manila, "share_get",
+                         mock.Mock(return_value=test_data.share))
+        self.mock_object(api.keystone, "user_get",
+                         mock.Mock(return_value=user))
+        self.mock_object(api.keystone, "user_list")
+        self.mock_object(policy, "check",
+                         mock.Mock(side_effect=(lambda *args, **kwargs: True)))
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertNoMessages()
+        shares_table = res.context['shares_locks_table'].data
+        self.assertEqual(shares_table[0].user_name, user.name)
+        api.keystone.user_get.assert_called_once_with(
+            mock.ANY, user.id, admin=True)
+        self.assertFalse(api.keystone.user_list.called)
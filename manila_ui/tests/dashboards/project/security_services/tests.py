@@ -71,7 +71,8 @@ class SecurityServicesViewTests(test.TestCase):
 
         res = self.client.post(INDEX_URL, formData)
 
-        api_manila.security_service_list.assert_called_with(mock.ANY)
+        api_manila.security_service_list.assert_called_with(
+            mock.ANY, limit=21, offset=0)
         api_manila.security_service_delete.assert_called_with(
             mock.ANY, security_service.id)
         self.assertRedirectsNoFollow(res, INDEX_URL)
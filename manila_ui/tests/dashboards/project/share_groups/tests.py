@@ -43,7 +43,7 @@ class ShareGroupTests(test.TestCase):
 
         self.assertStatusCode(res, 200)
         api_manila.share_group_list.assert_called_once_with(
-            mock.ANY, detailed=True)
+            mock.ANY, limit=21, offset=0, detailed=True)
         self.assertTemplateUsed(res, 'project/share_groups/index.html')
         self.assertContains(res, "<h1>Share Groups</h1>")
         self.assertContains(res, 'Delete Share Group</button>', len(sgs))
@@ -212,7 +212,7 @@ class ShareGroupTests(test.TestCase):
         self.assertMessageCount(success=1)
         api_manila.share_group_delete.assert_called_once_with(mock.ANY, sg.id)
         api_manila.share_group_list.assert_called_once_with(
-            mock.ANY, detailed=True)
+            mock.ANY, limit=21, offset=0, detailed=True)
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
     def test_share_group_create_get(self):
@@ -92,17 +92,17 @@ class ShareNetworkSubnetsViewTests(test.TestCase):
                          mock.Mock(return_value=[]))
         self.mock_object(api_manila, "share_server_list",
                          mock.Mock(return_value=[]))
-        self.mock_object(api.neutron, "network_get",
-                         mock.Mock(return_value=self.networks.first()))
-        self.mock_object(api.neutron, "subnet_get",
-                         mock.Mock(return_value=self.subnets.first()))
+        self.mock_object(api.neutron, "network_list",
+                         mock.Mock(return_value=[self.networks.first()]))
+        self.mock_object(api.neutron, "subnet_list",
+                         mock.Mock(return_value=[self.subnets.first()]))
         self.mock_object(api_manila, "availability_zone_list",
                          mock.Mock(return_value=[]))
         res = self.client.get(url)
         self.assertTemplateUsed(res, 'project/share_networks/detail.html')
         self.assertContains(res, "Subnets")
-        api.neutron.network_get.assert_called()
-        api.neutron.subnet_get.assert_called()
+        api.neutron.network_list.assert_called_once()
+        api.neutron.subnet_list.assert_called_once()
 
     def test_update_subnet_metadata_get(self):
         share_net = test_data.active_share_network
@@ -95,7 +95,7 @@ class ShareNetworksViewTests(test.TestCase):
 
         self.assertRedirectsNoFollow(res, INDEX_URL)
         api_manila.share_network_list.assert_called_once_with(
-            mock.ANY, detailed=True)
+            mock.ANY, limit=21, offset=0, detailed=True)
         api_manila.share_network_delete.assert_called_once_with(
             mock.ANY, share_network.id)
 
@@ -114,9 +114,15 @@ class ShareNetworksViewTests(test.TestCase):
         subnet = self.subnets.first()
 
         self.mock_object(
-            api.neutron, "network_get", mock.Mock(return_value=network))
+            api.neutron, "network_list",
+            mock.Mock(side_effect=lambda request, id: [
+                api.neutron.Network(dict(network.to_dict(), id=net_id))
+                for net_id in id]))
         self.mock_object(
-            api.neutron, "subnet_get", mock.Mock(return_value=subnet))
+            api.neutron, "subnet_list",
+            mock.Mock(side_effect=lambda request, id: [
+                api.neutron.Subnet(dict(subnet.to_dict(), id=subnet_id))
+                for subnet_id in id]))
         self.mock_object(
             api_manila, "availability_zone_list",
             mock.Mock(return_value=[self.FakeAZ('fake_az', 'fake_az')])
@@ -142,15 +148,12 @@ class ShareNetworksViewTests(test.TestCase):
                 res, ("<a href=\"/project/networks/subnets/%s/detail\">%s</a>"
                       % (sub['neutron_subnet_id'], subnet['name'])),
                 status_code=200)
-        network_get_calls = [mock.call(mock.ANY, sub['neutron_net_id'])
-                             for sub in share_network_subnets]
-        subnet_get_calls = [mock.call(mock.ANY, sub['neutron_subnet_id'])
-                            for sub in share_network_subnets]
-
-        api.neutron.network_get.assert_has_calls(network_get_calls,
-                                                 any_order=True)
-        api.neutron.subnet_get.assert_has_calls(subnet_get_calls,
-                                                any_order=True)
+        api.neutron.network_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_net_id']
+                                 for sub in share_network_subnets}))
+        api.neutron.subnet_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_subnet_id']
+                                 for sub in share_network_subnets}))
         self.assertContains(res, "<a href=\"/project/security_services"
                                  "/%s\">%s</a>" % (sec_service.id,
                                                    sec_service.name), 1, 200)
@@ -175,11 +178,11 @@ class ShareNetworksViewTests(test.TestCase):
             api_manila, "share_network_security_service_list",
             mock.Mock(return_value=[sec_service]))
         self.mock_object(
-            api.neutron, "network_get", mock.Mock(
-                side_effect=exceptions.NeutronClientException('fake', 500)))
+            api.neutron, "network_list", mock.Mock(return_value=[]))
         self.mock_object(
-            api.neutron, "subnet_get", mock.Mock(
-                side_effect=exceptions.NeutronClientException('fake', 500)))
+            api.neutron, "subnet_list", mock.Mock(
+                side_effect=exceptions.NeutronClientException(
+                    'fake', status_code=500)))
         self.mock_object(
             api_manila, "availability_zone_list",
             mock.Mock(return_value=[])
@@ -195,15 +198,12 @@ class ShareNetworksViewTests(test.TestCase):
             self.assertNotContains(res, "<dd>%s</dd>" % sub['neutron_net_id'])
             self.assertNotContains(res,
                                    "<dd>%s</dd>" % sub['neutron_subnet_id'])
-        network_get_calls = [mock.call(mock.ANY, sub['neutron_net_id']
-                                       ) for sub in share_network_subnets]
-        subnet_get_calls = [mock.call(mock.ANY, sub['neutron_subnet_id']
-                                      ) for sub in share_network_subnets]
-
-        api.neutron.network_get.assert_has_calls(network_get_calls,
-                                                 any_order=True)
-        api.neutron.subnet_get.assert_has_calls(subnet_get_calls,
-                                                any_order=True)
+        api.neutron.network_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_net_id']
+                                 for sub in share_network_subnets}))
+        api.neutron.subnet_list.assert_called_once_with(
+            mock.ANY, id=sorted({sub['neutron_subnet_id']
+                                 for sub in share_network_subnets}))
         self.assertContains(res, "<a href=\"/project/security_services"
                                  "/%s\">%s</a>" % (sec_service.id,
                                                    sec_service.name), 1, 200)
@@ -12,12 +12,19 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
+
 import ddt
 from django.urls import reverse
+from horizon import messages as horizon_messages
+from manilaclient import exceptions as manila_exceptions
 from openstack_dashboard.api import neutron
+from oslo_utils import timeutils
 from unittest import mock
 
 from manila_ui.api import manila as api_manila
+from manila_ui.dashboards.project.share_snapshots import tabs as ss_tabs
+from manila_ui.dashboards.project.share_snapshots import views as ss_views
 from manila_ui.tests.dashboards.project import test_data
 from manila_ui.tests import helpers as test
 
@@ -27,6 +34,17 @@ INDEX_URL = reverse('horizon:project:share_snapshots:index')
 @ddt.ddt
 class SnapshotSnapshotViewTests(test.TestCase):
 
+    def _mock_share_get(self, shares):
+        shares = dict((share.id, share) for share in shares)
+
+        def fake_share_get(request, share_id):
+            if share_id not in shares:
+                raise manila_exceptions.NotFound(404)
+            return shares[share_id]
+
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(side_effect=fake_share_get))
+
     def test_create_snapshot_get(self):
         share = test_data.share
         usage_limit = {
@@ -70,6 +88,178 @@ class SnapshotSnapshotViewTests(test.TestCase):
             metadata={})
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
+    def test_create_snapshots_get(self):
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        self._mock_share_get([test_data.share, test_data.other_share])
+        self.mock_object(api_manila, "share_list")
+        self.mock_object(api_manila, "tenant_absolute_limits")
+
+        res = self.client.get(url + '?share_id=%s&share_id=fake_id' % (
+            test_data.share.id))
+
+        self.assertNoMessages()
+        self.assertTemplateUsed(
+            res, 'project/share_snapshots/create_snapshots.html')
+        self.assertContains(res, '<li>%s</li>' % test_data.share.name)
+        self.assertContains(res, '<li>fake_id</li>')
+        self.assertContains(res, 'The following shares were not found')
+        self.assertNotContains(res, test_data.other_share.name)
+        api_manila.share_get.assert_has_calls([
+            mock.call(mock.ANY, test_data.share.id),
+            mock.call(mock.ANY, 'fake_id'),
+        ], any_order=True)
+        self.assertEqual(2, api_manila.share_get.call_count)
+        api_manila.share_list.assert_not_called()
+        api_manila.tenant_absolute_limits.assert_not_called()
+
+    def test_create_snapshots_post(self):
+        shares = [test_data.share, test_data.other_share]
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        formData = {
+            'name_template': '{name}-before-upgrade',
+            'description': 'fake_description',
+            'metadata': 'foo=bar',
+            'share_ids': [share.id for share in shares],
+        }
+        self._mock_share_get(shares)
+        self.mock_object(
+            api_manila, "tenant_absolute_limits",
+            mock.Mock(return_value=test_data.limits))
+        self.mock_object(api_manila, "share_snapshot_create")
+
+        res = self.client.post(url, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        api_manila.tenant_absolute_limits.assert_called_once_with(mock.ANY)
+        self.assertEqual(2, api_manila.share_snapshot_create.call_count)
+        api_manila.share_snapshot_create.assert_has_calls([
+            mock.call(mock.ANY, share.id,
+                      name='%s-before-upgrade' % share.name,
+                      description=formData['description'],
+                      metadata={'foo': 'bar'})
+            for share in shares
+        ], any_order=True)
+
+    def test_create_snapshots_post_not_found(self):
+        share = test_data.share
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        formData = {
+            'name_template': '{name}',
+            'share_ids': [share.id, 'fake_id'],
+        }
+        self._mock_share_get([share])
+        self.mock_object(
+            api_manila, "tenant_absolute_limits",
+            mock.Mock(return_value=test_data.limits))
+        self.mock_object(api_manila, "share_snapshot_create")
+        self.mock_object(horizon_messages, "error")
+
+        res = self.client.post(url, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        api_manila.share_snapshot_create.assert_called_once_with(
+            mock.ANY, share.id, name=share.name, description='',
+            metadata={})
+        horizon_messages.error.assert_called_once_with(
+            mock.ANY, 'Unable to find shares: fake_id')
+
+    @ddt.data(
+        {'maxTotalShareSnapshots': 2, 'totalShareSnapshotsUsed': 1},
+        {'maxTotalSnapshotGigabytes': 1000,
+         'totalSnapshotGigabytesUsed': 1000},
+    )
+    def test_create_snapshots_post_quota_exceeded(self, usages):
+        shares = [test_data.share, test_data.other_share]
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        formData = {
+            'name_template': '{name}-{date}',
+            'share_ids': [share.id for share in shares],
+        }
+        limits = dict(test_data.limits, **usages)
+        self._mock_share_get(shares)
+        self.mock_object(
+            api_manila, "tenant_absolute_limits",
+            mock.Mock(return_value=limits))
+        self.mock_object(api_manila, "share_snapshot_create")
+
+        res = self.client.post(url, formData)
+
+        self.assertEqual(200, res.status_code)
+        self.assertContains(res, 'The snapshot quota allows')
+        api_manila.share_snapshot_create.assert_not_called()
+
+    @ddt.data('{name}-{foo}', '{name:>999999999}', '{name.__class__}',
+              '{0}')
+    def test_create_snapshots_post_invalid_template(self, name_template):
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        formData = {
+            'name_template': name_template,
+            'share_ids': [test_data.share.id],
+        }
+        self._mock_share_get([test_data.share])
+        self.mock_object(
+            api_manila, "tenant_absolute_limits",
+            mock.Mock(return_value=test_data.limits))
+        self.mock_object(api_manila, "share_snapshot_create")
+
+        res = self.client.post(url, formData)
+
+        self.assertFormErrors(res, 1)
+        api_manila.share_snapshot_create.assert_not_called()
+
+    def test_create_snapshots_post_name_too_long(self):
+        shares = [test_data.share, test_data.other_share]
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        # NOTE: the template fits, the names with the IDs of the shares do
+        # not.
+        formData = {
+            'name_template': 'a' * 240 + '{id}',
+            'share_ids': [share.id for share in shares],
+        }
+        self._mock_share_get(shares)
+        self.mock_object(
+            api_manila, "tenant_absolute_limits",
+            mock.Mock(return_value=test_data.limits))
+        self.mock_object(api_manila, "share_snapshot_create")
+
+        res = self.client.post(url, formData)
+
+        self.assertEqual(200, res.status_code)
+        self.assertContains(
+            res, 'would be longer than 255 characters: %s, %s' % (
+                shares[0].name, shares[1].name))
+        api_manila.share_snapshot_create.assert_not_called()
+
+    def test_create_snapshots_post_tokens_replaced_once(self):
+        share = test_data.share
+        url = reverse(
+            'horizon:project:share_snapshots:share_snapshots_create')
+        formData = {
+            'name_template': '{id}-{{date}}',
+            'share_ids': [share.id],
+        }
+        self._mock_share_get([share])
+        self.mock_object(
+            api_manila, "tenant_absolute_limits",
+            mock.Mock(return_value=test_data.limits))
+        self.mock_object(api_manila, "share_snapshot_create")
+        self.mock_object(
+            timeutils, "utcnow",
+            mock.Mock(return_value=datetime.datetime(2026, 1, 2, 3, 4, 5)))
+
+        res = self.client.post(url, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        api_manila.share_snapshot_create.assert_called_once_with(
+            mock.ANY, share.id, name='%s-{20260102030405}' % share.id,
+            description='', metadata={})
+
     def test_delete_snapshot(self):
         share = test_data.share
         snapshot = test_data.snapshot
@@ -79,16 +269,116 @@ class SnapshotSnapshotViewTests(test.TestCase):
             api_manila, "share_snapshot_list",
             mock.Mock(return_value=[snapshot]))
         self.mock_object(
-            api_manila, "share_list", mock.Mock(return_value=[share]))
+            api_manila, "share_get", mock.Mock(return_value=share))
+        self.mock_object(api_manila, "share_list")
 
         res = self.client.post(INDEX_URL, formData)
 
         self.assertRedirectsNoFollow(res, INDEX_URL)
-        api_manila.share_snapshot_list.assert_called_once_with(mock.ANY)
-        api_manila.share_list.assert_called_once_with(mock.ANY)
+        api_manila.share_snapshot_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, snapshot.share_id)
+        api_manila.share_list.assert_not_called()
         api_manila.share_snapshot_delete.assert_called_once_with(
             mock.ANY, test_data.snapshot.id)
 
+    def test_delete_snapshot_error(self):
+        share = test_data.share
+        snapshot = test_data.snapshot
+        formData = {'action': 'share_snapshots__delete__%s' % snapshot.id}
+        self.mock_object(
+            api_manila, "share_snapshot_delete",
+            mock.Mock(side_effect=manila_exceptions.BadRequest(400)))
+        self.mock_object(
+            api_manila, "share_snapshot_list",
+            mock.Mock(return_value=[snapshot]))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(return_value=share))
+
+        res = self.client.post(INDEX_URL, formData, follow=True)
+
+        self.assertContains(
+            res, 'Unable to delete snapshot &quot;%s&quot;. One or more '
+            'shares depend on it.' % snapshot.name)
+        self.assertContains(
+            res, 'Unable to delete share snapshot: %s' % snapshot.name)
+        api_manila.share_snapshot_delete.assert_called_once_with(
+            mock.ANY, snapshot.id)
+
+    def test_bulk_row_update(self):
+        share = test_data.share
+        snapshot = test_data.snapshot
+
+        def fake_snapshot_get(request, snapshot_id):
+            if snapshot_id == snapshot.id:
+                return snapshot
+            elif snapshot_id == 'deleted_id':
+                raise manila_exceptions.NotFound()
+            raise Exception('fake')
+
+        self.mock_object(
+            api_manila, "share_snapshot_get",
+            mock.Mock(side_effect=fake_snapshot_get))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(return_value=share))
+        self.mock_object(api_manila, "share_snapshot_list")
+        self.mock_object(api_manila, "share_list")
+
+        res = self.client.get(
+            INDEX_URL + '?action=bulk_row_update&table=share_snapshots'
+            '&obj_id=%s&obj_id=deleted_id&obj_id=failed_id' % snapshot.id,
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(res.status_code, 200)
+        rows = res.json()['rows']
+        self.assertEqual([snapshot.id], list(rows))
+        self.assertIn(share.name, rows[snapshot.id])
+        self.assertEqual(['deleted_id'], res.json()['deleted'])
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, snapshot.share_id)
+        api_manila.share_snapshot_list.assert_not_called()
+        api_manila.share_list.assert_not_called()
+
+    def test_index_mount_snapshot_support(self):
+        share = test_data.share_mount_snapshot
+        snapshot = test_data.snapshot_mount_support
+        self.mock_object(
+            api_manila, "share_snapshot_list",
+            mock.Mock(return_value=[snapshot]))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(return_value=share))
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(
+            res, reverse(
+                'horizon:project:share_snapshots:share_snapshot_manage_rules',
+                args=[snapshot.id]))
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, snapshot.share_id)
+
+    def test_index_share_not_found(self):
+        snapshot = test_data.snapshot_mount_support
+        self.mock_object(
+            api_manila, "share_snapshot_list",
+            mock.Mock(return_value=[snapshot]))
+        self.mock_object(
+            api_manila, "share_get",
+            mock.Mock(side_effect=manila_exceptions.NotFound(404)))
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertNotContains(
+            res, reverse(
+                'horizon:project:share_snapshots:share_snapshot_manage_rules',
+                args=[snapshot.id]))
+        # NOTE: row actions do not fetch the missing share again.
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, snapshot.share_id)
+
     def test_detail_view(self):
         snapshot = test_data.snapshot
         share = test_data.share
@@ -162,6 +452,34 @@ class SnapshotSnapshotViewTests(test.TestCase):
         api_manila.share_snap_export_location_list.assert_called_once_with(
             mock.ANY, snapshot)
 
+    def test_detail_view_reuses_share(self):
+        snapshot = test_data.snapshot_mount_support
+        share = test_data.share_mount_snapshot
+        url = reverse('horizon:project:share_snapshots:share_snapshot_detail',
+                      args=[snapshot.id])
+        self.mock_object(
+            api_manila, "share_snapshot_get", mock.Mock(return_value=snapshot))
+        self.mock_object(
+            api_manila, "share_snapshot_rules_list",
+            mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_snap_export_location_list",
+            mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(return_value=share))
+        tab_group_class = mock.Mock(
+            side_effect=ss_tabs.ShareSnapshotDetailTabs)
+        self.mock_object(
+            ss_views.ShareSnapshotDetailView, "tab_group_class",
+            tab_group_class)
+
+        res = self.client.get(url)
+
+        self.assertEqual(200, res.status_code)
+        tab_group_class.assert_called_once_with(
+            mock.ANY, snapshot=snapshot, share=share, snapshot_id=snapshot.id)
+        api_manila.share_get.assert_called_once_with(mock.ANY, share.id)
+
     def test_update_snapshot_get(self):
         snapshot = test_data.snapshot
         url = reverse('horizon:project:share_snapshots:share_snapshot_edit',
@@ -220,6 +538,8 @@ class SnapshotSnapshotViewTests(test.TestCase):
             'project/share_snapshots/manage_rules.html')
         api_manila.share_snapshot_rules_list.assert_called_once_with(
             mock.ANY, snapshot.id)
+        api_manila.share_snapshot_get.assert_called_once_with(
+            mock.ANY, snapshot.id)
 
     def test_list_rules_exception(self):
         snapshot = test_data.snapshot
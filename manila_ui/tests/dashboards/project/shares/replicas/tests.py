@@ -177,8 +177,8 @@ class ReplicasTests(test.TestCase):
         self.assertEqual(200, res.status_code)
         self.assertTemplateUsed(
             res, "project/shares/replicas/manage_replicas.html")
-        api_manila.share_get.assert_called_with(mock.ANY, self.share.id)
-        api_manila.share_replica_list.assert_called_with(
+        api_manila.share_get.assert_called_once_with(mock.ANY, self.share.id)
+        api_manila.share_replica_list.assert_called_once_with(
             mock.ANY, self.share.id)
 
     def test_list_exception(self):
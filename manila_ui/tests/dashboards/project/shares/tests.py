@@ -19,6 +19,8 @@ from django.core.handlers import wsgi
 from django.core.handlers.wsgi import LimitedStream
 from django.urls import reverse
 from horizon import messages as horizon_messages
+from manilaclient import exceptions as manila_exceptions
+from manilaclient.v2 import shares as shares_api
 from openstack_dashboard.api import neutron
 from unittest import mock
 
@@ -62,7 +64,6 @@ class ShareViewTests(test.APITestCase):
             mock.Mock(return_value=test_data.limits))
 
     def test_index(self):
-        snaps = [test_data.snapshot, test_data.snapshot_mount_support]
         shares = [test_data.share, test_data.nameless_share,
                   test_data.other_share]
         share_networks = [test_data.inactive_share_network,
@@ -70,7 +71,8 @@ class ShareViewTests(test.APITestCase):
         self.mock_object(
             api_manila, "share_list", mock.Mock(return_value=shares))
         self.mock_object(
-            api_manila, "share_snapshot_list", mock.Mock(return_value=snaps))
+            api_manila, "share_snapshot_index",
+            mock.Mock(return_value={test_data.share.id}))
         self.mock_object(
             api_manila, "share_network_list",
             mock.Mock(return_value=share_networks))
@@ -84,12 +86,180 @@ class ShareViewTests(test.APITestCase):
 
         self.assertEqual(res.status_code, 200)
         self.assertTemplateUsed(res, 'project/shares/index.html')
-        api_manila.share_snapshot_list.assert_called_with(
-            mock.ANY, detailed=True)
-        api_manila.share_list.assert_called_with(mock.ANY)
+        api_manila.share_snapshot_index.assert_called_once_with(
+            mock.ANY, [share.id for share in shares])
+        self.assertEqual(
+            [True, False, False],
+            [share.has_snapshot
+             for share in res.context['shares_table'].data])
+        api_manila.share_list.assert_called_with(mock.ANY, limit=21, offset=0)
         api_manila.share_network_list.assert_called_with(mock.ANY)
         api_manila.tenant_absolute_limits.assert_called_with(mock.ANY)
 
+    @ddt.data(
+        ('', 0, True, False),
+        ('?marker=2', 2, True, True),
+        ('?marker=foo', 0, True, False),
+    )
+    @ddt.unpack
+    def test_index_paginated(self, query, offset, has_more, has_prev):
+        shares = [test_data.share, test_data.nameless_share,
+                  test_data.other_share]
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(return_value=shares))
+        self.mock_object(
+            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={'page_size': 2}):
+            res = self.client.get(INDEX_URL + query)
+
+        self.assertEqual(res.status_code, 200)
+        api_manila.share_list.assert_called_once_with(
+            mock.ANY, limit=3, offset=offset)
+        table = res.context['shares_table']
+        self.assertEqual(2, len(table.data))
+        self.assertEqual(has_more, table.has_more_data())
+        self.assertEqual(has_prev, table.has_prev_data())
+        self.assertEqual(str(offset + 2), table.get_marker())
+        self.assertEqual(str(max(offset - 2, 0)), table.get_prev_marker())
+
+    @ddt.data(
+        ('name', {'name': 'foo'}),
+        ('name~', {'name~': 'foo'}),
+        ('description', {'description~': 'foo'}),
+    )
+    @ddt.unpack
+    def test_index_filtered(self, field, search_opts):
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(return_value=[test_data.share]))
+        self.mock_object(
+            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+        res = self.client.post(INDEX_URL, {
+            'shares__filter__q': 'foo',
+            'shares__filter__q_field': field})
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={'page_size': 2}):
+            res = self.client.get(INDEX_URL + '?marker=2')
+
+        self.assertEqual(res.status_code, 200)
+        api_manila.share_list.assert_called_once_with(
+            mock.ANY, limit=3, offset=2, search_opts=search_opts)
+
+    @ddt.data(
+        ('?sort_key=name&sort_dir=desc', 'name', 'desc'),
+        ('?sort_key=proto&sort_dir=foo', 'share_proto', 'asc'),
+    )
+    @ddt.unpack
+    def test_index_sorted(self, query, sort_key, sort_dir):
+        shares = [test_data.share, test_data.nameless_share,
+                  test_data.other_share]
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(return_value=shares))
+        self.mock_object(
+            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={'page_size': 2}):
+            res = self.client.get(INDEX_URL + query + '&marker=2')
+
+        self.assertEqual(res.status_code, 200)
+        api_manila.share_list.assert_called_once_with(
+            mock.ANY, limit=3, offset=2, sort_key=sort_key, sort_dir=sort_dir)
+        table = res.context['shares_table']
+        column = query.split('&')[0].split('=')[1]
+        sort_params = 'sort_key=%s&sort_dir=%s' % (column, sort_dir)
+        self.assertEqual('marker=4&' + sort_params,
+                         table.get_pagination_string())
+        self.assertEqual('marker=0&' + sort_params,
+                         table.get_prev_pagination_string())
+        self.assertFalse(table.columns[column].sortable)
+        self.assertNotIn('sortable', table.columns[column].classes)
+        self.assertTrue(table.columns['share_network'].sortable)
+
+    def test_index_sorted_by_unsortable_column(self):
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(return_value=[test_data.share]))
+        self.mock_object(
+            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+
+        res = self.client.get(INDEX_URL + '?sort_key=share_network')
+
+        self.assertEqual(res.status_code, 200)
+        api_manila.share_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
+        self.assertContains(
+            res, '<a href="?sort_key=name&amp;sort_dir=asc">Name</a>')
+        self.assertEqual('marker=20',
+                         res.context['shares_table'].get_pagination_string())
+
+    def test_index_pagination_disabled(self):
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(return_value=[test_data.share]))
+        self.mock_object(
+            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={'page_size': 0}):
+            res = self.client.get(INDEX_URL)
+
+        self.assertEqual(res.status_code, 200)
+        api_manila.share_list.assert_called_once_with(mock.ANY)
+        self.assertFalse(res.context['shares_table'].has_more_data())
+
+    def test_bulk_row_update(self):
+        share = test_data.share
+        share_network = test_data.active_share_network
+
+        def fake_share_get(request, share_id):
+            if share_id == share.id:
+                return share
+            elif share_id == 'deleted_id':
+                raise manila_exceptions.NotFound()
+            raise Exception('fake')
+
+        # NOTE: the polled share is missing from the listing, as if it was
+        # capped by 'osapi_max_limit'.
+        self.mock_object(
+            api_manila, "share_list",
+            mock.Mock(return_value=[test_data.other_share]))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(side_effect=fake_share_get))
+        self.mock_object(
+            api_manila, "share_network_get",
+            mock.Mock(return_value=share_network))
+        self.mock_object(api_manila, "share_network_list")
+        url = INDEX_URL + '?action=bulk_row_update&table=shares'
+
+        res = self.client.get(
+            url + '&obj_id=%s&obj_id=deleted_id&obj_id=failed_id' % share.id,
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(res.status_code, 200)
+        rows = res.json()['rows']
+        self.assertEqual([share.id], list(rows))
+        self.assertIn('class="status_up bulk-ajax-update"', rows[share.id])
+        self.assertEqual(['deleted_id'], res.json()['deleted'])
+        api_manila.share_get.assert_has_calls([
+            mock.call(mock.ANY, share_id)
+            for share_id in (share.id, 'deleted_id', 'failed_id')],
+            any_order=True)
+        api_manila.share_network_get.assert_called_once_with(
+            mock.ANY, share.share_network_id)
+        api_manila.share_list.assert_not_called()
+        api_manila.share_network_list.assert_not_called()
+
     @mock.patch.object(api_manila, 'availability_zone_list')
     def test_create_share(self, az_list):
         url = reverse('horizon:project:shares:create')
@@ -136,10 +306,121 @@ class ShareViewTests(test.APITestCase):
             share_group_id=None, share_network=share_net.id,
             metadata={}, share_type='fake-type',
             availability_zone=formData['availability_zone'])
-        api_manila.share_snapshot_list.assert_called_once_with(mock.ANY)
+        api_manila.share_snapshot_list.assert_not_called()
         api_manila.share_network_list.assert_called_once_with(mock.ANY)
         api_manila.share_type_list.assert_called_once_with(mock.ANY)
 
+    def test_create_share_get(self):
+        url = reverse('horizon:project:shares:create')
+        self.mock_object(
+            api_manila, "share_type_list",
+            mock.Mock(return_value=[self.fake_share_type]))
+        self.mock_object(
+            api_manila, "availability_zone_list",
+            mock.Mock(return_value=[self.FakeAZ('fake_az')]))
+        self.mock_object(api_manila, "share_network_list")
+        self.mock_object(api_manila, "share_group_list")
+        self.mock_object(
+            api_manila, "share_snapshot_list",
+            mock.Mock(return_value=[test_data.snapshot]))
+
+        res = self.client.get(url)
+
+        self.assertEqual(200, res.status_code)
+        self.assertTemplateUsed(res, 'project/shares/create.html')
+        for kind in ('share_networks', 'share_groups', 'snapshots'):
+            self.assertContains(res, 'data-choices-url="%s"' % reverse(
+                'horizon:project:shares:create_choices', args=(kind,)))
+        self.assertContains(res, 'data-choices-value="snapshot"')
+        api_manila.share_network_list.assert_not_called()
+        api_manila.share_group_list.assert_not_called()
+        api_manila.share_snapshot_list.assert_called_once_with(
+            mock.ANY, detailed=False, search_opts={'status': 'available'},
+            limit=1)
+
+    @ddt.data(mock.Mock(return_value=[]), mock.Mock(side_effect=Exception))
+    def test_create_share_get_without_snapshots(self, snapshot_list):
+        url = reverse('horizon:project:shares:create')
+        self.mock_object(
+            api_manila, "share_type_list",
+            mock.Mock(return_value=[self.fake_share_type]))
+        self.mock_object(
+            api_manila, "availability_zone_list",
+            mock.Mock(return_value=[self.FakeAZ('fake_az')]))
+        self.mock_object(api_manila, "share_snapshot_list", snapshot_list)
+
+        res = self.client.get(url)
+
+        self.assertEqual(200, res.status_code)
+        self.assertNotIn('share_source_type', res.context['form'].fields)
+        self.assertNotIn('snapshot', res.context['form'].fields)
+        self.assertNotContains(res, 'data-choices-value="snapshot"')
+        api_manila.share_snapshot_list.assert_called_once_with(
+            mock.ANY, detailed=False, search_opts={'status': 'available'},
+            limit=1)
+
+    @ddt.data(
+        ('share_networks', 'share_network_list',
+         [{'value': 'fake_sn_id', 'label': 'fake_sn_name'}]),
+        ('share_groups', 'share_group_list',
+         [{'value': '', 'label': ''},
+          {'value': 'fake_sg_id', 'label': 'fake_sg_name'}]),
+    )
+    @ddt.unpack
+    def test_create_choices(self, kind, list_func, expected):
+        resource = mock.Mock(id=expected[-1]['value'])
+        resource.name = expected[-1]['label']
+        self.mock_object(
+            api_manila, list_func, mock.Mock(return_value=[resource]))
+
+        res = self.client.get(reverse(
+            'horizon:project:shares:create_choices', args=(kind,)))
+
+        self.assertEqual(200, res.status_code)
+        self.assertEqual({'choices': expected}, res.json())
+        getattr(api_manila, list_func).assert_called_once_with(mock.ANY)
+
+    def test_create_choices_snapshots(self):
+        snapshot = test_data.snapshot
+        self.mock_object(
+            api_manila, "share_snapshot_list",
+            mock.Mock(return_value=[snapshot]))
+
+        res = self.client.get(reverse(
+            'horizon:project:shares:create_choices', args=('snapshots',)))
+
+        self.assertEqual(200, res.status_code)
+        self.assertEqual({'choices': [
+            {'value': '', 'label': 'Choose a snapshot'},
+            {'value': snapshot.id,
+             'label': '%s (%sGiB)' % (snapshot.name, snapshot.size),
+             'data': {'name': snapshot.name, 'size': snapshot.size}},
+        ]}, res.json())
+        api_manila.share_snapshot_list.assert_called_once_with(
+            mock.ANY, search_opts={'status': 'available'})
+
+    @ddt.data(
+        (manila_exceptions.Forbidden(403), 403),
+        (manila_exceptions.ClientException('N/A'), 500),
+    )
+    @ddt.unpack
+    def test_create_choices_error(self, error, status):
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(side_effect=error))
+
+        res = self.client.get(reverse(
+            'horizon:project:shares:create_choices',
+            args=('share_networks',)))
+
+        self.assertEqual(status, res.status_code)
+        api_manila.share_network_list.assert_called_once_with(mock.ANY)
+
+    def test_create_choices_unknown(self):
+        res = self.client.get(reverse(
+            'horizon:project:shares:create_choices', args=('unknown',)))
+
+        self.assertEqual(404, res.status_code)
+
     @mock.patch.object(api_manila, 'availability_zone_list')
     def test_create_share_from_snapshot(self, mock_az_list):
         share = test_data.share
@@ -192,7 +473,7 @@ class ShareViewTests(test.APITestCase):
     def test_delete_share(self):
         formData = {'action': 'shares__delete__%s' % self.share.id}
         self.mock_object(
-            api_manila, "share_snapshot_list", mock.Mock(return_value=[]))
+            api_manila, "share_snapshot_index", mock.Mock(return_value=set()))
         self.mock_object(
             api_manila, "share_network_list", mock.Mock(return_value=[]))
         self.mock_object(api_manila, "share_delete")
@@ -204,14 +485,120 @@ class ShareViewTests(test.APITestCase):
         res = self.client.post(INDEX_URL, formData)
 
         api_manila.share_network_list.assert_called_once_with(mock.ANY)
-        api_manila.share_snapshot_list.assert_called_once_with(
-            mock.ANY, detailed=True)
-        api_manila.share_list.assert_called_with(mock.ANY)
-        api_manila.share_get.assert_called_with(mock.ANY, self.share.id)
+        api_manila.share_snapshot_index.assert_called_once_with(
+            mock.ANY, [self.share.id])
+        api_manila.share_list.assert_called_with(mock.ANY, limit=21, offset=0)
+        api_manila.share_get.assert_not_called()
         api_manila.share_delete.assert_called_with(
             mock.ANY, self.share.id, share_group_id=self.share.share_group_id)
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
+    def test_create_snapshots_of_shares(self):
+        shares = [test_data.share, test_data.nameless_share]
+        formData = {
+            'action': 'shares__create_share_snapshots',
+            'object_ids': [share.id for share in shares],
+        }
+        self.mock_object(
+            api_manila, "share_snapshot_index", mock.Mock(return_value=set()))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(return_value=shares))
+
+        res = self.client.post(INDEX_URL, formData)
+
+        self.assertRedirectsNoFollow(
+            res,
+            reverse('horizon:project:share_snapshots:share_snapshots_create') +
+            '?share_id=%s&share_id=%s' % (shares[0].id, shares[1].id))
+
+    def test_delete_shares(self):
+        shares = [
+            shares_api.Share(
+                shares_api.ShareManager(test_data.FakeAPIClient),
+                {'id': 'fake_share_id%s' % i, 'name': 'share%s' % i,
+                 'status': 'available', 'size': 1, 'share_proto': 'NFS',
+                 'metadata': {}, 'share_network_id': None,
+                 'share_group_id': group_id})
+            for i, group_id in enumerate((None, 'fake_sg_id', 'other_sg_id'))
+        ]
+        formData = {
+            'action': 'shares__delete',
+            'object_ids': [share.id for share in shares],
+        }
+        self.mock_object(
+            api_manila, "share_snapshot_index", mock.Mock(return_value=set()))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+
+        def fake_share_delete(request, share_id, share_group_id=None):
+            if share_id == shares[1].id:
+                raise Exception('fake')
+
+        # The last share was selected on another page of the table.
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(return_value=shares[:2]))
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(return_value=shares[2]))
+        self.mock_object(
+            api_manila, "share_delete",
+            mock.Mock(side_effect=fake_share_delete))
+
+        res = self.client.post(INDEX_URL, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        self.assertMessageCount(info=1, error=1)
+        api_manila.share_get.assert_called_once_with(mock.ANY, shares[2].id)
+        api_manila.share_delete.assert_has_calls([
+            mock.call(mock.ANY, shares[0].id, share_group_id=None),
+            mock.call(mock.ANY, shares[1].id, share_group_id='fake_sg_id'),
+            mock.call(mock.ANY, shares[2].id, share_group_id='other_sg_id'),
+        ], any_order=True)
+
+    def test_delete_shares_not_allowed_on_another_page(self):
+        shares = [
+            shares_api.Share(
+                shares_api.ShareManager(test_data.FakeAPIClient),
+                {'id': 'fake_share_id%s' % i, 'name': 'share%s' % i,
+                 'status': status, 'size': 1, 'share_proto': 'NFS',
+                 'metadata': {}, 'share_network_id': None,
+                 'share_group_id': None})
+            for i, status in enumerate(('available', 'deleting'))
+        ]
+        formData = {
+            'action': 'shares__delete',
+            'object_ids': [share.id for share in shares] + ['fake_deleted'],
+        }
+        self.mock_object(
+            api_manila, "share_snapshot_index", mock.Mock(return_value=set()))
+        self.mock_object(
+            api_manila, "share_network_list", mock.Mock(return_value=[]))
+        # The last shares were selected on another page of the table, one of
+        # them is being deleted and the other one does not exist anymore.
+        self.mock_object(
+            api_manila, "share_list", mock.Mock(return_value=shares[:1]))
+
+        def fake_share_get(request, share_id):
+            if share_id == 'fake_deleted':
+                raise manila_exceptions.NotFound(404)
+            return shares[1]
+
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(side_effect=fake_share_get))
+        self.mock_object(api_manila, "share_delete")
+
+        res = self.client.post(INDEX_URL, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        self.assertMessageCount(info=1, error=1)
+        api_manila.share_get.assert_has_calls([
+            mock.call(mock.ANY, shares[1].id),
+            mock.call(mock.ANY, 'fake_deleted'),
+        ], any_order=True)
+        api_manila.share_delete.assert_called_once_with(
+            mock.ANY, shares[0].id, share_group_id=None)
+
     def test_detail_view(self):
         share_net = test_data.active_share_network
         rules = [test_data.ip_rule, test_data.user_rule, test_data.cephx_rule]
@@ -303,6 +690,48 @@ class ShareViewTests(test.APITestCase):
         self.assertTemplateUsed(res, 'project/shares/manage_rules.html')
         api_manila.share_rules_list.assert_called_once_with(
             mock.ANY, self.share.id)
+        api_manila.share_get.assert_called_once_with(
+            mock.ANY, self.share.id)
+
+    def test_list_rules_bulk_row_update(self):
+        rules = test_data.share_access_list
+        self.mock_object(
+            api_manila, "share_rules_list", mock.Mock(return_value=rules))
+        self.mock_object(api_manila, "share_rule_get")
+        url = reverse(
+            'horizon:project:shares:manage_rules', args=[self.share.id])
+
+        res = self.client.get(
+            url + '?action=bulk_row_update&table=rules&obj_id=%s' %
+            rules[0].id, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([rules[0].id], list(res.json()['rows']))
+        self.assertEqual([], res.json()['deleted'])
+        api_manila.share_rules_list.assert_called_once_with(
+            mock.ANY, self.share.id)
+        api_manila.share_rule_get.assert_not_called()
+        api_manila.share_get.assert_not_called()
+
+    @ddt.data(
+        (manila_exceptions.BadRequest(400), 400),
+        (manila_exceptions.Forbidden(403), 403),
+        (manila_exceptions.ClientException('N/A'), 500),
+    )
+    @ddt.unpack
+    def test_list_rules_bulk_row_update_error(self, error, status):
+        self.mock_object(
+            api_manila, "share_rules_list", mock.Mock(side_effect=error))
+        url = reverse(
+            'horizon:project:shares:manage_rules', args=[self.share.id])
+
+        res = self.client.get(
+            url + '?action=bulk_row_update&table=rules&obj_id=fake_id',
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(status, res.status_code)
+        api_manila.share_rules_list.assert_called_once_with(
+            mock.ANY, self.share.id)
 
     def test_create_rule_get(self):
         url = reverse('horizon:project:shares:rule_add', args=[self.share.id])
@@ -338,6 +767,124 @@ class ShareViewTests(test.APITestCase):
                     args=[self.share.id])
         )
 
+    def test_create_rules_get(self):
+        url = reverse('horizon:project:shares:rules_add',
+                      args=[self.share.id])
+
+        res = self.client.get(url)
+
+        self.assertNoMessages()
+        self.assertTemplateUsed(res, 'project/shares/rules_add.html')
+
+    def test_create_rules_post(self):
+        url = reverse('horizon:project:shares:rules_add',
+                      args=[self.share.id])
+        self.mock_object(
+            api_manila, "share_rules_list",
+            mock.Mock(return_value=[test_data.ip_rule]))
+
+        def fake_share_allow(request, share_id, access_to, **kwargs):
+            if access_to == '2.2.2.2':
+                raise Exception('fake')
+
+        self.mock_object(
+            api_manila, "share_allow", mock.Mock(side_effect=fake_share_allow))
+        self.mock_object(horizon_messages, "error")
+        self.mock_object(horizon_messages, "info")
+        formData = {
+            'access_type': 'ip',
+            'access_to': '1.1.1.1/32\n10.0.0.0/24, 10.0.0.0/24\n\n2.2.2.2',
+            'access_level': 'ro',
+            'metadata': 'foo=bar',
+        }
+
+        res = self.client.post(url, formData)
+
+        self.assertRedirectsNoFollow(
+            res,
+            reverse('horizon:project:shares:manage_rules',
+                    args=[self.share.id]))
+        api_manila.share_rules_list.assert_called_once_with(
+            mock.ANY, self.share.id)
+        self.assertEqual(2, api_manila.share_allow.call_count)
+        api_manila.share_allow.assert_has_calls([
+            mock.call(mock.ANY, self.share.id, access_to=access_to,
+                      access_type='ip', access_level='ro',
+                      metadata={'foo': 'bar'})
+            for access_to in ('10.0.0.0/24', '2.2.2.2')
+        ], any_order=True)
+        horizon_messages.info.assert_called_once_with(
+            mock.ANY, 'Rules exist already for: 1.1.1.1/32')
+        horizon_messages.error.assert_called_once_with(
+            mock.ANY, 'Unable to add rules for: 2.2.2.2')
+        horizon_messages.success.assert_called_once_with(
+            mock.ANY, 'Creating rules for: 10.0.0.0/24')
+
+    def test_create_rules_post_invalid(self):
+        url = reverse('horizon:project:shares:rules_add',
+                      args=[self.share.id])
+        self.mock_object(api_manila, "share_rules_list")
+        self.mock_object(api_manila, "share_allow")
+        formData = {
+            'access_type': 'ip',
+            'access_to': '1.1.1.1, fake_host, 10.0.0.1/24, 10.0.0.1/33',
+            'access_level': 'rw',
+        }
+
+        res = self.client.post(url, formData)
+
+        self.assertEqual(200, res.status_code)
+        self.assertFormErrors(res, 1)
+        # NOTE: like the API, CIDRs with host bits set are refused.
+        self.assertContains(
+            res, 'Invalid entries: fake_host, 10.0.0.1/24, 10.0.0.1/33')
+        api_manila.share_rules_list.assert_not_called()
+        api_manila.share_allow.assert_not_called()
+
+    def test_create_rules_post_cert(self):
+        url = reverse('horizon:project:shares:rules_add',
+                      args=[self.share.id])
+        self.mock_object(
+            api_manila, "share_rules_list", mock.Mock(return_value=[]))
+        self.mock_object(api_manila, "share_allow")
+        formData = {
+            'access_type': 'cert',
+            'access_to': 'CN=client1,O=Example, C=US\nCN=client2',
+            'access_level': 'rw',
+        }
+
+        res = self.client.post(url, formData)
+
+        self.assertRedirectsNoFollow(
+            res,
+            reverse('horizon:project:shares:manage_rules',
+                    args=[self.share.id]))
+        self.assertEqual(2, api_manila.share_allow.call_count)
+        api_manila.share_allow.assert_has_calls([
+            mock.call(mock.ANY, self.share.id, access_to=access_to,
+                      access_type='cert', access_level='rw', metadata={})
+            for access_to in ('CN=client1,O=Example, C=US', 'CN=client2')
+        ], any_order=True)
+
+    def test_delete_rules(self):
+        rules = [test_data.ip_rule, test_data.user_rule]
+        formData = {
+            'action': 'rules__delete',
+            'object_ids': [rule.id for rule in rules],
+        }
+        self.mock_object(api_manila, "share_deny")
+        self.mock_object(
+            api_manila, "share_rules_list", mock.Mock(return_value=rules))
+        url = reverse(
+            'horizon:project:shares:manage_rules', args=[self.share.id])
+
+        self.client.post(url, formData)
+
+        api_manila.share_deny.assert_has_calls([
+            mock.call(mock.ANY, self.share.id, rule.id) for rule in rules
+        ], any_order=True)
+        self.assertEqual(2, api_manila.share_deny.call_count)
+
     def test_delete_rule(self):
         rule = test_data.ip_rule
         formData = {'action': 'rules__delete__%s' % rule.id}
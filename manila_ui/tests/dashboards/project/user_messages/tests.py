@@ -42,7 +42,8 @@ class UserMessagesViewTests(test.TestCase):
         self.client.get(url)
 
         self.assertNoMessages()
-        api_manila.messages_list.assert_called_once_with(mock.ANY)
+        api_manila.messages_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
 
     @ddt.data(None, Exception('fake'))
     def test_delete_message(self, exc):
@@ -59,7 +60,8 @@ class UserMessagesViewTests(test.TestCase):
         self.assertEqual(res.status_code, 302)
 
         self.assertRedirectsNoFollow(res, INDEX_URL)
-        api_manila.messages_list.assert_called_once_with(mock.ANY)
+        api_manila.messages_list.assert_called_once_with(
+            mock.ANY, limit=21, offset=0)
         api_manila.messages_delete.assert_called_once_with(
             mock.ANY, test_data.fake_message_1.id)
 
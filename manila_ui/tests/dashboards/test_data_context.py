@@ -0,0 +1,72 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from horizon import tabs
+
+from manila_ui.dashboards import data_context
+from manila_ui.tests import helpers as base
+
+
+class FakeTab(tabs.Tab):
+    name = "Fake"
+    slug = "fake"
+
+
+class FakeTabGroup(data_context.DataContextMixin, tabs.TabGroup):
+    slug = "fake_tabs"
+    tabs = (FakeTab,)
+
+    def __init__(self, request, loader, **kwargs):
+        super(FakeTabGroup, self).__init__(request, **kwargs)
+        self.loader = loader
+
+    def load_names(self):
+        return self.loader()
+
+
+class DataContextTests(base.TestCase):
+
+    def test_item_loaded_once(self):
+        loader = mock.Mock(return_value={'id': 'name'})
+        tab_group = FakeTabGroup(self.request, loader)
+
+        self.assertEqual({'id': 'name'}, tab_group.data_context['names'])
+        self.assertEqual({'id': 'name'}, tab_group.data_context['names'])
+
+        loader.assert_called_once_with()
+        self.assertIs(tab_group.data_context, tab_group.data_context)
+
+    def test_item_from_kwargs(self):
+        loader = mock.Mock()
+        tab_group = FakeTabGroup(self.request, loader, names='fake_names')
+
+        self.assertEqual('fake_names', tab_group.data_context['names'])
+        self.assertFalse(loader.called)
+
+    def test_item_failing_to_load_not_kept(self):
+        loader = mock.Mock(side_effect=[ValueError('fake'), 'fake_names'])
+        tab_group = FakeTabGroup(self.request, loader)
+
+        self.assertRaises(ValueError, tab_group.data_context.__getitem__,
+                          'names')
+        self.assertEqual('fake_names', tab_group.data_context['names'])
+        self.assertEqual(2, loader.call_count)
+
+    def test_unknown_item(self):
+        tab_group = FakeTabGroup(self.request, mock.Mock())
+
+        self.assertNotIn('unknown', tab_group.data_context)
+        self.assertIsNone(tab_group.data_context.get('unknown'))
+        self.assertRaises(KeyError, tab_group.data_context.__getitem__,
+                          'unknown')
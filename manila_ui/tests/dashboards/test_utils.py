@@ -13,9 +13,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from unittest import mock
+
 import ddt
 from django.forms import ValidationError
+from openstack_dashboard.api import neutron as api_neutron
 
+from manila_ui.api import manila as api_manila
 from manila_ui.dashboards import utils
 from manila_ui.tests import helpers as base
 
@@ -82,6 +86,34 @@ class ManilaDashboardsUtilsTests(base.TestCase):
 
         self.assertEqual(expected_output, result)
 
+    def test_metadata_to_str_cached(self):
+        utils._format_cached_metadata.cache_clear()
+
+        result = utils.metadata_to_str({"foo": "bar", "quuz": "<b>"})
+        cached_result = utils.metadata_to_str({"quuz": "<b>", "foo": "bar"})
+
+        self.assertEqual("foo = bar<br/>quuz = &lt;b&gt;", result)
+        self.assertIs(result, cached_result)
+        cache_info = utils._format_cached_metadata.cache_info()
+        self.assertEqual(1, cache_info.hits)
+        self.assertEqual(1, cache_info.misses)
+
+    def test_metadata_to_str_unhashable(self):
+        result = utils.metadata_to_str({"foo": ["bar", "quuz"]})
+
+        self.assertEqual("foo = [&apos;bar&apos;, &apos;quuz&apos;]", result)
+
+    def test_specs_to_str(self):
+        result = utils.specs_to_str({"driver_handles_share_servers": True})
+
+        self.assertEqual("driver_handles_share_servers = True", result)
+
+    def test_html_escape(self):
+        result = utils.html_escape('<a href="x">\'&\'</a>')
+
+        self.assertEqual(
+            "&lt;a href=&quot;x&quot;&gt;&apos;&amp;&apos;&lt;/a&gt;", result)
+
     @ddt.data(
         ("ldap", "LDAP"),
         ("active_directory", "Active Directory"),
@@ -95,3 +127,107 @@ class ManilaDashboardsUtilsTests(base.TestCase):
         result = utils.get_nice_security_service_type(security_service)
 
         self.assertEqual(expected_value, result)
+
+    def test_get_share(self):
+        request = mock.Mock()
+        self.mock_object(api_manila, "share_get")
+
+        share = utils.get_share(request, 'fake_share_id')
+
+        self.assertIs(share, utils.get_share(request, 'fake_share_id'))
+        self.assertIs(share, api_manila.share_get.return_value)
+        utils.get_share(mock.Mock(), 'fake_share_id')
+        utils.get_share(request, 'other_share_id')
+        api_manila.share_get.assert_has_calls([
+            mock.call(request, 'fake_share_id'),
+            mock.call(mock.ANY, 'fake_share_id'),
+            mock.call(request, 'other_share_id'),
+        ])
+        self.assertEqual(3, api_manila.share_get.call_count)
+
+    def test_get_shares(self):
+        request = mock.Mock()
+        share = mock.Mock()
+
+        def fake_share_get(request, share_id):
+            if share_id == 'fake_share_id':
+                return share
+            raise Exception('fake')
+
+        self.mock_object(
+            api_manila, "share_get", mock.Mock(side_effect=fake_share_get))
+
+        result = utils.get_shares(
+            request, ['fake_share_id', None, 'deleted_id', 'fake_share_id'])
+
+        self.assertEqual({'fake_share_id': share}, result)
+        api_manila.share_get.assert_has_calls([
+            mock.call(request, 'deleted_id'),
+            mock.call(request, 'fake_share_id'),
+        ], any_order=True)
+        self.assertEqual(2, api_manila.share_get.call_count)
+
+
+class NeutronNameCacheTests(base.TestCase):
+
+    def setUp(self):
+        super(NeutronNameCacheTests, self).setUp()
+        self.request = mock.Mock(user=mock.Mock(
+            endpoint='http://keystone.example.com/identity/v3',
+            services_region='RegionOne', project_id='fake_project_id'))
+        self.mock_object(
+            api_neutron, "network_list",
+            mock.Mock(side_effect=self._list({'net_id': 'net_name'})))
+        self.mock_object(
+            api_neutron, "subnet_list",
+            mock.Mock(side_effect=self._list({'subnet_id': 'subnet_name'})))
+
+    @staticmethod
+    def _list(names):
+        def list_resources(request, id):
+            return [mock.Mock(id=r_id, name_or_id=names[r_id])
+                    for r_id in id if r_id in names]
+        return list_resources
+
+    def test_get_neutron_names(self):
+        result = utils.get_neutron_names(
+            self.request, ['net_id', 'net_id', None, 'deleted_id'],
+            ['subnet_id'])
+
+        self.assertEqual(
+            ({'net_id': 'net_name'}, {'subnet_id': 'subnet_name'}), result)
+        api_neutron.network_list.assert_called_once_with(
+            self.request, id=['deleted_id', 'net_id'])
+        api_neutron.subnet_list.assert_called_once_with(
+            self.request, id=['subnet_id'])
+
+    def test_get_neutron_names_cached(self):
+        utils.get_neutron_names(self.request, ['net_id', 'deleted_id'])
+
+        result = utils.get_neutron_names(
+            self.request, ['net_id', 'deleted_id'], ['subnet_id'])
+
+        self.assertEqual(
+            ({'net_id': 'net_name'}, {'subnet_id': 'subnet_name'}), result)
+        api_neutron.network_list.assert_called_once_with(
+            self.request, id=['deleted_id', 'net_id'])
+        api_neutron.subnet_list.assert_called_once_with(
+            self.request, id=['subnet_id'])
+
+    def test_get_neutron_names_per_project(self):
+        utils.get_neutron_names(self.request, ['net_id'])
+        self.request.user.project_id = 'other_project_id'
+
+        utils.get_neutron_names(self.request, ['net_id'])
+
+        self.assertEqual(2, api_neutron.network_list.call_count)
+
+    def test_get_neutron_names_error(self):
+        api_neutron.network_list.side_effect = Exception('fake')
+
+        result = utils.get_neutron_names(
+            self.request, ['net_id'], ['subnet_id'])
+        utils.get_neutron_names(self.request, ['net_id'])
+
+        self.assertEqual(({}, {'subnet_id': 'subnet_name'}), result)
+        self.assertEqual(2, api_neutron.network_list.call_count)
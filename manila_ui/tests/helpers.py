@@ -15,12 +15,19 @@ import os
 import unittest
 from unittest import mock
 
+from django.core.cache import cache
+
 from manila_ui import api
 from manila_ui.tests.test_data import utils
 from openstack_dashboard.test import helpers
 
 
 class ManilaTestsMixin(object):
+    def setUp(self):
+        super(ManilaTestsMixin, self).setUp()
+        # NOTE: cached data must not leak between tests.
+        cache.clear()
+
     def _setup_test_data(self):
         super(ManilaTestsMixin, self)._setup_test_data()
         utils.load_test_data(self)
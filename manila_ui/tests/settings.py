@@ -28,3 +28,6 @@ settings.update_dashboards(
     HORIZON_CONFIG,
     MANILA_UI_APPS,
 )
+
+# The static files of the enabled files are provided by manila UI itself.
+INSTALLED_APPS = list(INSTALLED_APPS) + ['manila_ui']
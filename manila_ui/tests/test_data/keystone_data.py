@@ -10,6 +10,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from keystoneclient import exceptions as keystone_exceptions
+
 
 def data(TEST):
 
@@ -31,3 +33,10 @@ projects = [
          {'id': '%s_id' % v, 'name': '%s_name' % v})
     for v in ('foo', 'bar', 'quuz')
 ]
+
+
+def tenant_get(request, project_id, admin=True):
+    for project in projects:
+        if project.id == project_id:
+            return project
+    raise keystone_exceptions.NotFound()
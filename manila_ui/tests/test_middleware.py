@@ -0,0 +1,129 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+from django import http
+from django.test.client import RequestFactory
+from unittest import mock
+
+from manila_ui.api import manila
+from manila_ui.api import metrics
+from manila_ui import middleware
+from manila_ui.tests import helpers as base
+
+
+class APIMetricsMiddlewareTests(base.TestCase):
+
+    def setUp(self):
+        super(APIMetricsMiddlewareTests, self).setUp()
+        self.addCleanup(metrics.HISTOGRAMS.reset)
+        metrics.HISTOGRAMS.reset()
+        self.request = RequestFactory().get('/project/shares/')
+        self.middleware = middleware.APIMetricsMiddleware(self._get_response)
+
+    def _get_response(self, request):
+        metrics.record(request, 'manila', 'share_list', 0.25)
+        metrics.record(request, 'manila', 'share_get', 0.5)
+        metrics.record(request, 'keystone', 'tenant_get', 0.125)
+        request.__dict__[manila.REQUEST_CACHE_SAVED_CALLS_ATTR] = 2
+        return http.HttpResponse()
+
+    def test_disabled(self):
+        self.mock_object(middleware.LOG, "info")
+
+        response = self.middleware(self.request)
+
+        self.assertNotIn('Server-Timing', response)
+        middleware.LOG.info.assert_not_called()
+
+    def test_header(self):
+        with self.settings(
+                OPENSTACK_MANILA_FEATURES={'api_metrics_header': True}):
+            response = self.middleware(self.request)
+
+        self.assertEqual(
+            'keystone;dur=125.0;desc="1 calls", '
+            'manila;dur=750.0;desc="2 calls", '
+            'manila-saved;desc="2 calls"',
+            response['Server-Timing'])
+
+    def test_log(self):
+        self.mock_object(middleware.LOG, "info")
+
+        with self.settings(
+                OPENSTACK_MANILA_FEATURES={'api_metrics_log': True}):
+            response = self.middleware(self.request)
+
+        self.assertNotIn('Server-Timing', response)
+        log_line = json.loads(middleware.LOG.info.call_args[0][0])
+        self.assertEqual('/project/shares/', log_line['path'])
+        self.assertEqual(200, log_line['status'])
+        self.assertEqual(2, log_line['saved_calls'])
+        self.assertEqual(
+            {'calls': 2, 'duration': 0.75,
+             'functions': {'share_list': 1, 'share_get': 1}},
+            log_line['services']['manila'])
+
+    def test_prometheus_endpoint(self):
+        metrics.record(mock.Mock(spec=[]), 'manila', 'share_list', 0.25)
+        request = RequestFactory().get('/manila_metrics')
+        get_response = mock.Mock()
+        metrics_middleware = middleware.APIMetricsMiddleware(get_response)
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={
+                'api_metrics_path': '/manila_metrics'}):
+            response = metrics_middleware(request)
+
+        get_response.assert_not_called()
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(
+            b'manila_ui_api_call_duration_seconds_count{service="manila",'
+            b'function="share_list"} 1', response.content)
+
+    def test_prometheus_endpoint_disabled(self):
+        request = RequestFactory().get('/manila_metrics')
+        get_response = mock.Mock(return_value=http.HttpResponseNotFound())
+        metrics_middleware = middleware.APIMetricsMiddleware(get_response)
+
+        response = metrics_middleware(request)
+
+        get_response.assert_called_once_with(request)
+        self.assertEqual(404, response.status_code)
+
+    def test_prometheus_endpoint_remote_client(self):
+        request = RequestFactory().get(
+            '/manila_metrics', REMOTE_ADDR='203.0.113.5')
+        get_response = mock.Mock()
+        metrics_middleware = middleware.APIMetricsMiddleware(get_response)
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={
+                'api_metrics_path': '/manila_metrics'}):
+            response = metrics_middleware(request)
+
+        get_response.assert_not_called()
+        self.assertEqual(403, response.status_code)
+        self.assertNotIn(b'manila_ui_api_call', response.content)
+
+    def test_prometheus_endpoint_allowed_network(self):
+        request = RequestFactory().get(
+            '/manila_metrics', REMOTE_ADDR='203.0.113.5')
+        get_response = mock.Mock()
+        metrics_middleware = middleware.APIMetricsMiddleware(get_response)
+
+        with self.settings(OPENSTACK_MANILA_FEATURES={
+                'api_metrics_path': '/manila_metrics',
+                'api_metrics_allowed_networks': ['203.0.113.0/24']}):
+            response = metrics_middleware(request)
+
+        get_response.assert_not_called()
+        self.assertEqual(200, response.status_code)